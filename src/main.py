@@ -13,6 +13,7 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +21,8 @@ from dotenv import load_dotenv
 
 from utils.bundle_zip import default_bundle_root_for_descriptor
 from utils.core import ERC7730Analyzer
+from utils.core.detection_cache import DETECTION_CACHE_ENV
+from utils.disk_cache import CACHE_DIR_ENV
 from utils.reporting.reporter import generate_criticals_report, generate_summary_file, save_json_results
 
 # Load environment variables
@@ -52,6 +55,7 @@ Environment Variables (can also be set in .env file):
   INFURA_RPC_KEY           Optional Infura key fallback used for mainnet state-check tools
   LLM_MODEL                LLM model name (default: gpt-5.4-nano)
   LLM_REASONING_EFFORT     Reasoning effort: low, medium, high (default: low)
+  ERC7730_CACHE_DIR        On-disk cache directory, or 0 to disable caching (default: ~/.cache/erc7730-analyzer)
   ENABLE_SCREENSHOTS       Enable Ledger device screenshot capture (default: false)
   CS_TESTER_DEVICE         Device model for screenshots: stax or flex (default: stax)
   CS_TESTER_ROOT           Path to pre-built device-sdk-ts repo root
@@ -165,6 +169,12 @@ Priority: Command-line arguments > Environment variables > Defaults
         default=os.getenv("COIN_APPS_PATH"),
         help="Legacy fallback path with Ledger app ELF files (env: COIN_APPS_PATH, optional)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Bypass the on-disk caches (ABIs, sources, receipts, audit reports), e.g. for regression runs",
+    )
     parser.add_argument(
         "--debug", action="store_true", default=False, help="Enable debug mode to log to file (default: False)"
     )
@@ -196,8 +206,14 @@ Priority: Command-line arguments > Environment variables > Defaults
     if not args.api_key:
         parser.error("--api-key is required (or set ETHERSCAN_API_KEY environment variable)")
 
-    # Initialize analyzer
-    analyzer = ERC7730Analyzer(
+    if args.no_cache:
+        # Every on-disk cache resolves its location when it is opened, so this covers the whole run;
+        # the detection cache has its own override, which must not survive --no-cache
+        os.environ[CACHE_DIR_ENV] = "0"
+        os.environ[DETECTION_CACHE_ENV] = "0"
+
+    # Initialize analyzer and run analysis
+    with ERC7730Analyzer(
         etherscan_api_key=args.api_key,
         coredao_api_key=args.coredao_api_key,
         lookback_days=args.lookback_days,
@@ -212,16 +228,14 @@ Priority: Command-line arguments > Environment variables > Defaults
         screenshot_device=args.screenshot_device,
         cs_tester_root=args.cs_tester_root,
         coin_apps_path=args.coin_apps_path,
-    )
-
-    # Run analysis
-    results = analyzer.analyze(
-        args.erc7730_file,
-        args.abi,
-        args.raw_txs,
-        args.prepared_inputs,
-        include_root=default_bundle_root_for_descriptor(args.erc7730_file),
-    )
+    ) as analyzer:
+        results = analyzer.analyze(
+            args.erc7730_file,
+            args.abi,
+            args.raw_txs,
+            args.prepared_inputs,
+            include_root=default_bundle_root_for_descriptor(args.erc7730_file),
+        )
 
     # Check if analysis failed
     if not results or not isinstance(results, dict):
@@ -264,20 +278,22 @@ Priority: Command-line arguments > Environment variables > Defaults
 
     context_id = protocol_name.replace(" ", "_") if protocol_name else "unknown"
 
-    # Generate full report file
     summary_file = output_dir / f"FULL_REPORT_{context_id}_{timestamp}.md"
-    logger.info(f"Generating full report file at {summary_file}")
-    generate_summary_file(results, summary_file, inline_base64=True)
-
-    # Generate critical issues mini report
     criticals_file = output_dir / f"CRITICALS_{context_id}_{timestamp}.md"
-    logger.info(f"Generating critical issues report at {criticals_file}")
-    generate_criticals_report(results, criticals_file, inline_base64=True)
-
-    # Save JSON results
     json_output = output_dir / f"results_{context_id}_{timestamp}.json"
+    logger.info(f"Generating full report file at {summary_file}")
+    logger.info(f"Generating critical issues report at {criticals_file}")
     logger.info(f"Saving JSON results to {json_output}")
-    save_json_results(results, json_output)
+
+    # The three artifacts only read `results` and each goes to its own file, so write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        report_futures = [
+            executor.submit(generate_summary_file, results, summary_file, inline_base64=True),
+            executor.submit(generate_criticals_report, results, criticals_file, inline_base64=True),
+            executor.submit(save_json_results, results, json_output),
+        ]
+        for future in report_futures:
+            future.result()
 
     logger.info(f"\n{'=' * 60}")
     logger.info("Analysis complete!")
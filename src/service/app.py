@@ -393,7 +393,7 @@ async def _execute_analysis(
             def _or(request_val, server_val):
                 return request_val if request_val is not None else server_val
 
-            analyzer = ERC7730Analyzer(
+            with ERC7730Analyzer(
                 etherscan_api_key=cfg.etherscan_api_key,
                 coredao_api_key=cfg.coredao_api_key,
                 lookback_days=_or(overrides.lookback_days, cfg.lookback_days),
@@ -409,25 +409,24 @@ async def _execute_analysis(
                 cs_tester_root=cfg.cs_tester_root,
                 coin_apps_path=cfg.coin_apps_path,
                 progress_callback=_report_progress,
-            )
-
-            utils_logger.setLevel(logging.INFO if job.verbose else logging.WARNING)
-            root_logger.addHandler(handler)
-            try:
-                results = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        analyzer.analyze,
-                        descriptor_path,
-                        abi_path,
-                        None,  # raw_txs
-                        None,  # prepared_inputs
-                        include_root=include_root,
-                        cancel_event=job.cancel_event,
-                    ),
-                    timeout=cfg.analysis_timeout_seconds,
-                )
-            finally:
-                root_logger.removeHandler(handler)
+            ) as analyzer:
+                utils_logger.setLevel(logging.INFO if job.verbose else logging.WARNING)
+                root_logger.addHandler(handler)
+                try:
+                    results = await asyncio.wait_for(
+                        asyncio.to_thread(
+                            analyzer.analyze,
+                            descriptor_path,
+                            abi_path,
+                            None,  # raw_txs
+                            None,  # prepared_inputs
+                            include_root=include_root,
+                            cancel_event=job.cancel_event,
+                        ),
+                        timeout=cfg.analysis_timeout_seconds,
+                    )
+                finally:
+                    root_logger.removeHandler(handler)
 
             if not results or not isinstance(results, dict):
                 job.set_error("Analysis returned no results")
@@ -43,14 +43,10 @@ class AnalysisJobLostError(RuntimeError):
     """Raised when a job disappears after it already started running."""
 
 
-def _use_bundle_mode(descriptor_path: Path, bundle_root: Path | None) -> bool:
+def _use_bundle_mode(descriptor: Any, bundle_root: Path | None) -> bool:
     if bundle_root is not None:
         return True
-    try:
-        data = json.loads(descriptor_path.read_text(encoding="utf-8"))
-    except Exception:
-        return False
-    return isinstance(data, dict) and "includes" in data
+    return isinstance(descriptor, dict) and "includes" in descriptor
 
 
 def _build_bundle_fields(descriptor_path: Path, bundle_root: Path | None) -> dict[str, Any]:
@@ -130,10 +126,12 @@ def start_analysis(
     """``POST /analyze`` — start an analysis and return the initial status."""
     abi = json.loads(abi_path.read_text()) if abi_path else None
 
-    if _use_bundle_mode(descriptor_path, bundle_root):
+    # Parse the descriptor once: it decides the upload mode and, without includes, is the payload itself.
+    # An explicit bundle root always means bundle mode, where the zip builder reads the files instead.
+    descriptor = None if bundle_root is not None else json.loads(descriptor_path.read_text(encoding="utf-8"))
+    if _use_bundle_mode(descriptor, bundle_root):
         payload = _build_bundle_fields(descriptor_path, bundle_root)
     else:
-        descriptor = json.loads(descriptor_path.read_text(encoding="utf-8"))
         payload = {
             "descriptor": descriptor,
             "descriptor_filename": descriptor_path.name,
@@ -4,16 +4,12 @@ ABI handling for ERC-7730 analyzer.
 This module provides ABI parsing and function selector utilities.
 """
 
-import json
 from typing import Any
 
 import requests
-from eth_utils.abi import (
-    abi_to_signature,
-    function_abi_to_4byte_selector,
-    function_signature_to_4byte_selector,
-)
+from eth_utils.abi import abi_to_signature
 
+from .. import fast_json
 from ..extraction.source_code.shared import BLOCKSCOUT_URLS
 from ..rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
@@ -23,6 +19,7 @@ from ..rpc_helpers import (
     mark_etherscan_proxy_eth_call_unsupported,
     rpc_eth_call,
 )
+from ..selectors import SELECTOR_RE, signature_selector
 
 
 class ABI:
@@ -41,6 +38,7 @@ class ABI:
         self.abi = abi
         self._functions_by_selector: dict[str, dict[str, Any]] = {}
         self._functions_by_signature_key: dict[str, dict[str, Any]] = {}
+        self._function_entries_by_selector: dict[str, dict[str, Any]] = {}
         self._build_function_indexes()
 
     @staticmethod
@@ -54,7 +52,8 @@ class ABI:
         Returns:
             Function selector as hex string (e.g., "0xa9059cbb")
         """
-        return "0x" + function_signature_to_4byte_selector(signature).hex()
+        # Like eth_utils' function_signature_to_4byte_selector, ignore spaces in the signature
+        return signature_selector(signature.replace(" ", ""))
 
     @staticmethod
     def _normalize_signature_lookup(signature: str) -> str:
@@ -120,6 +119,7 @@ class ABI:
     def _build_function_indexes(self) -> None:
         self._functions_by_selector = {}
         self._functions_by_signature_key = {}
+        self._function_entries_by_selector = {}
 
         for item in self.abi:
             if item.get("type") != "function":
@@ -127,7 +127,7 @@ class ABI:
 
             try:
                 canonical_signature = abi_to_signature(item)
-                selector = "0x" + function_abi_to_4byte_selector(item).hex()
+                selector = signature_selector(canonical_signature)
             except Exception:
                 continue
 
@@ -163,6 +163,7 @@ class ABI:
                 "stateMutability": item.get("stateMutability", "nonpayable"),
             }
             self._functions_by_selector[selector.lower()] = metadata
+            self._function_entries_by_selector[selector.lower()] = item
 
             aliases = {
                 canonical_signature,
@@ -216,6 +217,19 @@ class ABI:
         """
         return self._functions_by_selector.get(selector.lower(), {})
 
+    def find_function_abi_entry(self, function_data: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Return the raw ABI entry described by ``function_data`` (as returned by the finders).
+
+        Entries are indexed by selector when the ABI is loaded, so decoding every sample
+        transaction no longer rescans the ABI; the canonical signature must still match.
+        """
+        item = self._function_entries_by_selector.get(str(function_data.get("selector") or "").lower())
+        if item is None:
+            return None
+        metadata = self._functions_by_selector[function_data["selector"].lower()]
+        return item if metadata["signature"] == function_data.get("signature") else None
+
     def find_function_by_signature(self, signature: str) -> dict:
         """
         Find a function using any ABI-derived signature alias.
@@ -228,14 +242,16 @@ class ABI:
         if not signature:
             return {}
 
-        if signature.startswith("0x") and len(signature) == 10:
+        if SELECTOR_RE.fullmatch(signature):
             return self.find_function_by_selector(signature)
 
         normalized_signature = self._normalize_signature_lookup(signature)
         return self._functions_by_signature_key.get(normalized_signature, {})
 
 
-def detect_diamond_proxy(contract_address: str, chain_id: int, etherscan_api_key: str) -> list[str] | None:
+def detect_diamond_proxy(
+    contract_address: str, chain_id: int, etherscan_api_key: str, *, session: requests.Session | None = None
+) -> list[str] | None:
     """
     Detect if contract is a Diamond proxy (EIP-2535) and return all facet addresses.
 
@@ -245,6 +261,7 @@ def detect_diamond_proxy(contract_address: str, chain_id: int, etherscan_api_key
         contract_address: Contract address
         chain_id: Chain ID
         etherscan_api_key: Etherscan API key
+        session: Shared HTTP session to pool connections (plain requests calls when omitted)
 
     Returns:
         List of facet addresses if Diamond proxy, None otherwise
@@ -277,7 +294,7 @@ def detect_diamond_proxy(contract_address: str, chain_id: int, etherscan_api_key
             )
         else:
             try:
-                response = requests.get(base_url, params=params, timeout=10)
+                response = (session or requests).get(base_url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -293,7 +310,9 @@ def detect_diamond_proxy(contract_address: str, chain_id: int, etherscan_api_key
 
         if result is None:
             logger.info("Trying direct RPC fallback for facets() on chain %s...", chain_id)
-            rpc_result, rpc_error, rpc_url = rpc_eth_call(chain_id, contract_address, facets_selector, timeout=10)
+            rpc_result, rpc_error, rpc_url = rpc_eth_call(
+                chain_id, contract_address, facets_selector, timeout=10, session=session
+            )
             if rpc_error:
                 logger.warning("facets() RPC fallback (%s): %s", rpc_url or "no rpc url", rpc_error)
                 logger.debug(
@@ -365,7 +384,9 @@ def detect_diamond_proxy(contract_address: str, chain_id: int, etherscan_api_key
         return None
 
 
-def detect_proxy_implementation(contract_address: str, chain_id: int, etherscan_api_key: str) -> str | None:
+def detect_proxy_implementation(
+    contract_address: str, chain_id: int, etherscan_api_key: str, *, session: requests.Session | None = None
+) -> str | None:
     """
     Detect if contract is a simple proxy and return implementation address.
 
@@ -379,6 +400,7 @@ def detect_proxy_implementation(contract_address: str, chain_id: int, etherscan_
         contract_address: Contract address
         chain_id: Chain ID
         etherscan_api_key: Etherscan API key
+        session: Shared HTTP session to pool connections (plain requests calls when omitted)
 
     Returns:
         Implementation address or None
@@ -403,7 +425,7 @@ def detect_proxy_implementation(contract_address: str, chain_id: int, etherscan_
                 "apikey": etherscan_api_key,
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
+            response = (session or requests).get(base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -430,8 +452,9 @@ def detect_proxy_implementation(contract_address: str, chain_id: int, etherscan_
                 "apikey": etherscan_api_key,
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
-            data = response.json()
+            response = (session or requests).get(base_url, params=params, timeout=10)
+            # getsourcecode responses embed the full verified source, so parse them with fast_json
+            data = fast_json.loads(response.content)
 
             if etherscan_response_indicates_chain_unsupported(data):
                 mark_etherscan_contract_endpoint_unsupported(chain_id)
@@ -451,7 +474,7 @@ def detect_proxy_implementation(contract_address: str, chain_id: int, etherscan_
         if chain_id in BLOCKSCOUT_URLS and chain_id != 1116:
             try:
                 url = f"{BLOCKSCOUT_URLS[chain_id]}/api/v2/smart-contracts/{contract_address}"
-                response = requests.get(url, timeout=10)
+                response = (session or requests).get(url, timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 implementations = data.get("implementations") or []
@@ -477,6 +500,8 @@ def fetch_single_contract_abi(
     contract_address: str,
     chain_id: int,
     etherscan_api_key: str,
+    *,
+    session: requests.Session | None = None,
 ) -> list[dict[str, Any]] | None:
     """Fetch one address ABI via Etherscan, with Blockscout fallback on unsupported chains."""
     import logging
@@ -484,25 +509,27 @@ def fetch_single_contract_abi(
     logger = logging.getLogger(__name__)
 
     if is_etherscan_contract_endpoint_unsupported(chain_id):
-        return fetch_contract_abi_from_blockscout(contract_address, chain_id)
+        return fetch_contract_abi_from_blockscout(contract_address, chain_id, session=session)
 
     params = {"module": "contract", "action": "getabi", "address": contract_address, "apikey": etherscan_api_key}
     base_url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = (session or requests).get(base_url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        # The ABI arrives JSON-encoded inside the envelope; parse both layers with fast_json from bytes
+        data = fast_json.loads(response.content)
     except Exception as exc:
         logger.error(f"Exception fetching ABI: {exc}")
         return None
 
     if etherscan_response_indicates_chain_unsupported(data):
         mark_etherscan_contract_endpoint_unsupported(chain_id)
-        return fetch_contract_abi_from_blockscout(contract_address, chain_id)
+        return fetch_contract_abi_from_blockscout(contract_address, chain_id, session=session)
 
     if data.get("status") == "1":
         try:
-            abi = json.loads(data["result"])
+            # Etherscan returns the ABI as a JSON string inside the JSON response
+            abi = fast_json.loads(data["result"])
         except Exception as exc:
             logger.warning("Failed to parse ABI JSON for %s on chain %s: %s", contract_address, chain_id, exc)
             return None
@@ -513,7 +540,9 @@ def fetch_single_contract_abi(
     return None
 
 
-def fetch_contract_abi_from_blockscout(contract_address: str, chain_id: int) -> list[dict[str, Any]] | None:
+def fetch_contract_abi_from_blockscout(
+    contract_address: str, chain_id: int, *, session: requests.Session | None = None
+) -> list[dict[str, Any]] | None:
     """Fetch one address ABI from Blockscout's smart-contracts API when available."""
     import logging
 
@@ -524,9 +553,10 @@ def fetch_contract_abi_from_blockscout(contract_address: str, chain_id: int) ->
 
     url = f"{BLOCKSCOUT_URLS[chain_id]}/api/v2/smart-contracts/{contract_address}"
     try:
-        response = requests.get(url, timeout=10)
+        response = (session or requests).get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        # The smart-contract payload also carries the full verified source, so skip requests' text decode
+        data = fast_json.loads(response.content)
     except Exception as exc:
         logger.debug("Blockscout ABI fetch failed for %s on chain %s: %s", contract_address, chain_id, exc)
         return None
@@ -537,7 +567,7 @@ def fetch_contract_abi_from_blockscout(contract_address: str, chain_id: int) ->
         return abi
     if isinstance(abi, str) and abi.strip():
         try:
-            parsed = json.loads(abi)
+            parsed = fast_json.loads(abi)
         except Exception as exc:
             logger.warning(
                 "Failed to parse Blockscout ABI JSON for %s on chain %s: %s", contract_address, chain_id, exc
@@ -552,7 +582,7 @@ def fetch_contract_abi_from_blockscout(contract_address: str, chain_id: int) ->
 
 
 def fetch_contract_abi(
-    contract_address: str, chain_id: int, etherscan_api_key: str
+    contract_address: str, chain_id: int, etherscan_api_key: str, *, session: requests.Session | None = None
 ) -> tuple[list[dict] | None, dict, bool]:
     """
     Fetch contract ABI from Etherscan with proxy detection.
@@ -566,6 +596,7 @@ def fetch_contract_abi(
         contract_address: Ethereum contract address
         chain_id: Chain ID for the contract
         etherscan_api_key: Etherscan API key
+        session: Shared HTTP session; it is reused for every proxy, facet and ABI request
 
     Returns:
         Tuple of:
@@ -580,7 +611,7 @@ def fetch_contract_abi(
     logger = logging.getLogger(__name__)
 
     # First, check if this is a Diamond proxy
-    facet_addresses = detect_diamond_proxy(contract_address, chain_id, etherscan_api_key)
+    facet_addresses = detect_diamond_proxy(contract_address, chain_id, etherscan_api_key, session=session)
 
     if facet_addresses:
         # Diamond proxy: fetch and merge ABIs from all facets
@@ -594,7 +625,7 @@ def fetch_contract_abi(
         for i, facet_address in enumerate(facet_addresses, 1):
             logger.info(f"  [{i}/{len(facet_addresses)}] Fetching ABI for facet {facet_address}...")
             try:
-                facet_abi = fetch_single_contract_abi(facet_address, chain_id, etherscan_api_key)
+                facet_abi = fetch_single_contract_abi(facet_address, chain_id, etherscan_api_key, session=session)
                 if facet_abi:
                     # Pass facet_address to track selector -> facet mapping
                     stats = merger.add_abi(facet_abi, chain_id, source_address=facet_address, source_kind="facet")
@@ -632,7 +663,7 @@ def fetch_contract_abi(
         return merged_abi, selector_sources, True
 
     # Not a Diamond proxy - check for simple proxy
-    impl_address = detect_proxy_implementation(contract_address, chain_id, etherscan_api_key)
+    impl_address = detect_proxy_implementation(contract_address, chain_id, etherscan_api_key, session=session)
 
     if impl_address:
         logger.info(f"Detected simple proxy, fetching ABI for implementation: {impl_address}")
@@ -641,7 +672,7 @@ def fetch_contract_abi(
         address_to_fetch = contract_address
 
     try:
-        abi = fetch_single_contract_abi(address_to_fetch, chain_id, etherscan_api_key)
+        abi = fetch_single_contract_abi(address_to_fetch, chain_id, etherscan_api_key, session=session)
         if abi:
             # Return tuple: (abi, selector_sources, is_diamond)
             return abi, {}, False
@@ -7,8 +7,11 @@ keeping all unique functions while avoiding duplicates.
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import Executor
 from contextlib import suppress
 
+from ..selectors import signature_selector
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,9 +28,7 @@ class ABIMerger:
 
     def _compute_selector(self, signature: str) -> str:
         """Compute 4-byte function selector from signature."""
-        from eth_utils import keccak
-
-        return "0x" + keccak(text=signature).hex()[:8]
+        return signature_selector(signature)
 
     def _get_function_signature(self, func: dict) -> str | None:
         """
@@ -269,6 +270,7 @@ def merge_abis_from_deployments(
     deployments: list[dict],
     fetch_abi_func: Callable[[str, int, str], tuple[list[dict] | None, dict, bool]],
     api_key: str,
+    executor: Executor | None = None,
 ) -> tuple[list[dict] | None, dict, dict]:
     """
     Fetch and merge ABIs from multiple chain deployments.
@@ -277,6 +279,8 @@ def merge_abis_from_deployments(
         deployments: List of deployment dicts with chainId and address
         fetch_abi_func: Function to fetch ABI (contract_address, chain_id, api_key) -> (abi, selector_sources, is_diamond)
         api_key: API key for blockchain explorers
+        executor: Optional executor to fetch all deployments concurrently; results are still
+            merged in deployment order so the merged ABI does not depend on response timing
 
     Returns:
         (merged_abi, fetch_results, selector_sources)
@@ -293,14 +297,20 @@ def merge_abis_from_deployments(
 
     logger.info(f"Fetching ABIs from {len(deployments)} chain(s)...")
 
-    for deployment in deployments:
+    pending = (
+        [executor.submit(fetch_abi_func, d["address"], d["chainId"], api_key) for d in deployments]
+        if executor
+        else None
+    )
+
+    for index, deployment in enumerate(deployments):
         chain_id = deployment["chainId"]
         address = deployment["address"]
 
         logger.info(f"Fetching ABI from chain {chain_id} for address {address[:10]}...")
 
         try:
-            result = fetch_abi_func(address, chain_id, api_key)
+            result = pending[index].result() if pending else fetch_abi_func(address, chain_id, api_key)
 
             # Handle new tuple return: (abi, selector_sources, is_diamond)
             dep_selector_sources = {}
@@ -2,6 +2,7 @@
 
 from .agentic import generate_multi_agent_audit_async, record_completed_analysis
 from .batch import (
+    AuditTaskStream,
     generate_clear_signing_audit_async,
     generate_clear_signing_audits_batch,
     generate_clear_signing_audits_batch_async,
@@ -54,6 +55,7 @@ __all__ = [
     "AuditReport",
     "AuditResult",
     "AuditTask",
+    "AuditTaskStream",
     "CodeSnippet",
     "CoverageScore",
     "CriticalIssue",
@@ -15,13 +15,15 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from eth_utils import keccak
-from web3 import Web3
+from eth_utils import to_checksum_address
 
+from .. import fast_json
 from ..abi import ABI
 from ..extraction.source_code import RPC_URLS
 from ..reporting.reporter.expansion import expand_erc7730_format_with_refs
 from ..reporting.reporter.formatting import format_source_code_section
+from ..selectors import signature_selector
+from .concurrency import is_retryable_error, record_call_outcome, retry_delay
 from .models import (
     AuditReport,
     AuditResult,
@@ -35,6 +37,7 @@ from .rules import SCREENSHOT_INSTRUCTIONS, SYSTEM_INSTRUCTIONS
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
     from pydantic import BaseModel
+    from web3 import Web3
 
 logger = logging.getLogger(__name__)
 
@@ -463,6 +466,9 @@ class AnvilForkManager:
 
     @classmethod
     def get_web3(cls, chain_id: int, block_number: int | None) -> _ForkHandle:
+        # web3 is slow to import and only needed once a tool actually reads chain state
+        from web3 import Web3
+
         cls._register_cleanup()
         key = (chain_id, block_number)
         if key in cls._forks:
@@ -542,8 +548,9 @@ class SelectorToolRunner:
     def __init__(self, task: AuditTask) -> None:
         self.task = task
         self.tool_context = task.tool_context or {}
+        # Reuse the analyzer's indexed ABI; rebuilding it per selector re-derives every signature
         abi = self.tool_context.get("abi")
-        self.abi_helper = ABI(abi) if isinstance(abi, list) and abi else None
+        self.abi_helper = self.tool_context.get("abi_helper") or (ABI(abi) if isinstance(abi, list) and abi else None)
 
     _NETWORK_TOOLS = frozenset(
         {
@@ -789,7 +796,12 @@ class SelectorToolRunner:
         if not selector_format:
             return {"error": f"No descriptor found for {selector_or_signature}."}
 
-        expanded = expand_erc7730_format_with_refs(selector_format, erc7730_data, format_key)
+        expanded_formats = self.tool_context.get("expanded_formats")
+        expanded = expanded_formats.get(format_key) if expanded_formats is not None else None
+        if expanded is None:
+            expanded = expand_erc7730_format_with_refs(selector_format, erc7730_data, format_key)
+            if expanded_formats is not None:
+                expanded_formats[format_key] = expanded
         return {
             "selector_lookup": selector_or_signature,
             "format_key": format_key,
@@ -834,7 +846,7 @@ class SelectorToolRunner:
         storage_lookup: dict[str, Any] | None = None
 
         if target_address:
-            resolved_target_address = Web3.to_checksum_address(str(target_address))
+            resolved_target_address = to_checksum_address(str(target_address))
         else:
             slot_raw = arguments.get("storage_slot")
             if slot_raw is None:
@@ -863,7 +875,7 @@ class SelectorToolRunner:
                     ),
                     "storage_lookup": storage_lookup,
                 }
-            resolved_target_address = Web3.to_checksum_address(address_candidate)
+            resolved_target_address = to_checksum_address(address_candidate)
 
         max_lines = max(80, min(int(arguments.get("max_lines", 500)), 1200))
         selector = arguments.get("selector")
@@ -921,7 +933,7 @@ class SelectorToolRunner:
 
     def _anvil_read_storage(self, arguments: dict[str, Any]) -> dict[str, Any]:
         chain_id = int(arguments["chain_id"])
-        address = Web3.to_checksum_address(arguments["address"])
+        address = to_checksum_address(arguments["address"])
         slot_raw = arguments["slot"]
         if isinstance(slot_raw, str) and slot_raw.startswith("0x"):
             slot = int(slot_raw, 16)
@@ -955,9 +967,9 @@ class SelectorToolRunner:
         from eth_abi import encode as abi_encode
 
         chain_id = int(arguments["chain_id"])
-        address = Web3.to_checksum_address(arguments["address"])
+        address = to_checksum_address(arguments["address"])
         function_signature = _canonical_signature(str(arguments["function_signature"]))
-        function_selector = "0x" + keccak(text=function_signature).hex()[:8]
+        function_selector = signature_selector(function_signature)
         input_types = _split_signature_types(function_signature)
         args = arguments.get("args", [])
         if len(args) != len(input_types):
@@ -971,7 +983,7 @@ class SelectorToolRunner:
         handle = AnvilForkManager.get_web3(chain_id, block_number)
         call_params: dict[str, Any] = {"to": address, "data": calldata}
         if arguments.get("from_address"):
-            call_params["from"] = Web3.to_checksum_address(arguments["from_address"])
+            call_params["from"] = to_checksum_address(arguments["from_address"])
         if arguments.get("value_wei") is not None:
             call_params["value"] = int(arguments["value_wei"])
 
@@ -1018,12 +1030,7 @@ async def _parse_structured_response(
     model: str = DEFAULT_MODEL,
     reasoning_effort: str = DEFAULT_REASONING_EFFORT,
 ) -> BaseModel:
-    serialized_payload = json.dumps(
-        user_payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
+    serialized_payload = fast_json.dumps_sorted(user_payload)
 
     from .batch import _build_user_content_with_screenshots
 
@@ -1066,6 +1073,7 @@ async def _parse_structured_response(
                     store=False,
                     prompt_cache_key=dynamic_cache_key,
                 )
+            record_call_outcome(semaphore)
 
             usage = getattr(response, "usage", None)
             if usage:
@@ -1091,6 +1099,7 @@ async def _parse_structured_response(
             return response.output_parsed
         except Exception as exc:
             last_error = exc
+            record_call_outcome(semaphore, exc)
             logger.warning(
                 "[AGENTIC][%s][%s] Model call failed on attempt %s/%s: %s",
                 phase,
@@ -1099,8 +1108,10 @@ async def _parse_structured_response(
                 max_retries + 1,
                 exc,
             )
+            if not is_retryable_error(exc):
+                break
             if attempt < max_retries:
-                await asyncio.sleep(min(2**attempt, 8))
+                await asyncio.sleep(retry_delay(exc, attempt, max_delay=8))
 
     raise RuntimeError(f"{phase} parse failed for {selector}: {last_error}")
 
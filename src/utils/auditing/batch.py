@@ -1,15 +1,21 @@
 """Task preparation and concurrent OpenAI audit execution."""
 
 import asyncio
+import atexit
 import base64
-import json
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 
 from openai import AsyncOpenAI
 
+from .. import fast_json
+from ..disk_cache import JsonFileCache
 from .agentic import generate_multi_agent_audit_async, record_completed_analysis
+from .concurrency import AdaptiveSemaphore, is_retryable_error, record_call_outcome, retry_delay
 from .models import AuditReport, AuditResult, AuditTask
 from .rules import SCREENSHOT_INSTRUCTIONS, SYSTEM_INSTRUCTIONS
 
@@ -17,6 +23,10 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = "gpt-5.4-nano"
 DEFAULT_REASONING_EFFORT = "low"
+# Single-pass reports for byte-identical prompts are reused across runs for this long
+AUDIT_RESPONSE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# Bump whenever the structured report schema or its post-processing changes, so stale reports are not reused
+AUDIT_REPORT_SCHEMA_VERSION = 1
 
 
 def _build_user_content_with_screenshots(
@@ -60,6 +70,68 @@ def _build_user_content_with_screenshots(
     return content_blocks
 
 
+def _serialize_audit_payload(audit_payload: dict | None) -> str:
+    """
+    Serialize an audit payload deterministically so identical inputs yield identical prompts.
+
+    Top-level keys keep the order prepare_audit_task lays them out in (most to least stable), so
+    repeat prompts for a selector share the longest possible prefix. Nested objects are key-sorted.
+    """
+    if not audit_payload:
+        return fast_json.dumps_sorted(audit_payload)
+    members = ",".join(
+        f"{fast_json.dumps_sorted(key)}:{fast_json.dumps_sorted(value)}" for key, value in audit_payload.items()
+    )
+    return f"{{{members}}}"
+
+
+# Line accounting from source extraction; the code itself is what the model reads
+_PROMPT_OMITTED_SOURCE_FIELDS = frozenset({"total_lines"})
+
+
+def _prompt_source_code(source_code: dict | None) -> dict:
+    """
+    Return the source-code fields worth sending to the model.
+
+    Every code-bearing field is kept (docstrings, libraries, parents, ...), but empty placeholders
+    such as ``"custom_types": []`` and bookkeeping like ``total_lines`` only cost tokens. The
+    ``truncated`` flag survives only when set, since it tells the model the snippet is partial.
+    """
+    if not source_code:
+        return {}
+    return {
+        key: value
+        for key, value in source_code.items()
+        if key not in _PROMPT_OMITTED_SOURCE_FIELDS and value is not False and value not in (None, "", [], {})
+    }
+
+
+# Transaction samples and per-sample decoded events sent to the model; the full lists stay on the task
+MAX_PROMPT_TX_SAMPLES = 20
+MAX_PROMPT_RECEIPT_LOGS = 20
+
+
+def _prompt_transaction(tx: dict) -> dict:
+    """
+    Return a transaction sample as sent to the model.
+
+    The timestamp says nothing about how the descriptor renders the call, so it is dropped. The
+    block stays because multi-agent state checks can be pinned to it. Very chatty receipts keep
+    their first events plus a count of the rest.
+    """
+    slim = {key: value for key, value in tx.items() if key != "timestamp"}
+    logs = slim.get("receipt_logs")
+    if logs and len(logs) > MAX_PROMPT_RECEIPT_LOGS:
+        slim["receipt_logs"] = logs[:MAX_PROMPT_RECEIPT_LOGS]
+        slim["receipt_logs_omitted"] = len(logs) - MAX_PROMPT_RECEIPT_LOGS
+    return slim
+
+
+def _audit_payload_digest(payload_json: str) -> str:
+    """Return a short digest identifying a serialized audit payload."""
+    return hashlib.blake2b(payload_json.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def prepare_audit_task(
     selector: str,
     decoded_transactions: list[dict],
@@ -103,14 +175,15 @@ def prepare_audit_task(
     """
     # Build minimal payload with ONLY dynamic data
     # Static rules (validation_rules, critical_issues, etc.) are in SYSTEM_INSTRUCTIONS
-    # NOTE: We include ALL source code fields (docstrings, libraries, parent_functions, etc.)
+    # NOTE: We include ALL code-bearing source fields (docstrings, libraries, parent_functions, etc.)
     # because they provide critical context for accurate analysis
+    # Keys are ordered by how often they change between runs so OpenAI's prefix cache can reuse
+    # everything up to the sampled transactions, which differ on nearly every run
     audit_payload = {
         "function_signature": function_signature,
         "selector": selector,
         "erc7730_format": erc7730_format,
-        "decoded_transactions": decoded_transactions if decoded_transactions else [],  # Empty list if no txs
-        "source_code": source_code if source_code else {},  # Include ALL source code fields
+        "source_code": _prompt_source_code(source_code),  # Every code-bearing source field
         "descriptor_context": descriptor_context if descriptor_context else {},
         "abi_resolution": abi_resolution if abi_resolution else {},
         "source_resolution": source_resolution if source_resolution else {},
@@ -121,6 +194,18 @@ def prepare_audit_task(
     # Add protocol_name only if it exists (optional field)
     if protocol_name:
         audit_payload["protocol_name"] = protocol_name
+    audit_payload["decoded_transactions"] = [
+        _prompt_transaction(tx) for tx in (decoded_transactions or [])[:MAX_PROMPT_TX_SAMPLES]
+    ]  # Empty list if no txs
+
+    # The multi-agent path wraps the payload in per-phase packets and serializes those instead
+    audit_payload_json = audit_payload_hash = None
+    if analysis_mode != "multi":
+        audit_payload_json = _serialize_audit_payload(audit_payload)
+        audit_payload_hash = _audit_payload_digest(audit_payload_json)
+        logger.debug(
+            "Prepared audit payload for %s: %d chars, hash %s", selector, len(audit_payload_json), audit_payload_hash
+        )
 
     return AuditTask(
         selector=selector,
@@ -136,6 +221,8 @@ def prepare_audit_task(
         source_resolution=source_resolution,
         analysis_mode=analysis_mode,
         audit_payload=audit_payload,
+        audit_payload_json=audit_payload_json,
+        audit_payload_hash=audit_payload_hash,
         optimization_note=None,
         tool_context=tool_context,
         screenshot_data=screenshot_data,
@@ -144,6 +231,21 @@ def prepare_audit_task(
     )
 
 
+def _audit_response_cache_key(task: AuditTask) -> str | None:
+    """
+    Return the response-cache key for a single-pass task, or None when it must not be cached.
+
+    The key covers everything sent to the model (model, effort, system instructions and payload)
+    plus the report schema version. Screenshot prompts attach images that the payload does not describe, so they always go out.
+    """
+    if task.screenshot_data:
+        return None
+    model = task.llm_model or DEFAULT_MODEL
+    effort = task.llm_reasoning_effort or DEFAULT_REASONING_EFFORT
+    parts = (str(AUDIT_REPORT_SCHEMA_VERSION), model, effort, SYSTEM_INSTRUCTIONS, task.audit_payload_json or "")
+    return _audit_payload_digest("\n".join(parts))
+
+
 async def generate_clear_signing_audit_async(
     task: AuditTask, client: AsyncOpenAI, semaphore: asyncio.Semaphore, max_retries: int = 3
 ) -> AuditResult:
@@ -160,6 +262,31 @@ async def generate_clear_signing_audit_async(
     Returns:
         AuditResult with the API response or error
     """
+    if task.audit_payload_json is None:
+        task.audit_payload_json = _serialize_audit_payload(task.audit_payload)
+        task.audit_payload_hash = _audit_payload_digest(task.audit_payload_json)
+
+    from ..reporting.markdown_formatter import format_audit_reports
+
+    # Identical prompts (e.g. untouched selectors while iterating on a descriptor) reuse the last report;
+    # only the structured data is stored, so markdown formatting changes apply to cached reports too
+    response_cache = JsonFileCache("audits", ttl_seconds=AUDIT_RESPONSE_CACHE_TTL_SECONDS)
+    response_cache_key = _audit_response_cache_key(task)
+    cached = response_cache.get(response_cache_key) if response_cache_key else None
+    if cached is not None:
+        logger.info(f"[SINGLE] Reusing cached audit for {task.selector} (payload {task.audit_payload_hash})")
+        report_data = cached["report_data"]
+        critical_report, detailed_report = format_audit_reports(report_data)
+        record_completed_analysis(task, report_data)
+        return AuditResult(
+            selector=task.selector,
+            function_signature=task.function_signature,
+            critical_report=critical_report,
+            detailed_report=detailed_report,
+            report_data=report_data,
+            success=True,
+        )
+
     async with semaphore:
         last_error = None
 
@@ -171,7 +298,7 @@ async def generate_clear_signing_audit_async(
                 else:
                     logger.info(f"[SINGLE] Retry {attempt}/{max_retries} for selector {task.selector}")
 
-                user_payload = json.dumps(task.audit_payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+                user_payload = task.audit_payload_json
 
                 has_screenshots = bool(task.screenshot_data)
                 user_content = _build_user_content_with_screenshots(
@@ -196,6 +323,7 @@ async def generate_clear_signing_audit_async(
                     store=False,
                     prompt_cache_key=cache_key,
                 )
+                record_call_outcome(semaphore)
 
                 # Log successful response with usage stats
                 logger.debug(f"[SINGLE] ✅ Received response for {task.selector}")
@@ -237,10 +365,10 @@ async def generate_clear_signing_audit_async(
                             sample["decoded_parameters"] = matching_tx.get("decoded_input", {})
 
                 # Format using markdown_formatter
-                from ..reporting.markdown_formatter import format_audit_reports
-
                 critical_report, detailed_report = format_audit_reports(report_data)
                 record_completed_analysis(task, report_data)
+                if response_cache_key:
+                    response_cache.put(response_cache_key, {"report_data": report_data})
 
                 return AuditResult(
                     selector=task.selector,
@@ -254,6 +382,7 @@ async def generate_clear_signing_audit_async(
             except Exception as e:
                 last_error = e
                 error_type = type(e).__name__
+                record_call_outcome(semaphore, e)
 
                 # Detailed error logging
                 logger.error(f"[SINGLE] Attempt {attempt + 1} failed for {task.selector}")
@@ -280,18 +409,22 @@ async def generate_clear_signing_audit_async(
                 if error_type not in ["ConnectionError", "Timeout", "TimeoutError", "APIConnectionError"]:
                     logger.error(f"[SINGLE]   Stack trace:\n{traceback.format_exc()}")
 
-                # If this is not the last attempt, wait before retrying with exponential backoff
+                # Deterministic request errors (bad request, auth, unknown model) fail the same way again
+                if not is_retryable_error(e):
+                    logger.error(f"[SINGLE] ❌ {error_type} is not retryable; giving up on {task.selector}")
+                    break
+                # If this is not the last attempt, wait before retrying with jittered exponential backoff
                 if attempt < max_retries:
-                    wait_time = min(2**attempt, 30)  # Exponential backoff, max 30s
-                    logger.info(f"[SINGLE] Waiting {wait_time}s before retry...")
+                    wait_time = retry_delay(e, attempt, max_delay=30)
+                    logger.info(f"[SINGLE] Waiting {wait_time:.1f}s before retry...")
                     await asyncio.sleep(wait_time)
                 else:
                     # All retries exhausted
                     logger.error(f"[SINGLE] ❌ All {max_retries + 1} attempts failed for {task.selector}")
                     logger.error(f"[SINGLE]   Final error: {error_type} - {e!s}")
 
-        # If we get here, all retries failed
-        error_msg = f"Error generating audit after {max_retries + 1} attempts: {last_error!s}"
+        # If we get here, every attempt failed (or the error was not retryable)
+        error_msg = f"Error generating audit after {attempt + 1} attempt(s): {last_error!s}"
         return AuditResult(
             selector=task.selector,
             function_signature=task.function_signature,
@@ -304,7 +437,7 @@ async def generate_clear_signing_audit_async(
 
 
 async def generate_clear_signing_audits_batch_async(
-    tasks: list[AuditTask], max_concurrent: int = 20, max_retries: int = 3
+    tasks: list[AuditTask], max_concurrent: int = 20, max_retries: int = 3, client: AsyncOpenAI | None = None
 ) -> list[AuditResult]:
     """
     Execute multiple audit API calls concurrently with retry logic.
@@ -313,6 +446,7 @@ async def generate_clear_signing_audits_batch_async(
         tasks: List of pre-prepared AuditTasks
         max_concurrent: Maximum number of concurrent API calls (default: 20)
         max_retries: Maximum number of retry attempts per task (default: 3)
+        client: Client to reuse (left open); by default one is created and closed for this batch
 
     Returns:
         List of AuditResults in the same order as input tasks
@@ -330,32 +464,20 @@ async def generate_clear_signing_audits_batch_async(
     logger.info(f"[BATCH] Max retries per task: {max_retries}")
     logger.info("[BATCH] ═══════════════════════════════════════════════════════")
 
-    # Use async context manager to properly manage client resources
-    async with AsyncOpenAI() as client:
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        # Create coroutines for all tasks
-        coroutines = [_run_task_with_selected_mode(task, client, semaphore, max_retries) for task in tasks]
-
-        # Execute all concurrently and gather results
-        results = await asyncio.gather(*coroutines, return_exceptions=True)
+    semaphore = AdaptiveSemaphore(max_concurrent)
+    if client is None:
+        # Use async context manager to properly manage client resources
+        async with AsyncOpenAI() as owned_client:
+            results = await _gather_audits(tasks, owned_client, semaphore, max_retries)
+    else:
+        results = await _gather_audits(tasks, client, semaphore, max_retries)
 
     # Convert any exceptions to AuditResult with error
     final_results = []
     for i, result in enumerate(results):
         if isinstance(result, Exception):
             logger.error(f"[BATCH] Task {i} raised unexpected exception: {result}")
-            final_results.append(
-                AuditResult(
-                    selector=tasks[i].selector,
-                    function_signature=tasks[i].function_signature,
-                    critical_report=f"Error: {result!s}",
-                    detailed_report=f"Error: {result!s}",
-                    report_data={},
-                    success=False,
-                    error=str(result),
-                )
-            )
+            final_results.append(_error_result(tasks[i], result))
         else:
             final_results.append(result)
 
@@ -383,6 +505,27 @@ async def generate_clear_signing_audits_batch_async(
     return final_results
 
 
+async def _gather_audits(
+    tasks: list[AuditTask], client: AsyncOpenAI, semaphore: AdaptiveSemaphore, max_retries: int
+) -> list[AuditResult | BaseException]:
+    """Run every task concurrently, returning results (or raised exceptions) in task order."""
+    coroutines = [_run_task_with_selected_mode(task, client, semaphore, max_retries) for task in tasks]
+    return await asyncio.gather(*coroutines, return_exceptions=True)
+
+
+def _error_result(task: AuditTask, exc: BaseException) -> AuditResult:
+    """Wrap an exception raised while auditing ``task`` into a failed AuditResult."""
+    return AuditResult(
+        selector=task.selector,
+        function_signature=task.function_signature,
+        critical_report=f"Error: {exc!s}",
+        detailed_report=f"Error: {exc!s}",
+        report_data={},
+        success=False,
+        error=str(exc),
+    )
+
+
 async def _run_task_with_selected_mode(
     task: AuditTask,
     client: AsyncOpenAI,
@@ -425,7 +568,7 @@ def generate_clear_signing_audits_batch(
 ) -> list[AuditResult]:
     """
     Synchronous wrapper for batch processing with retry logic.
-    Runs the async batch function using asyncio.run().
+    Runs the async batch function on the shared audit loop, reusing its OpenAI client.
 
     Args:
         tasks: List of pre-prepared AuditTasks
@@ -435,4 +578,120 @@ def generate_clear_signing_audits_batch(
     Returns:
         List of AuditResults in the same order as input tasks
     """
-    return asyncio.run(generate_clear_signing_audits_batch_async(tasks, max_concurrent, max_retries))
+    loop, client = _shared_audit_runtime()
+    return asyncio.run_coroutine_threadsafe(
+        generate_clear_signing_audits_batch_async(tasks, max_concurrent, max_retries, client=client), loop
+    ).result()
+
+
+# One background event loop and OpenAI client serve every audit run in the process, so repeated runs
+# (e.g. service jobs) keep the client's warm HTTP connections instead of re-handshaking each time.
+# The client's connection pool is bound to the loop it was created on, hence the pair.
+_shared_runtime_lock = threading.Lock()
+_shared_runtime: tuple[asyncio.AbstractEventLoop, threading.Thread, AsyncOpenAI] | None = None
+
+
+async def _new_client() -> AsyncOpenAI:
+    return AsyncOpenAI()
+
+
+def _shared_audit_runtime() -> tuple[asyncio.AbstractEventLoop, AsyncOpenAI]:
+    """Return the process-wide audit loop and client, starting them on first use."""
+    global _shared_runtime
+    with _shared_runtime_lock:
+        if _shared_runtime is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="audit-loop", daemon=True)
+            thread.start()
+            try:
+                client = asyncio.run_coroutine_threadsafe(_new_client(), loop).result()
+            except BaseException:
+                _stop_loop(loop, thread)
+                raise
+            _shared_runtime = (loop, thread, client)
+        return _shared_runtime[0], _shared_runtime[2]
+
+
+def close_shared_audit_runtime() -> None:
+    """Close the shared OpenAI client and stop its loop (registered to run at interpreter exit)."""
+    global _shared_runtime
+    with _shared_runtime_lock:
+        runtime, _shared_runtime = _shared_runtime, None
+    if runtime is None:
+        return
+    loop, thread, client = runtime
+    try:
+        asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=10)
+    except Exception as exc:
+        logger.debug(f"[BATCH] Failed to close the shared OpenAI client: {exc}")
+    finally:
+        _stop_loop(loop, thread)
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+atexit.register(close_shared_audit_runtime)
+
+
+class AuditTaskStream:
+    """
+    Run audit tasks on the shared audit event loop as soon as they are submitted.
+
+    The batch helpers above need every task up front, so the LLM calls only start once all
+    selectors have been prepared. The stream lets the preparation loop hand each task over
+    as soon as it is built; the audit then runs while the next selector's receipts and source
+    are being fetched. Concurrency and retries match ``generate_clear_signing_audits_batch``.
+    """
+
+    def __init__(self, max_concurrent: int = 20, max_retries: int = 3):
+        self.max_retries = max_retries
+        self._tasks: list[AuditTask] = []
+        self._futures: list[Future] = []
+        self._closed = False
+        self._loop, self._client = _shared_audit_runtime()
+        self._semaphore = self._call(self._open(max_concurrent)).result()
+
+    async def _open(self, max_concurrent: int) -> AdaptiveSemaphore:
+        # The semaphore must be created on the loop that will use it
+        return AdaptiveSemaphore(max_concurrent)
+
+    def _call(self, coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def submit(self, task: AuditTask) -> int:
+        """Start auditing ``task`` in the background and return its index in ``results()``."""
+        self._tasks.append(task)
+        self._futures.append(
+            self._call(_run_task_with_selected_mode(task, self._client, self._semaphore, self.max_retries))
+        )
+        return len(self._futures) - 1
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def results(self) -> list[AuditResult]:
+        """Wait for every submitted task and return the results in submission order."""
+        results = []
+        for i, future in enumerate(self._futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                logger.error(f"[BATCH] Task {i} raised unexpected exception: {exc}")
+                results.append(_error_result(self._tasks[i], exc))
+        return results
+
+    def close(self, cancel_pending: bool = False) -> None:
+        """Stop using the stream, optionally cancelling audits that are still running.
+
+        The shared loop and client stay up for later runs; they are closed at interpreter exit.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if cancel_pending:
+            for future in self._futures:
+                future.cancel()
@@ -0,0 +1,113 @@
+"""Concurrency limiting and retry pacing for LLM calls that back off when the provider pushes back."""
+
+import asyncio
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+# Successful calls needed before one more concurrent slot is handed back after a back-off
+ADAPTIVE_INCREASE_AFTER = 5
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True for provider errors that signal too many requests (HTTP 429)."""
+    return getattr(exc, "status_code", None) == 429
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Return False for request errors that would fail identically when resent.
+
+    Client errors (4xx: bad request, authentication, unknown model, ...) are deterministic, except
+    timeouts, conflicts and rate limits. Everything else is worth another attempt: network errors,
+    5xx responses, and structured-output parse failures, since a new sample may parse.
+    """
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int) and 400 <= status < 500:
+        return status in (408, 409, 429)
+    return True
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Return the provider's requested wait from Retry-After(-ms) headers, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass  # HTTP-date values are rare here; fall back to computed backoff
+    return None
+
+
+def retry_delay(exc: BaseException, attempt: int, max_delay: float) -> float:
+    """
+    Seconds to wait before retry ``attempt + 1``.
+
+    A Retry-After from the provider wins. Otherwise full jitter (uniform over the exponential
+    window) keeps concurrent workers from retrying in lockstep.
+    """
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return min(max(retry_after, 0.0), max_delay)
+    return random.uniform(0, min(2**attempt, max_delay))
+
+
+class AdaptiveSemaphore:
+    """
+    Async semaphore whose capacity follows additive-increase / multiplicative-decrease.
+
+    It starts at ``max_concurrent``. Every rate-limit response halves the limit, and every
+    ``increase_after`` successful calls return one slot, up to ``max_concurrent`` again. So
+    the configured concurrency holds while the provider keeps up, and bursts that trip its
+    rate limit shrink on their own. A lower limit never interrupts calls already running.
+    """
+
+    def __init__(self, max_concurrent: int, increase_after: int = ADAPTIVE_INCREASE_AFTER):
+        self.max_concurrent = max(1, max_concurrent)
+        self.limit = self.max_concurrent
+        self._increase_after = max(1, increase_after)
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Count a successful call, re-opening one slot every ``increase_after`` successes."""
+        if self.limit >= self.max_concurrent:
+            return
+        self._successes += 1
+        if self._successes >= self._increase_after:
+            self._successes = 0
+            self.limit += 1
+            logger.debug("[THROTTLE] Raising LLM concurrency to %d", self.limit)
+
+    def record_rate_limit(self) -> None:
+        """Halve the concurrency limit after the provider rejected a call for rate limiting."""
+        self._successes = 0
+        if self.limit > 1:
+            self.limit = max(1, self.limit // 2)
+            logger.warning("[THROTTLE] Rate limited by the LLM provider; lowering concurrency to %d", self.limit)
+
+
+def record_call_outcome(semaphore: object, exc: BaseException | None = None) -> None:
+    """Feed a call's outcome to ``semaphore`` when it adapts to rate limits (plain semaphores ignore it)."""
+    if not isinstance(semaphore, AdaptiveSemaphore):
+        return
+    if exc is None:
+        semaphore.record_success()
+    elif is_rate_limit_error(exc):
+        semaphore.record_rate_limit()
@@ -190,6 +190,10 @@ class AuditTask:
     analysis_mode: str
     # Pre-computed payload (built during preparation)
     audit_payload: dict | None = None
+    # audit_payload serialized once for the single-pass request; retries resend the same bytes
+    audit_payload_json: str | None = None
+    # Short digest of audit_payload_json: equal hashes mean byte-identical prompts
+    audit_payload_hash: str | None = None
     optimization_note: str | None = None
     tool_context: dict[str, Any] | None = None
     # List of {"tx_hash": str, "screenshots": [str, ...]} per transaction
@@ -1,6 +1,6 @@
 """Transaction client package split by execution flow."""
 
-from .constants import BLOCKSCOUT_URLS
+from .constants import APPROVAL_EVENT_TOPIC, BLOCKSCOUT_URLS, TRANSFER_EVENT_TOPIC, TX_HASH_RE
 from .fetcher import TransactionFetcher
 
-__all__ = ["BLOCKSCOUT_URLS", "TransactionFetcher"]
+__all__ = ["APPROVAL_EVENT_TOPIC", "BLOCKSCOUT_URLS", "TRANSFER_EVENT_TOPIC", "TX_HASH_RE", "TransactionFetcher"]
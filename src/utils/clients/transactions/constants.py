@@ -1,5 +1,14 @@
 """Shared API endpoint constants for transaction fetching."""
 
+import re
+
+# A mined transaction hash: 0x followed by 32 bytes of hex
+TX_HASH_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+
+# topic0 of the ERC-20 Transfer(address,address,uint256) and Approval(address,address,uint256) events
+TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+APPROVAL_EVENT_TOPIC = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+
 BLOCKSCOUT_URLS = {
     56: "https://api.bscscan.com/api",  # BNB Smart Chain
     97: "https://api-testnet.bscscan.com/api",  # BNB Testnet
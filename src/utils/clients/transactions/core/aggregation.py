@@ -4,8 +4,6 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import requests
-
 from ....abi import ABI
 from ....extraction.raw_tx_parser import group_transactions_by_selector, load_raw_transactions
 from ....rpc_helpers import is_etherscan_tx_endpoint_unsupported
@@ -139,6 +137,11 @@ class TransactionFetcherCoreAggregationMixin:
 
         # Try the preferred API first, then fallback as needed.
         for api_attempt, use_blockscout in enumerate(api_sequence):
+            if self._stop_requested():
+                logger.info(
+                    "Stopping transaction fetch for %s on chain %s: no longer needed", contract_address, chain_id
+                )
+                break
             # Skip Blockscout attempt if chain doesn't have Blockscout support
             if use_blockscout and chain_id not in BLOCKSCOUT_URLS:
                 continue
@@ -280,7 +283,7 @@ class TransactionFetcherCoreAggregationMixin:
                     }
 
                     base_url = self._get_api_base_url(chain_id, False)
-                    response = requests.get(base_url, params=params, timeout=10)
+                    response = self.session.get(base_url, params=params, timeout=10)
                     response.raise_for_status()
                     data = response.json()
 
@@ -374,15 +377,10 @@ class TransactionFetcherCoreAggregationMixin:
                     logger.warning(f"✗ Failed to decode manual transaction {tx_id}")
                     continue
 
-                # Try to fetch receipt if we have a real tx hash
-                if tx_hash and tx_hash.startswith("0x"):
-                    logger.info(f"Attempting to fetch receipt for manual TX {tx_hash}")
-                    receipt = self.fetch_transaction_receipt(tx_hash, chain_id)
-                    if receipt:
-                        tx_dict["receipt_logs"] = receipt.get("receipt_logs", [])
-                        logger.info(f"✓ Fetched receipt with {len(receipt.get('receipt_logs', []))} logs")
-                else:
-                    logger.debug("No transaction hash provided for manual TX - skipping receipt fetch")
+                # Receipts are not fetched here: audit preparation prefetches the receipts of every
+                # sample with a real tx hash (manual ones included) concurrently and decodes their logs
+                if not (tx_hash and tx_hash.startswith("0x")):
+                    logger.debug("No transaction hash provided for manual TX - no receipt will be fetched")
 
                 converted_txs.append(tx_dict)
 
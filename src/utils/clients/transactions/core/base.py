@@ -3,12 +3,15 @@
 import json
 import logging
 import os
+import threading
+from functools import cached_property
 from typing import Any
 
 import requests
-from web3 import Web3
 
+from ....disk_cache import JsonFileCache
 from ....rpc_helpers import (
+    build_explorer_session,
     etherscan_response_indicates_chain_unsupported,
     is_etherscan_tx_endpoint_unsupported,
     mark_etherscan_tx_endpoint_unsupported,
@@ -20,21 +23,33 @@ logger = logging.getLogger(__name__)
 
 
 class TransactionFetcherCoreBaseMixin:
-    def __init__(self, etherscan_api_key: str | None = None, lookback_days: int = 20):
+    def __init__(
+        self,
+        etherscan_api_key: str | None = None,
+        lookback_days: int = 20,
+        session: requests.Session | None = None,
+        stop_event: threading.Event | None = None,
+    ):
         """
         Initialize the transaction fetcher.
 
         Args:
             etherscan_api_key: Etherscan API key for fetching data
             lookback_days: Number of days to look back for transaction history
+            session: Shared HTTP session for explorer calls (a pooled one is created if omitted)
+            stop_event: When set, paginated explorer scans stop at the next page boundary
         """
         self.etherscan_api_key = etherscan_api_key
         self.lookback_days = lookback_days
-        self.w3 = Web3()
+        self.session = session or build_explorer_session(BLOCKSCOUT_URLS.values())
+        self.stop_event = stop_event
         self.token_decimals_cache = {}
         self.token_symbol_cache = {}
         self.api_type_per_chain = {}  # Track which API worked for each chain
         self._snowflake_transaction_row_cache: dict[tuple[int, str], dict[str, Any]] = {}
+        self._receipt_cache = JsonFileCache("receipts")
+        # Receipts may be fetched from several threads; only one should open each cached connection
+        self._snowflake_conn_lock = threading.Lock()
         self._snowflake_enabled = self._read_bool_env("SNOWFLAKE_ENABLED", default=True)
         self._snowflake_account = self._read_first_env("SNOWFLAKE_ACCOUNT", "SNOWFLAKE_INSTANCE")
         self._snowflake_user = os.getenv("SNOWFLAKE_USER", "").strip()
@@ -73,6 +88,17 @@ class TransactionFetcherCoreBaseMixin:
                 self._snowflake_transactions_table,
             )
 
+    @cached_property
+    def w3(self):
+        """Offline Web3 instance used for its ABI codec, created (and web3 imported) on first decode."""
+        from web3 import Web3
+
+        return Web3()
+
+    def _stop_requested(self) -> bool:
+        """Return True once the caller no longer needs the scan in progress."""
+        return self.stop_event is not None and self.stop_event.is_set()
+
     def _read_first_env(self, *names: str) -> str:
         """Return the first non-empty environment variable from the provided names."""
         for name in names:
@@ -364,7 +390,7 @@ class TransactionFetcherCoreBaseMixin:
 
         try:
             base_url = self._get_api_base_url(chain_id, use_blockscout)
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -413,7 +439,7 @@ class TransactionFetcherCoreBaseMixin:
             if coredao_api_key:
                 params["apikey"] = coredao_api_key
 
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -443,7 +469,7 @@ class TransactionFetcherCoreBaseMixin:
 
         try:
             base_url = BLOCKSCOUT_URLS[chain_id]
-            response = requests.get(f"{base_url}/api/v2/stats", timeout=10)
+            response = self.session.get(f"{base_url}/api/v2/stats", timeout=10)
             response.raise_for_status()
             data = response.json()
             return data
@@ -1,11 +1,9 @@
 """Explorer-specific transaction fetch helpers."""
 
 import logging
-import time
 from typing import Any
 
-import requests
-
+from .... import fast_json
 from ....rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
     is_etherscan_tx_endpoint_unsupported,
@@ -58,9 +56,9 @@ class TransactionFetcherCoreExplorerMixin:
                 if coredao_api_key:
                     params["apikey"] = coredao_api_key
 
-                response = requests.get(base_url, params=params, timeout=10)
+                response = self.session.get(base_url, params=params, timeout=10)
                 response.raise_for_status()
-                data = response.json()
+                data = fast_json.loads(response.content)
 
                 if data.get("status") == "1" and "result" in data:
                     transactions = data["result"]
@@ -160,27 +158,25 @@ class TransactionFetcherCoreExplorerMixin:
 
             for _ in range(max_pages):
                 if next_page_params:
-                    response = requests.get(url, params=next_page_params, timeout=10)
+                    response = self.session.get(url, params=next_page_params, timeout=10)
                 else:
-                    response = requests.get(url, params=params, timeout=10)
+                    response = self.session.get(url, params=params, timeout=10)
 
                 response.raise_for_status()
-                data = response.json()
+                data = fast_json.loads(response.content)
 
                 items = data.get("items", [])
                 all_transactions.extend(items)
 
                 # Check if there's a next page
                 next_page_params_raw = data.get("next_page_params")
-                if not next_page_params_raw:
+                if not next_page_params_raw or self._stop_requested():
                     break
 
                 # Update params for next page
                 next_page_params = params.copy()
                 next_page_params.update(next_page_params_raw)
 
-                time.sleep(0.3)  # Rate limiting
-
             logger.debug(f"Fetched {len(all_transactions)} transactions from Blockscout v2")
             return all_transactions
 
@@ -250,7 +246,7 @@ class TransactionFetcherCoreExplorerMixin:
 
         try:
             base_url = self._get_api_base_url(chain_id, use_blockscout)
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
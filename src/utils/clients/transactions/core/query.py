@@ -4,8 +4,7 @@ import logging
 import time
 from typing import Any
 
-import requests
-
+from .... import fast_json
 from ....rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
     is_etherscan_tx_endpoint_unsupported,
@@ -73,9 +72,10 @@ class TransactionFetcherCoreQueryMixin:
 
             # Check if this transaction matches any selector we're looking for
             tx_selector = inp[:10].lower()
-            if tx_selector in selector_candidates and len(selector_candidates[tx_selector]) < selector_candidate_limit:
-                selector_candidates[tx_selector].append(etherscan_tx)
-                logger.debug(f"Found candidate for {tx_selector}: {etherscan_tx.get('hash')}")
+            candidates = selector_candidates.get(tx_selector)
+            if candidates is not None and len(candidates) < selector_candidate_limit:
+                candidates.append(etherscan_tx)
+                logger.debug("Found candidate for %s: %s", tx_selector, etherscan_tx.get("hash"))
 
         selector_txs = self._finalize_selector_transaction_samples(
             selector_candidates,
@@ -182,6 +182,8 @@ class TransactionFetcherCoreQueryMixin:
 
         def all_done() -> bool:
             """Check if we have enough candidates for final sampling across all selectors."""
+            if self._stop_requested():
+                return True
             return all(len(candidates) >= selector_candidate_limit for candidates in selector_candidates.values())
 
         # Walk windows from newest to oldest
@@ -219,9 +221,9 @@ class TransactionFetcherCoreQueryMixin:
                 txs = None
                 for attempt in range(max_retries):
                     try:
-                        response = requests.get(base_url, params=params, timeout=10)
+                        response = self.session.get(base_url, params=params, timeout=10)
                         response.raise_for_status()
-                        data = response.json()
+                        data = fast_json.loads(response.content)
 
                         if data["status"] != "1":
                             if not use_blockscout and etherscan_response_indicates_chain_unsupported(data):
@@ -292,23 +294,20 @@ class TransactionFetcherCoreQueryMixin:
 
                     # Check if this transaction matches any selector we're looking for
                     tx_selector = inp[:10].lower()
-                    if (
-                        tx_selector in selector_candidates
-                        and len(selector_candidates[tx_selector]) < selector_candidate_limit
-                    ):
-                        selector_candidates[tx_selector].append(tx)
-                        logger.debug(f"Found candidate for {tx_selector}: {tx.get('hash')}")
+                    candidates = selector_candidates.get(tx_selector)
+                    if candidates is not None and len(candidates) < selector_candidate_limit:
+                        candidates.append(tx)
+                        logger.debug("Found candidate for %s: %s", tx_selector, tx.get("hash"))
 
                 # If we got fewer transactions than page_size, no more pages in this window
                 if len(txs) < page_size:
                     break
 
+                # Pages are paced per explorer host by the session's rate limiters
                 page += 1
-                time.sleep(0.2)
 
             # Move to next (older) window
             block_high = block_low - 1
-            time.sleep(0.2)
 
         selector_txs = finalize_results()
 
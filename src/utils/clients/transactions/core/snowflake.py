@@ -519,25 +519,26 @@ ORDER BY log_index ASC
         """Return a cached connection or open a new one."""
         import time as _time
 
-        cache: dict[str, Any] = getattr(self, "_snowflake_conn_cache", None) or {}
-        self._snowflake_conn_cache = cache
-
-        db_key = database.upper()
-        conn = cache.get(db_key)
-        if conn is not None:
-            try:
-                if not conn.is_closed():
-                    return conn
-            except Exception:
-                pass
-            cache.pop(db_key, None)
-
-        t0 = _time.monotonic()
-        conn = self._open_snowflake_connection(database)
-        elapsed = _time.monotonic() - t0
-        logger.info("Snowflake connection opened for %s in %.1fs", db_key, elapsed)
-        cache[db_key] = conn
-        return conn
+        with self._snowflake_conn_lock:
+            cache: dict[str, Any] = getattr(self, "_snowflake_conn_cache", None) or {}
+            self._snowflake_conn_cache = cache
+
+            db_key = database.upper()
+            conn = cache.get(db_key)
+            if conn is not None:
+                try:
+                    if not conn.is_closed():
+                        return conn
+                except Exception:
+                    pass
+                cache.pop(db_key, None)
+
+            t0 = _time.monotonic()
+            conn = self._open_snowflake_connection(database)
+            elapsed = _time.monotonic() - t0
+            logger.info("Snowflake connection opened for %s in %.1fs", db_key, elapsed)
+            cache[db_key] = conn
+            return conn
 
     def _discard_snowflake_connection(self, database: str) -> None:
         """Close and remove a cached connection (on error)."""
@@ -135,14 +135,7 @@ class TransactionFetcherDecodingMixin:
 
             # Get the full ABI entry for this function
             function_name = function_data["name"]
-            function_abi_entry = None
-            for item in abi_helper.abi:
-                if item.get("type") == "function" and item.get("name") == function_name:
-                    input_types = [abi_helper._param_abi_type_to_str(inp) for inp in item.get("inputs", [])]
-                    sig = f"{function_name}({','.join(input_types)})"
-                    if sig == function_data["signature"]:
-                        function_abi_entry = item
-                        break
+            function_abi_entry = abi_helper.find_function_abi_entry(function_data)
 
             if not function_abi_entry:
                 logger.error(f"Could not find full ABI entry for {function_data['signature']}")
@@ -182,9 +175,10 @@ class TransactionFetcherDecodingMixin:
                     "raw_calldata": tx_input,
                     "function_abi": function_abi_entry,
                 }
-                logger.info(f"Complex types detected in {function_name} - included raw fallback")
+                logger.info("Complex types detected in %s - included raw fallback", function_name)
 
-            logger.debug(f"Decoded transaction input: {result}")
+            # Lazy formatting: rendering the decoded parameters is costly and DEBUG is usually off
+            logger.debug("Decoded transaction input: %s", result)
             return result
 
         except Exception as e:
@@ -193,15 +187,7 @@ class TransactionFetcherDecodingMixin:
             # Decoding failed - provide raw data for AI to decode
             try:
                 # Try to get the ABI entry even if decoding failed
-                function_name = function_data["name"]
-                function_abi_entry = None
-                for item in abi_helper.abi:
-                    if item.get("type") == "function" and item.get("name") == function_name:
-                        input_types = [abi_helper._param_abi_type_to_str(inp) for inp in item.get("inputs", [])]
-                        sig = f"{function_name}({','.join(input_types)})"
-                        if sig == function_data["signature"]:
-                            function_abi_entry = item
-                            break
+                function_abi_entry = abi_helper.find_function_abi_entry(function_data)
 
                 return {
                     "_decoding_failed": True,
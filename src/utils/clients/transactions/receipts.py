@@ -4,25 +4,31 @@ import logging
 import time
 from typing import Any
 
-import requests
-
 from ...rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
+    has_dedicated_rpc_url,
     is_etherscan_tx_endpoint_unsupported,
     mark_etherscan_tx_endpoint_unsupported,
+    rpc_batch_request,
     rpc_eth_call,
     rpc_get_transaction_receipt,
 )
-from .constants import BLOCKSCOUT_URLS
+from .constants import APPROVAL_EVENT_TOPIC, BLOCKSCOUT_URLS, TRANSFER_EVENT_TOPIC
 
 logger = logging.getLogger(__name__)
 
+# Receipts requested per JSON-RPC batch POST; several hosted providers reject larger batches
+RECEIPT_BATCH_SIZE = 10
+
 
 class TransactionFetcherReceiptMixin:
     def fetch_transaction_receipt(self, tx_hash: str, chain_id: int = 1) -> dict[str, Any] | None:
         """
         Fetch transaction receipt from Etherscan or Blockscout.
 
+        Receipts of mined transactions never change, so successful lookups are kept in the
+        on-disk receipt cache and reused by later runs.
+
         Args:
             tx_hash: Transaction hash
             chain_id: Chain ID for the transaction
@@ -31,6 +37,88 @@ class TransactionFetcherReceiptMixin:
             Transaction receipt or None if error
         """
         chain_id = int(chain_id)  # Ensure it's an int
+        cache_key = f"{chain_id}_{tx_hash.lower()}"
+        receipt = self._receipt_cache.get(cache_key)
+        if receipt is not None:
+            logger.debug("Using cached receipt for %s on chain %s", tx_hash, chain_id)
+            return receipt
+
+        receipt = self._fetch_transaction_receipt_uncached(tx_hash, chain_id)
+        if receipt:
+            self._receipt_cache.put(cache_key, receipt)
+        return receipt
+
+    def supports_receipt_batching(self, chain_id: int) -> bool:
+        """
+        Return True when receipts for ``chain_id`` should be requested in JSON-RPC batches.
+
+        Batching needs an explicitly configured node (public default endpoints throttle or reject
+        batches), and Snowflake stays the preferred source on chains where it is available.
+        """
+        chain_id = int(chain_id)
+        return has_dedicated_rpc_url(chain_id) and not self._snowflake_chain_available(chain_id)
+
+    def fetch_transaction_receipts_batch(self, tx_hashes: list[str], chain_id: int = 1) -> dict[str, dict[str, Any]]:
+        """
+        Fetch receipts for several transactions on one chain in as few requests as possible.
+
+        Cached receipts are served from disk; the rest are requested from the configured RPC node
+        as batches of ``RECEIPT_BATCH_SIZE`` eth_getTransactionReceipt calls instead of one
+        explorer call each. Hashes the node does not return (or every hash, when it rejects
+        batching) are missing from the result so callers can fall back to
+        ``fetch_transaction_receipt``.
+
+        Args:
+            tx_hashes: Transaction hashes
+            chain_id: Chain ID shared by every transaction
+
+        Returns:
+            Receipts keyed by transaction hash
+        """
+        chain_id = int(chain_id)
+        receipts: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for tx_hash in dict.fromkeys(tx_hashes):
+            receipt = self._receipt_cache.get(f"{chain_id}_{tx_hash.lower()}")
+            if receipt is not None:
+                receipts[tx_hash] = receipt
+            else:
+                missing.append(tx_hash)
+        if not missing:
+            return receipts
+
+        t0 = time.monotonic()
+        results, error, rpc_url = rpc_batch_request(
+            chain_id,
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in missing],
+            timeout=15,
+            max_batch_size=RECEIPT_BATCH_SIZE,
+            session=self.session,
+        )
+        if results is None:
+            logger.info("Batched receipt lookup unavailable on chain %s (%s): %s", chain_id, rpc_url, error)
+            return receipts
+
+        fetched = 0
+        for tx_hash, (receipt, receipt_error) in zip(missing, results, strict=True):
+            if isinstance(receipt, dict):
+                receipts[tx_hash] = receipt
+                self._receipt_cache.put(f"{chain_id}_{tx_hash.lower()}", receipt)
+                fetched += 1
+            elif receipt_error:
+                logger.debug("Batched receipt lookup failed for %s: %s", tx_hash, receipt_error)
+        logger.info(
+            "Fetched %d/%d receipt(s) on chain %s via batched RPC (%s) in %.1fs",
+            fetched,
+            len(missing),
+            chain_id,
+            rpc_url,
+            time.monotonic() - t0,
+        )
+        return receipts
+
+    def _fetch_transaction_receipt_uncached(self, tx_hash: str, chain_id: int) -> dict[str, Any] | None:
+        """Look a receipt up from Snowflake, Blockscout or Etherscan, in preference order."""
         t0 = time.monotonic()
 
         if self._snowflake_chain_available(chain_id):
@@ -63,7 +151,7 @@ class TransactionFetcherReceiptMixin:
                 try:
                     base_url = BLOCKSCOUT_URLS[chain_id]
                     url = f"{base_url}/api/v2/transactions/{tx_hash}"
-                    response = requests.get(url, timeout=10)
+                    response = self.session.get(url, timeout=10)
                     response.raise_for_status()
                     data = response.json()
 
@@ -118,7 +206,7 @@ class TransactionFetcherReceiptMixin:
 
             try:
                 base_url = self._get_api_base_url(chain_id, False)
-                response = requests.get(base_url, params=params, timeout=10)
+                response = self.session.get(base_url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -170,51 +258,34 @@ class TransactionFetcherReceiptMixin:
                 return None
 
             event_signature = topics[0]
-
-            # ERC-20 Transfer event
-            if event_signature == "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef":
-                if len(topics) >= 3:
-                    from_address = "0x" + topics[1][-40:]
-                    to_address = "0x" + topics[2][-40:]
-                    value_hex = log.get("data", "0x0")
-                    value = int(value_hex, 16) if value_hex != "0x" else 0
-
-                    return {
-                        "event": "Transfer",
-                        "token": log.get("address", "unknown"),
-                        "from": from_address,
-                        "to": to_address,
-                        "value": str(value),
-                        "value_formatted": self.format_token_amount(value, log.get("address"), chain_id),
-                    }
-
-            # ERC-20 Approval event
-            elif (
-                event_signature == "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
-                and len(topics) >= 3
-            ):
-                owner = "0x" + topics[1][-40:]
-                spender = "0x" + topics[2][-40:]
-                value_hex = log.get("data", "0x0")
-                value = int(value_hex, 16) if value_hex != "0x" else 0
-
+            if event_signature not in (TRANSFER_EVENT_TOPIC, APPROVAL_EVENT_TOPIC) or len(topics) < 3:
+                # For other events, return basic info
                 return {
-                    "event": "Approval",
-                    "token": log.get("address", "unknown"),
-                    "owner": owner,
-                    "spender": spender,
-                    "value": str(value),
-                    "value_formatted": self.format_token_amount(value, log.get("address"), chain_id),
+                    "event": "Unknown",
+                    "signature": event_signature,
+                    "address": log.get("address", "unknown"),
+                    "topics": topics,
+                    "data": log.get("data", "0x"),
                 }
 
-            # For other events, return basic info
-            return {
-                "event": "Unknown",
-                "signature": event_signature,
-                "address": log.get("address", "unknown"),
-                "topics": topics,
-                "data": log.get("data", "0x"),
-            }
+            # ERC-20 Transfer / Approval: both index two addresses and carry the amount as data
+            token = log.get("address")
+            value_hex = log.get("data", "0x0")
+            value = int(value_hex, 16) if value_hex != "0x" else 0
+            first_party = "0x" + topics[1][-40:]
+            second_party = "0x" + topics[2][-40:]
+            if event_signature == TRANSFER_EVENT_TOPIC:
+                decoded = {"event": "Transfer", "token": token or "unknown", "from": first_party, "to": second_party}
+            else:
+                decoded = {
+                    "event": "Approval",
+                    "token": token or "unknown",
+                    "owner": first_party,
+                    "spender": second_party,
+                }
+            decoded["value"] = str(value)
+            decoded["value_formatted"] = self.format_token_amount(value, token, chain_id)
+            return decoded
 
         except Exception as e:
             logger.warning(f"Failed to decode log event: {e}")
@@ -263,7 +334,7 @@ class TransactionFetcherReceiptMixin:
                     "apikey": self.etherscan_api_key,
                 }
                 base_url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
-                response = requests.get(base_url, params=params, timeout=10)
+                response = self.session.get(base_url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 if data.get("result") and data["result"] != "0x":
@@ -271,7 +342,6 @@ class TransactionFetcherReceiptMixin:
                     if symbol:
                         self.token_symbol_cache[cache_key] = symbol
                         logger.debug("Fetched symbol for %s: %s (Etherscan)", token_address, symbol)
-                        time.sleep(0.1)
                         return symbol
             except Exception as e:
                 logger.debug("Etherscan symbol fetch failed for %s: %s", token_address, e)
@@ -316,14 +386,13 @@ class TransactionFetcherReceiptMixin:
                     "apikey": self.etherscan_api_key,
                 }
                 base_url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
-                response = requests.get(base_url, params=params, timeout=10)
+                response = self.session.get(base_url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 if data.get("result") and data["result"] != "0x":
                     decimals = int(data["result"], 16)
                     self.token_decimals_cache[cache_key] = decimals
                     logger.debug("Fetched decimals for %s: %s (Etherscan)", token_address, decimals)
-                    time.sleep(0.1)
                     return decimals
             except Exception as e:
                 logger.debug("Etherscan decimals fetch failed for %s: %s", token_address, e)
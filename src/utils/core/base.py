@@ -1,12 +1,18 @@
 """Base analyzer state and shared configuration."""
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import ClassVar
 
-from web3 import Web3
-
-from ..clients.transactions import TransactionFetcher
+from ..clients.transactions import BLOCKSCOUT_URLS, TransactionFetcher
 from ..extraction.source_code import SourceCodeExtractor
+from ..rpc_helpers import (
+    ETHERSCAN_API_HOST,
+    ETHERSCAN_CALLS_PER_SECOND,
+    RateLimiter,
+    blockscout_host_limiters,
+    build_http_session,
+)
 
 
 class AnalyzerBase:
@@ -67,10 +73,28 @@ class AnalyzerBase:
         self.coin_apps_path = coin_apps_path
         self.progress_callback = progress_callback
 
-        self.w3 = Web3()
         self.abi_helper = None
-        self.tx_fetcher = TransactionFetcher(etherscan_api_key, lookback_days)
-        self.source_extractor = SourceCodeExtractor(etherscan_api_key, coredao_api_key) if enable_source_code else None
+        # One limiter paces every Etherscan request made by this analyzer, whichever client issues it
+        self._etherscan_limiter = RateLimiter(ETHERSCAN_CALLS_PER_SECOND)
+        # One pooled session shared by every explorer/RPC client keeps connections alive across calls;
+        # requests it sends to Etherscan or a Blockscout instance wait for that host's limiter
+        self._session = build_http_session(
+            host_limiters={
+                ETHERSCAN_API_HOST: self._etherscan_limiter,
+                **blockscout_host_limiters(BLOCKSCOUT_URLS.values()),
+            }
+        )
+        # Independent explorer calls (ABI fetches, Diamond probes) overlap on this pool, sized to the rate limit
+        self._io_executor = ThreadPoolExecutor(max_workers=ETHERSCAN_CALLS_PER_SECOND, thread_name_prefix="analyzer-io")
+        # Token metadata lookups gate each selector's log decoding, so they get their own small pool
+        # instead of queueing behind the bulk receipt prefetch on the I/O pool
+        self._metadata_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="analyzer-metadata")
+        self.tx_fetcher = TransactionFetcher(etherscan_api_key, lookback_days, session=self._session)
+        self.source_extractor = (
+            SourceCodeExtractor(etherscan_api_key, coredao_api_key, session=self._session)
+            if enable_source_code
+            else None
+        )
 
         self.selector_to_format_key = {}
         self.selector_sources = {}
@@ -79,6 +103,18 @@ class AnalyzerBase:
         self.erc20_context = None
         self.protocol_name = None
 
+    def close(self) -> None:
+        """Release the I/O thread pools and pooled HTTP connections."""
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        self._metadata_executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def report_progress(self, message: str) -> None:
         """Publish a coarse-grained progress update for external polling clients."""
         if self.progress_callback:
@@ -1,17 +1,202 @@
 """Descriptor parsing, include merging, selector extraction, and ABI lookup."""
 
+import copy
 import json
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from ..bundle_zip import default_bundle_root_for_descriptor, validate_local_include_string
+from ..selectors import SELECTOR_RE
+from ..selectors import signature_selector as _signature_selector
 
 logger = logging.getLogger(__name__)
 
 _MAX_INCLUDE_DEPTH = 100
 
 
+def _load_json_file(path: Path | str) -> Any:
+    """Parse a descriptor or include file with stdlib json, which keeps large integer constants exact."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=128)
+def _load_include_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse an include file once per (path, mtime); callers must copy before mutating."""
+    return _load_json_file(path_str)
+
+
+# Anything the full normalizer would rewrite: whitespace (names, modifiers), "tuple(" prefixes,
+# empty parameters, and text after a closing paren other than an array suffix.
+_NON_CANONICAL_SIGNATURE_RE = re.compile(r"\s|tuple\(|\(,|,,|,\)|\)[\[\]\d]*[^\[\]\d,)]")
+_PAREN_RE = re.compile(r"[()]")
+_PARAM_DELIMITER_RE = re.compile(r"[(),]")
+_ARRAY_SUFFIX_RE = re.compile(r"[\[\]0-9]*")
+
+
+def _is_canonical_signature(signature: str) -> bool:
+    """Return True when ``signature`` is already in canonical ``name(type,...)`` form."""
+    if not signature.endswith(")") or _NON_CANONICAL_SIGNATURE_RE.search(signature):
+        return False
+    # Flat parameter lists (no tuples) are the common case: the only ")" is the final one
+    if signature.count("(") == 1 and signature.count(")") == 1:
+        return True
+    # The first "(" must be the one closed by the final ")", with balanced tuples in between
+    depth = 0
+    for paren in _PAREN_RE.finditer(signature):
+        depth += 1 if paren.group() == "(" else -1
+        if depth <= 0 and paren.end() != len(signature):
+            return False
+    return depth == 0
+
+
+# Signature normalization is pure string work on a small vocabulary of format keys and
+# parameter types, so the helpers are memoized at module level and the mixin delegates to them.
+@lru_cache(maxsize=4096)
+def _normalize_function_signature(signature: str) -> str:
+    """
+    Convert a display format signature (which may include parameter names)
+    into its canonical Solidity signature (types only).
+    """
+    signature = signature.strip()
+    # Most format keys are already canonical; skip the per-parameter parse for them
+    if _is_canonical_signature(signature):
+        return signature
+    return _canonicalize_signature(signature)
+
+
+def _canonicalize_signature(signature: str) -> str:
+    """Rebuild ``signature`` from its parameters' canonical types (the full, uncached path)."""
+    if not signature or "(" not in signature or ")" not in signature:
+        return signature
+
+    open_idx = signature.find("(")
+    close_idx = signature.rfind(")")
+    if close_idx <= open_idx:
+        return signature
+
+    function_name = signature[:open_idx].strip()
+    params_body = signature[open_idx + 1 : close_idx]
+
+    if not function_name:
+        return signature
+
+    params = _split_signature_params(params_body)
+    normalized_params = [_normalize_param_type(param) for param in params if param]
+
+    return f"{function_name}({','.join(normalized_params)})"
+
+
+def _closing_paren_index(text: str, open_idx: int) -> int:
+    """Return the index of the ``)`` closing the ``(`` at ``open_idx``, or ``len(text)`` if unbalanced."""
+    depth = 0
+    for paren in _PAREN_RE.finditer(text, open_idx):
+        depth += 1 if paren.group() == "(" else -1
+        if depth == 0:
+            return paren.start()
+    return len(text)
+
+
+@lru_cache(maxsize=4096)
+def _split_signature_params(params_str: str) -> tuple[str, ...]:
+    """
+    Split a function parameter string into individual parameters while
+    respecting nested tuple parentheses.
+
+    Returns a tuple so the memoized result cannot be mutated by callers.
+    """
+    if "(" not in params_str:
+        return tuple(param for param in map(str.strip, params_str.split(",")) if param)
+
+    # Only delimiters matter, so jump between them instead of walking every character
+    params = []
+    depth = 0
+    start = 0
+    for delimiter in _PARAM_DELIMITER_RE.finditer(params_str):
+        char = delimiter.group()
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            param = params_str[start : delimiter.start()].strip()
+            if param:
+                params.append(param)
+            start = delimiter.end()
+
+    # Add the last parameter
+    tail = params_str[start:].strip()
+    if tail:
+        params.append(tail)
+
+    return tuple(params)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_param_type(param: str) -> str:
+    """
+    Remove parameter names, storage modifiers, and whitespace from a single
+    parameter string to obtain its canonical Solidity type representation.
+    """
+    param = param.strip()
+    if not param:
+        return ""
+
+    # Tuple parameter e.g. "(address src,address dst) desc" or
+    # "tuple(address src,address dst) desc"
+    tuple_start_idx = None
+    if param[0] == "(":
+        tuple_start_idx = 0
+    elif param.startswith("tuple("):
+        tuple_start_idx = len("tuple")
+
+    if tuple_start_idx is not None:
+        close_idx = _closing_paren_index(param, tuple_start_idx)
+        inner_params = _split_signature_params(param[tuple_start_idx + 1 : close_idx])
+        normalized_inner = ",".join(filter(None, (_normalize_param_type(p) for p in inner_params)))
+
+        # Capture any array suffix like [] or [2]
+        suffix = _ARRAY_SUFFIX_RE.match(param, close_idx + 1)
+        return f"({normalized_inner}){suffix.group() if suffix else ''}"
+
+    # Non-tuple parameter: take the first token as the type (e.g., "uint256 amount")
+    token = param.split()[0]
+    return token.rstrip(",")
+
+
+def _merge_include_into(data: dict[str, Any], include_data: dict[str, Any]) -> None:
+    """
+    Merge a (private, already resolved) include into ``data`` in place.
+
+    include_data's dicts are reused as merge targets: updating them with the main file's entries
+    keeps include keys first and lets the main file override, without building a fresh dict per
+    merge.
+    """
+    # Merge metadata (constants, enums, etc.)
+    if "metadata" in include_data:
+        metadata = data.setdefault("metadata", {})
+        for key, value in include_data["metadata"].items():
+            if key not in metadata:
+                metadata[key] = value
+            elif isinstance(value, dict) and isinstance(metadata[key], dict):
+                # Deep merge for nested dicts (e.g., constants, enums)
+                value.update(metadata[key])
+                metadata[key] = value
+
+    # Merge display definitions and formats
+    if "display" in include_data:
+        display = data.setdefault("display", {})
+        include_display = include_data["display"]
+        for section in ("definitions", "formats"):
+            if section in include_display:
+                entries = include_display[section]
+                entries.update(display.get(section, {}))
+                display[section] = entries
+
+
 class AnalyzerDescriptorMixin:
     def parse_erc7730_file(self, file_path: Path, include_root: Path | None = None) -> dict[str, Any]:
         """
@@ -28,12 +213,11 @@ class AnalyzerDescriptorMixin:
         logger.info(f"Parsing ERC-7730 file: {file_path}")
 
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            data = _load_json_file(file_path)
 
             root = (include_root or default_bundle_root_for_descriptor(file_path)).resolve()
             # Merge includes if present (nested includes resolve relative to each including file)
-            data = self._merge_includes(data, Path(file_path).parent.resolve(), root, depth=0, seen=set())
+            data = self._merge_includes(data, Path(file_path).parent.resolve(), root)
 
             logger.info(f"Successfully loaded {file_path}")
             return data
@@ -41,108 +225,68 @@ class AnalyzerDescriptorMixin:
             logger.error(f"Failed to parse {file_path}: {e}")
             raise
 
-    def _merge_includes(
-        self,
-        data: dict[str, Any],
-        current_dir: Path,
-        include_root: Path,
-        *,
-        depth: int,
-        seen: set[Path],
-    ) -> dict[str, Any]:
+    def _merge_includes(self, data: dict[str, Any], current_dir: Path, include_root: Path) -> dict[str, Any]:
         """
         Merge ERC-7730 includes into the main file.
 
+        The include chain is walked iteratively: each file is loaded once (nested includes
+        resolve relative to the including file), then the chain is folded back into ``data``
+        from the innermost include outwards.
+
         Args:
             data: Parsed ERC-7730 JSON data
             current_dir: Directory containing the JSON object that owns ``includes``
             include_root: Resolved filesystem root; no include may resolve outside it
         """
-        if "includes" not in data:
-            return data
-
-        if depth > _MAX_INCLUDE_DEPTH:
-            raise ValueError("include nesting depth exceeded")
-
-        include_file = data["includes"]
-        if not isinstance(include_file, str):
-            raise ValueError("includes must be a string")
-        validate_local_include_string(include_file)
-
-        include_path = (current_dir / include_file).resolve()
-        try:
-            include_path.relative_to(include_root)
-        except ValueError as exc:
-            raise ValueError("include path escapes allowed root") from exc
-
-        if include_path in seen:
-            raise ValueError("circular include detected")
-
-        # Check for ERC4626 pattern in includes path BEFORE merging
-        if self._detect_erc4626_from_includes(include_file):
-            logger.info(f"🏦 ERC4626 vault detected from includes: {include_file}")
-            # Get underlying token from metadata constants if available
-            underlying_token = data.get("metadata", {}).get("constants", {}).get("underlyingToken")
-            self.erc4626_context = self._build_erc4626_context(
-                includes_detected=True, source_detection={}, underlying_token=underlying_token
-            )
-
-        logger.info(f"Merging include file: {include_path}")
-
-        try:
-            with open(include_path) as f:
-                include_data = json.load(f)
-
-            # Recursively merge includes in the included file (relative to that file's directory)
-            include_data = self._merge_includes(
-                include_data,
-                include_path.parent.resolve(),
-                include_root,
-                depth=depth + 1,
-                seen=seen | {include_path},
-            )
-
-            # Merge metadata (constants, enums, etc.)
-            if "metadata" in include_data:
-                if "metadata" not in data:
-                    data["metadata"] = {}
-                for key, value in include_data["metadata"].items():
-                    if key not in data["metadata"]:
-                        data["metadata"][key] = value
-                    elif isinstance(value, dict) and isinstance(data["metadata"][key], dict):
-                        # Deep merge for nested dicts (e.g., constants, enums)
-                        # Include file values come first, main file can override
-                        data["metadata"][key] = {**value, **data["metadata"][key]}
-
-            # Merge display definitions
-            if "display" in include_data:
-                if "display" not in data:
-                    data["display"] = {}
-                if "definitions" in include_data["display"]:
-                    if "definitions" not in data["display"]:
-                        data["display"]["definitions"] = {}
-                    # Include file definitions are added first, main file can override
-                    data["display"]["definitions"] = {
-                        **include_data["display"]["definitions"],
-                        **data["display"]["definitions"],
-                    }
-
-                # Merge display formats
-                if "formats" in include_data["display"]:
-                    if "formats" not in data["display"]:
-                        data["display"]["formats"] = {}
-                    # Include file formats are added first, main file can override
-                    data["display"]["formats"] = {**include_data["display"]["formats"], **data["display"]["formats"]}
-
-            # Remove includes key after merging
-            del data["includes"]
+        chain = [data]
+        seen: set[Path] = set()
+        current = data
+        while "includes" in current:
+            if len(chain) > _MAX_INCLUDE_DEPTH + 1:
+                raise ValueError("include nesting depth exceeded")
+
+            include_file = current["includes"]
+            if not isinstance(include_file, str):
+                raise ValueError("includes must be a string")
+            validate_local_include_string(include_file)
+
+            include_path = (current_dir / include_file).resolve()
+            try:
+                include_path.relative_to(include_root)
+            except ValueError as exc:
+                raise ValueError("include path escapes allowed root") from exc
+
+            if include_path in seen:
+                raise ValueError("circular include detected")
+            seen.add(include_path)
+
+            # Check for ERC4626 pattern in includes path BEFORE merging
+            if self._detect_erc4626_from_includes(include_file):
+                logger.info(f"🏦 ERC4626 vault detected from includes: {include_file}")
+                # Get underlying token from metadata constants if available
+                underlying_token = current.get("metadata", {}).get("constants", {}).get("underlyingToken")
+                self.erc4626_context = self._build_erc4626_context(
+                    includes_detected=True, source_detection={}, underlying_token=underlying_token
+                )
 
+            logger.info(f"Merging include file: {include_path}")
+            try:
+                # Vault families share include files; reuse the parsed copy until the file changes.
+                # The merge mutates include data, so work on a private copy of the cached value.
+                current = copy.deepcopy(_load_include_cached(str(include_path), include_path.stat().st_mtime_ns))
+            except Exception as e:
+                logger.error(f"Failed to merge include {include_file}: {e}")
+                raise
+            chain.append(current)
+            current_dir = include_path.parent
+
+        # Fold from the innermost include outwards, so every level sees its includes already merged
+        for index in range(len(chain) - 1, 0, -1):
+            including = chain[index - 1]
+            include_file = including.pop("includes")
+            _merge_include_into(including, chain[index])
             logger.info(f"Successfully merged include: {include_file}")
 
-        except Exception as e:
-            logger.error(f"Failed to merge include {include_file}: {e}")
-            raise
-
         return data
 
     def _match_function_signature_to_abi(self, signature: str) -> dict[str, Any] | None:
@@ -177,9 +321,7 @@ class AnalyzerDescriptorMixin:
 
         canonical_signature = self._normalize_function_signature(signature)
         resolved_selector = (
-            selector.lower()
-            if selector and selector.startswith("0x")
-            else "0x" + self.w3.keccak(text=canonical_signature).hex()[:8]
+            selector.lower() if selector and selector.startswith("0x") else _signature_selector(canonical_signature)
         )
 
         return {
@@ -202,7 +344,8 @@ class AnalyzerDescriptorMixin:
             erc7730_data: Parsed ERC-7730 JSON data
 
         Returns:
-            Tuple of (selectors list, mapping from selector to original format key)
+            Tuple of (lowercase selectors list, mapping from selector to original format key).
+            Pipeline stages key every per-selector table by these lowercase selectors.
         """
         logger.info("Extracting function selectors from ERC-7730 data")
 
@@ -220,7 +363,7 @@ class AnalyzerDescriptorMixin:
                 formatted_key = key.strip()
 
                 # Check if key is already a selector
-                if formatted_key.startswith("0x") and len(formatted_key) == 10:
+                if SELECTOR_RE.fullmatch(formatted_key):
                     selector = formatted_key.lower()
                     selectors.append(selector)
                     selector_to_format_key[selector] = key
@@ -251,7 +394,7 @@ class AnalyzerDescriptorMixin:
                     logger.warning(f"Could not normalize signature '{formatted_key}' - skipping")
                     continue
 
-                selector = "0x" + self.w3.keccak(text=normalized_signature).hex()[:8]
+                selector = _signature_selector(normalized_signature)
                 if normalized_signature != formatted_key:
                     logger.debug(
                         f"Calculated selector for '{formatted_key}' (normalized '{normalized_signature}'): {selector}"
@@ -259,9 +402,9 @@ class AnalyzerDescriptorMixin:
                 else:
                     logger.debug(f"Calculated selector for '{formatted_key}': {selector}")
 
-                selector_lower = selector.lower()
-                selectors.append(selector_lower)
-                selector_to_format_key[selector_lower] = key
+                # signature_selector already returns lowercase hex
+                selectors.append(selector)
+                selector_to_format_key[selector] = key
 
         logger.info(f"Found {len(selectors)} selectors: {selectors}")
         return selectors, selector_to_format_key
@@ -271,112 +414,15 @@ class AnalyzerDescriptorMixin:
         Convert a display format signature (which may include parameter names)
         into its canonical Solidity signature (types only).
         """
-        signature = signature.strip()
-        if not signature or "(" not in signature or ")" not in signature:
-            return signature
-
-        open_idx = signature.find("(")
-        close_idx = signature.rfind(")")
-        if close_idx <= open_idx:
-            return signature
-
-        function_name = signature[:open_idx].strip()
-        params_body = signature[open_idx + 1 : close_idx]
-
-        if not function_name:
-            return signature
-
-        params = self._split_signature_params(params_body)
-        normalized_params = [self._normalize_param_type(param) for param in params if param]
-
-        return f"{function_name}({','.join(normalized_params)})"
+        return _normalize_function_signature(signature)
 
     def _split_signature_params(self, params_str: str) -> list[str]:
-        """
-        Split a function parameter string into individual parameters while
-        respecting nested tuple parentheses.
-        """
-        params = []
-        current = []
-        depth = 0
-
-        for char in params_str:
-            if char == "," and depth == 0:
-                param = "".join(current).strip()
-                if param:
-                    params.append(param)
-                current = []
-                continue
-
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth = max(depth - 1, 0)
-
-            current.append(char)
-
-        # Add the last parameter
-        tail = "".join(current).strip()
-        if tail:
-            params.append(tail)
-
-        return params
+        """Split a function parameter string into individual top-level parameters."""
+        return list(_split_signature_params(params_str))
 
     def _normalize_param_type(self, param: str) -> str:
-        """
-        Remove parameter names, storage modifiers, and whitespace from a single
-        parameter string to obtain its canonical Solidity type representation.
-        """
-        param = param.strip()
-        if not param:
-            return ""
-
-        # Tuple parameter e.g. "(address src,address dst) desc" or
-        # "tuple(address src,address dst) desc"
-        tuple_start_idx = None
-        if param[0] == "(":
-            tuple_start_idx = 0
-        elif param.startswith("tuple("):
-            tuple_start_idx = len("tuple")
-
-        if tuple_start_idx is not None:
-            depth = 0
-            inner_chars = []
-            idx = tuple_start_idx
-
-            while idx < len(param):
-                char = param[idx]
-                if char == "(":
-                    depth += 1
-                    if depth > 1:
-                        inner_chars.append(char)
-                elif char == ")":
-                    depth -= 1
-                    if depth > 0:
-                        inner_chars.append(char)
-                    if depth == 0:
-                        idx += 1
-                        break
-                else:
-                    if depth > 0:
-                        inner_chars.append(char)
-                idx += 1
-
-            inner_str = "".join(inner_chars)
-            inner_params = self._split_signature_params(inner_str)
-            normalized_inner = ",".join(filter(None, (self._normalize_param_type(p) for p in inner_params)))
-
-            # Capture any array suffix like [] or [2]
-            suffix_chars = []
-            while idx < len(param) and param[idx] in "[]0123456789":
-                suffix_chars.append(param[idx])
-                idx += 1
-
-            return f"({normalized_inner}){''.join(suffix_chars)}"
-
-        # Non-tuple parameter: take the first token as the type (e.g., "uint256 amount")
-        token = param.split()[0]
-        return token.rstrip(",")
+        """Reduce a single parameter declaration to its canonical Solidity type."""
+        return _normalize_param_type(param)
 
     def get_contract_deployments(self, erc7730_data: dict[str, Any]) -> list[dict[str, Any]]:
         """
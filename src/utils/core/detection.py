@@ -1,12 +1,211 @@
 """Detection mixin for ERC4626/ERC20 semantics and include-based hints."""
 
 import logging
+import re
+from collections import defaultdict, deque
+from functools import lru_cache
 from typing import Any
 
-import requests
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+
+from ..extraction.source_code import SolidityCodeParser
+from ..rpc_helpers import rpc_batch_request, rpc_eth_call
+from .detection_cache import get_detection_cache, source_digest
 
 logger = logging.getLogger(__name__)
 
+# Contract header, optionally abstract and with an inheritance list: captures the contract name
+_CONTRACT_RE = re.compile(r"(?:abstract\s+)?contract\s+(\w+)(?:\s+is\s+[^{]+)?\s*\{")
+_ASSET_FN_RE = re.compile(r"function\s+asset\s*\(\s*\)")
+# Comments and string literals, matched left to right so "//" inside a string is not a comment
+_SOLIDITY_NOISE_RE = re.compile(r"""//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'""", re.DOTALL)
+
+# asset() selector: 0x38d52e0f
+_ASSET_SELECTOR = "0x38d52e0f"
+
+# Multicall3 is deployed at the same address on most EVM chains; aggregate3((address,bool,bytes)[])
+_MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_AGGREGATE3_SELECTOR = "0x82ad56cb"
+# Keep each aggregated call small enough for public RPC gas/response limits
+_MULTICALL_MAX_CALLS = 20
+
+# Parent-name fragments marking an ancestor as a standard implementation/interface
+_ERC4626_PARENT_MARKERS = frozenset({"ERC4626", "IERC4626"})
+_ERC20_PARENT_MARKERS = frozenset({"ERC20", "IERC20", "BEP20", "IBEP20"})
+_STANDARD_PARENT_MARKERS = {"erc4626": _ERC4626_PARENT_MARKERS, "erc20": _ERC20_PARENT_MARKERS}
+
+
+@lru_cache(maxsize=16)
+def _marker_alternation(markers_by_standard: tuple[tuple[str, frozenset[str]], ...]) -> re.Pattern[str]:
+    """
+    Compile all standards' markers into one alternation with a named group per standard.
+
+    A single scan of each parent name then reports every standard it matches (via ``lastgroup``)
+    instead of one substring test per marker.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{standard}>{'|'.join(sorted(map(re.escape, markers), key=len, reverse=True))})"
+            for standard, markers in markers_by_standard
+        )
+    )
+
+
+def _asset_address_from_result(result: str | None) -> str | None:
+    """Decode the address returned by an asset() eth_call, or None for empty/zero/malformed results."""
+    if not result or len(result) < 42:
+        return None
+    # Address is the last 20 bytes / 40 hex chars; parsing as an int validates the hex and
+    # turns the zero-address check into an int comparison
+    try:
+        address_int = int(result[-40:], 16)
+    except ValueError:
+        return None
+    if address_int == 0:
+        return None
+    return f"0x{address_int:040x}"
+
+
+def _encode_asset_multicall(addresses: list[str]) -> str:
+    """Encode a Multicall3 aggregate3 call running asset() on each address, failures allowed."""
+    asset_call = bytes.fromhex(_ASSET_SELECTOR[2:])
+    encoded = abi_encode(["(address,bool,bytes)[]"], [[(address, True, asset_call) for address in addresses]])
+    return _AGGREGATE3_SELECTOR + encoded.hex()
+
+
+def _decode_asset_multicall(result: str, count: int) -> list[str | None] | None:
+    """
+    Decode aggregate3 results into ``"0x"``-prefixed asset() return words, None for failed calls.
+
+    Returns None when the payload is not a well-formed aggregate3 answer for ``count`` calls
+    (e.g. Multicall3 is not deployed and the call returned empty data).
+    """
+    try:
+        (entries,) = abi_decode(["(bool,bytes)[]"], bytes.fromhex(result.removeprefix("0x")))
+    except Exception:
+        return None
+    if len(entries) != count:
+        return None
+    return ["0x" + data.hex() if success and len(data) == 32 else None for success, data in entries]
+
+
+@lru_cache(maxsize=8)
+def _strip_solidity_noise(source_code: str) -> str:
+    """
+    Return ``source_code`` without comments and with string literals emptied.
+
+    Detection only cares about declarations and braces, so every later scan (inheritance parse,
+    contract heuristic, brace matching) runs on this smaller text and can't be fooled by
+    contract names or braces that only appear in comments or strings.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        token = match.group(0)
+        return token[0] * 2 if token[0] in "\"'" else ""
+
+    return _SOLIDITY_NOISE_RE.sub(replace, source_code)
+
+
+def _guess_deployed_contract(source_code: str) -> tuple[str, int] | None:
+    """
+    Return the last non-abstract contract declared in the source (the usual deployed contract).
+
+    The result is ``(contract_name, header_end)`` where ``header_end`` is just past the opening
+    brace of the contract body, so callers can scan the body without searching for it again.
+    """
+    deployed = None
+    for match in _CONTRACT_RE.finditer(source_code):
+        if "abstract" not in match.group(0):
+            deployed = (match.group(1), match.end())
+    return deployed
+
+
+def _inherited_standards(
+    contract_name: str, inheritance_chain: dict[str, list[str]], markers_by_standard: dict[str, frozenset[str]]
+) -> set[str]:
+    """
+    Return the standards (keys of ``markers_by_standard``) that ``contract_name`` inherits from.
+
+    An ancestor matches a standard when its name contains one of that standard's markers. The
+    graph is walked breadth-first and each contract is visited once, so diamond-shaped
+    hierarchies (e.g. ERC4626 -> ERC20 -> Context and ERC4626 -> IERC4626 -> IERC20) stay linear.
+    The walk stops as soon as every standard has matched.
+    """
+    marker_re = _marker_alternation(tuple(markers_by_standard.items()))
+    found: set[str] = set()
+    visited = {contract_name}
+    queue = deque([contract_name])
+    while queue:
+        for parent in inheritance_chain.get(queue.popleft(), ()):
+            found.update(match.lastgroup for match in marker_re.finditer(parent))
+            if len(found) == len(markers_by_standard):
+                return found
+            if parent not in visited:
+                visited.add(parent)
+                queue.append(parent)
+    return found
+
+
+def _inherits_any(contract_name: str, inheritance_chain: dict[str, list[str]], markers: frozenset[str]) -> bool:
+    """Return True if any ancestor of ``contract_name`` contains one of ``markers`` in its name."""
+    return bool(_inherited_standards(contract_name, inheritance_chain, {"match": markers}))
+
+
+def _find_contract_header_end(source_code: str, contract_name: str) -> int:
+    """
+    Return the index just past the opening brace of ``contract_name``'s body, or -1 if absent.
+
+    Uses ``str.find`` for the name, then checks that it follows the ``contract`` keyword and any
+    run of whitespace, and is not only a prefix of a longer identifier (``Vault`` vs ``VaultFactory``).
+    """
+    pos = source_code.find(contract_name)
+    while pos != -1:
+        after = pos + len(contract_name)
+        keyword_end = pos
+        while keyword_end > 0 and source_code[keyword_end - 1].isspace():
+            keyword_end -= 1
+        keyword_start = keyword_end - len("contract")
+        preceded_ok = (
+            keyword_end < pos
+            and source_code.startswith("contract", keyword_start)
+            and (keyword_start == 0 or not _is_identifier_char(source_code[keyword_start - 1]))
+        )
+        followed_ok = after < len(source_code) and (source_code[after].isspace() or source_code[after] == "{")
+        if preceded_ok and followed_ok:
+            brace = source_code.find("{", after)
+            return brace + 1 if brace != -1 else -1
+        pos = source_code.find(contract_name, after)
+    return -1
+
+
+def _is_identifier_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _find_matching_brace(source: str, start: int) -> int:
+    """
+    Return the index of the ``}`` closing the ``{`` at ``start``, or -1 if unbalanced.
+
+    Jumps between braces with ``str.find`` instead of stepping through every character.
+    Callers should pass comment-free source so braces inside comments are not counted.
+    """
+    depth = 0
+    i = start
+    while True:
+        next_open = source.find("{", i)
+        next_close = source.find("}", i)
+        if next_close == -1:
+            return -1
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            i = next_open + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return next_close
+        i = next_close + 1
+
 
 class AnalyzerDetectionMixin:
     def _detect_erc4626_from_includes(self, includes_path: str) -> bool:
@@ -27,228 +226,166 @@ class AnalyzerDetectionMixin:
                 return True
         return False
 
-    def _detect_erc4626_from_source(self, source_code: str, contract_name: str | None = None) -> dict[str, Any]:
+    def _detect_standards_from_source(
+        self, source_code: str, contract_name: str | None = None
+    ) -> dict[str, dict[str, Any]]:
         """
-        Detect ERC4626 pattern from contract source code.
+        Detect ERC4626 and ERC20 inheritance of the deployed contract in a single pass.
+
+        The source is parsed, the deployed contract resolved and its ancestry walked once for
+        both standards.
 
-        IMPORTANT: Only detects if the DEPLOYED contract inherits from ERC4626,
-        not if ERC4626 exists anywhere in the source.
+        IMPORTANT: Only detects if the DEPLOYED contract inherits from the standard,
+        not if it exists anywhere in the source.
 
         Args:
             source_code: The contract source code
             contract_name: Name of the deployed contract from Etherscan (if available)
 
         Returns:
-            Dict with detection results:
+            Dict with one detection result per standard:
             {
-                'is_erc4626': bool,
-                'detected_patterns': List[str],
-                'inherits_erc4626': bool,
-                'has_asset_function': bool,
-                'main_contract': str  # Name of the deployed contract
+                'erc4626': {
+                    'is_erc4626': bool,
+                    'detected_patterns': List[str],
+                    'inherits_erc4626': bool,
+                    'has_asset_function': bool,
+                    'main_contract': str  # Name of the deployed contract
+                },
+                'erc20': {
+                    'is_erc20': bool,
+                    'detected_patterns': List[str],
+                    'inherits_erc20': bool,
+                    'main_contract': str
+                }
             }
         """
-        logger.debug("Analyzing source code for ERC4626 patterns...")
-
-        result = {
+        if not source_code:
+            return self._scan_standards_from_source(source_code, contract_name)
+
+        # Verified source is immutable, so results persist across runs keyed by source digest
+        cache = get_detection_cache()
+        if cache is None:
+            return self._scan_standards_from_source(source_code, contract_name)
+
+        digest = source_digest(source_code)
+        cached = cache.get(digest, contract_name)
+        if cached is not None:
+            logger.info(f"   📝 Using cached ERC4626/ERC20 detection for {cached['erc4626'].get('main_contract')}")
+            return cached
+
+        results = self._scan_standards_from_source(source_code, contract_name)
+        cache.put(digest, contract_name, results)
+        return results
+
+    def _scan_standards_from_source(
+        self, source_code: str, contract_name: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Run the uncached ERC4626/ERC20 detection; see ``_detect_standards_from_source``."""
+        logger.debug("Analyzing source code for ERC4626/ERC20 patterns...")
+
+        erc4626_result = {
             "is_erc4626": False,
             "detected_patterns": [],
             "inherits_erc4626": False,
             "has_asset_function": False,
             "main_contract": contract_name,
         }
+        erc20_result = {
+            "is_erc20": False,
+            "detected_patterns": [],
+            "inherits_erc20": False,
+            "main_contract": contract_name,
+        }
+        results = {"erc4626": erc4626_result, "erc20": erc20_result}
 
         if not source_code:
-            logger.debug("No source code provided for ERC4626 detection")
-            return result
+            logger.debug("No source code provided for ERC4626/ERC20 detection")
+            return results
 
-        import re
-
-        from ..extraction.source_code import SolidityCodeParser
+        # Strip comments/strings once; every scan below works on the reduced text
+        code = _strip_solidity_noise(source_code)
 
         # Parse inheritance chain
-        parser = SolidityCodeParser(source_code)
+        parser = SolidityCodeParser(code)
         inheritance_chain = parser.extract_inheritance_chain()
 
         if not inheritance_chain:
             logger.debug("   ✗ No contracts with inheritance found")
-            return result
+            return results
 
-        # If contract_name not provided by Etherscan, use heuristic
+        # If contract_name not provided by Etherscan, use heuristic; it already knows where the body starts
+        header_end = -1
         if not contract_name:
             logger.debug("   Contract name not provided, using heuristic...")
-            contract_pattern = r"(?:abstract\s+)?contract\s+(\w+)(?:\s+is\s+[^{]+)?\s*\{"
-            all_contracts = []
-            for match in re.finditer(contract_pattern, source_code):
-                is_abstract = "abstract" in match.group(0)
-                contract_name_match = match.group(1)
-                position = match.start()
-                all_contracts.append((contract_name_match, is_abstract, position))
-
-            # Sort by position (last in file)
-            all_contracts.sort(key=lambda x: x[2], reverse=True)
-
-            # Find first non-abstract contract (from the end of file)
-            for contract_name_candidate, is_abstract, _ in all_contracts:
-                if not is_abstract:
-                    contract_name = contract_name_candidate
-                    break
+            guessed = _guess_deployed_contract(code)
+            if guessed:
+                contract_name, header_end = guessed
+        else:
+            header_end = _find_contract_header_end(code, contract_name)
 
         if not contract_name:
             logger.debug("   ✗ Could not determine deployed contract name")
-            return result
+            return results
 
-        result["main_contract"] = contract_name
+        erc4626_result["main_contract"] = contract_name
+        erc20_result["main_contract"] = contract_name
         logger.info(f"   📝 Deployed contract: {contract_name}")
 
-        # Check if the main contract (or its ancestors) inherits from ERC4626
-        def inherits_from_erc4626(contract_name, chain):
-            """Recursively check if contract inherits from ERC4626."""
-            if contract_name not in chain:
-                return False
-
-            parents = chain[contract_name]
-            for parent in parents:
-                if "ERC4626" in parent or "IERC4626" in parent:
-                    return True
-                # Recursively check parent's inheritance
-                if inherits_from_erc4626(parent, chain):
-                    return True
-            return False
-
-        if inherits_from_erc4626(contract_name, inheritance_chain):
-            result["inherits_erc4626"] = True
-            parents = inheritance_chain.get(contract_name, [])
-            result["detected_patterns"].append(f"inheritance: contract {contract_name} is {', '.join(parents)}")
+        # One walk of the main contract's ancestors answers both standards
+        inherited = _inherited_standards(contract_name, inheritance_chain, _STANDARD_PARENT_MARKERS)
+        inheritance_pattern = (
+            f"inheritance: contract {contract_name} is {', '.join(inheritance_chain.get(contract_name, []))}"
+        )
+
+        if "erc4626" in inherited:
+            erc4626_result["inherits_erc4626"] = True
+            erc4626_result["detected_patterns"].append(inheritance_pattern)
             logger.info(f"   ✓ {contract_name} inherits from ERC4626")
 
         # Check for asset() function in the main contract specifically
         # Extract just the main contract's code
-        main_contract_match = re.search(
-            rf"(?:abstract\s+)?contract\s+{re.escape(contract_name)}\s+(?:is\s+[^{{]+)?\s*\{{", source_code
-        )
-        if main_contract_match:
+        if header_end != -1:
             # Find the contract body
-            start = main_contract_match.end() - 1  # Start at opening brace
-            open_braces = 0
-            i = start
-            while i < len(source_code):
-                if source_code[i] == "{":
-                    open_braces += 1
-                elif source_code[i] == "}":
-                    open_braces -= 1
-                    if open_braces == 0:
-                        contract_body = source_code[start : i + 1]
-                        if re.search(r"function\s+asset\s*\(\s*\)", contract_body):
-                            result["has_asset_function"] = True
-                            result["detected_patterns"].append("asset() function")
-                            logger.info(f"   ✓ {contract_name} has asset() function")
-                        break
-                i += 1
+            start = header_end - 1  # Start at opening brace
+            end = _find_matching_brace(code, start)
+            if end != -1 and _ASSET_FN_RE.search(code, start, end + 1):
+                erc4626_result["has_asset_function"] = True
+                erc4626_result["detected_patterns"].append("asset() function")
+                logger.info(f"   ✓ {contract_name} has asset() function")
 
         # Determine if it's ERC4626 based on main contract only
-        if result["inherits_erc4626"]:
-            result["is_erc4626"] = True
+        if erc4626_result["inherits_erc4626"]:
+            erc4626_result["is_erc4626"] = True
             logger.info(f"   ✓ Confirmed ERC4626: {contract_name} inherits from ERC4626/IERC4626")
         else:
             logger.info(f"   ✗ Not ERC4626: {contract_name} does not inherit from ERC4626")
 
-        return result
-
-    def _detect_erc20_from_source(self, source_code: str, contract_name: str | None = None) -> dict[str, Any]:
-        """
-        Detect if the deployed contract is an ERC20 token.
+        if "erc20" in inherited:
+            erc20_result["inherits_erc20"] = True
+            erc20_result["detected_patterns"].append(inheritance_pattern)
+            erc20_result["is_erc20"] = True
+            logger.info(f"   ✓ Confirmed ERC20: {contract_name} inherits from ERC20/IERC20")
+        else:
+            logger.debug(f"   ✗ Not ERC20: {contract_name} does not inherit from ERC20")
 
-        Args:
-            source_code: The contract source code
-            contract_name: Name of the deployed contract from Etherscan (if available)
+        return results
 
-        Returns:
-            Dict with detection results:
-            {
-                'is_erc20': bool,
-                'detected_patterns': List[str],
-                'inherits_erc20': bool,
-                'main_contract': str
-            }
+    def _detect_erc4626_from_source(self, source_code: str, contract_name: str | None = None) -> dict[str, Any]:
         """
-        logger.debug("Analyzing source code for ERC20 patterns...")
-
-        result = {"is_erc20": False, "detected_patterns": [], "inherits_erc20": False, "main_contract": contract_name}
-
-        if not source_code:
-            logger.debug("No source code provided for ERC20 detection")
-            return result
-
-        import re
-
-        from ..extraction.source_code import SolidityCodeParser
-
-        # Parse inheritance chain
-        parser = SolidityCodeParser(source_code)
-        inheritance_chain = parser.extract_inheritance_chain()
-
-        if not inheritance_chain:
-            logger.debug("   ✗ No contracts with inheritance found")
-            return result
+        Detect ERC4626 pattern from contract source code.
 
-        # If contract_name not provided by Etherscan, use heuristic
-        if not contract_name:
-            logger.debug("   Contract name not provided, using heuristic...")
-            contract_pattern = r"(?:abstract\s+)?contract\s+(\w+)(?:\s+is\s+[^{]+)?\s*\{"
-            all_contracts = []
-            for match in re.finditer(contract_pattern, source_code):
-                is_abstract = "abstract" in match.group(0)
-                contract_name_match = match.group(1)
-                position = match.start()
-                all_contracts.append((contract_name_match, is_abstract, position))
-
-            # Sort by position (last in file)
-            all_contracts.sort(key=lambda x: x[2], reverse=True)
-
-            # Find first non-abstract contract (from the end of file)
-            for contract_name_candidate, is_abstract, _ in all_contracts:
-                if not is_abstract:
-                    contract_name = contract_name_candidate
-                    break
+        Thin wrapper over ``_detect_standards_from_source``; see it for the result shape.
+        """
+        return self._detect_standards_from_source(source_code, contract_name)["erc4626"]
 
-        if not contract_name:
-            logger.debug("   ✗ Could not determine deployed contract name")
-            return result
-
-        result["main_contract"] = contract_name
-        logger.info(f"   📝 Checking if {contract_name} is ERC20...")
-
-        # Check if the main contract (or its ancestors) inherits from ERC20
-        def inherits_from_erc20(contract_name, chain):
-            """Recursively check if contract inherits from ERC20."""
-            if contract_name not in chain:
-                return False
-
-            parents = chain[contract_name]
-            for parent in parents:
-                # Common ERC20 patterns
-                if any(pattern in parent for pattern in ["ERC20", "IERC20", "BEP20", "IBEP20"]):
-                    return True
-                # Recursively check parent's inheritance
-                if inherits_from_erc20(parent, chain):
-                    return True
-            return False
-
-        if inherits_from_erc20(contract_name, inheritance_chain):
-            result["inherits_erc20"] = True
-            parents = inheritance_chain.get(contract_name, [])
-            result["detected_patterns"].append(f"inheritance: contract {contract_name} is {', '.join(parents)}")
-            logger.info(f"   ✓ {contract_name} inherits from ERC20")
-
-        # Determine if it's ERC20 based on main contract only
-        if result["inherits_erc20"]:
-            result["is_erc20"] = True
-            logger.info(f"   ✓ Confirmed ERC20: {contract_name} inherits from ERC20/IERC20")
-        else:
-            logger.debug(f"   ✗ Not ERC20: {contract_name} does not inherit from ERC20")
+    def _detect_erc20_from_source(self, source_code: str, contract_name: str | None = None) -> dict[str, Any]:
+        """
+        Detect if the deployed contract is an ERC20 token.
 
-        return result
+        Thin wrapper over ``_detect_standards_from_source``; see it for the result shape.
+        """
+        return self._detect_standards_from_source(source_code, contract_name)["erc20"]
 
     def _query_erc4626_asset(self, contract_address: str, chain_id: int) -> str | None:
         """
@@ -264,20 +401,17 @@ class AnalyzerDetectionMixin:
         try:
             logger.info(f"🏦 Querying asset() for ERC4626 vault {contract_address} on chain {chain_id}...")
 
-            # asset() selector: 0x38d52e0f
-            asset_selector = "0x38d52e0f"
-
             params = {
                 "module": "proxy",
                 "action": "eth_call",
                 "to": contract_address,
-                "data": asset_selector,
+                "data": _ASSET_SELECTOR,
                 "tag": "latest",
                 "apikey": self.etherscan_api_key,
             }
 
             base_url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
-            response = requests.get(base_url, params=params)
+            response = self._session.get(base_url, params=params)
             data = response.json()
 
             if (
@@ -287,9 +421,8 @@ class AnalyzerDetectionMixin:
                 and data["result"] != "0x"
                 and len(data["result"]) >= 42
             ):
-                # Extract address from result (last 20 bytes / 40 hex chars)
-                asset_address = "0x" + data["result"][-40:].lower()
-                if asset_address != "0x" + "0" * 40:
+                asset_address = _asset_address_from_result(data["result"])
+                if asset_address:
                     logger.info(f"   ✓ ERC4626 asset() returned: {asset_address}")
                     return asset_address
                 else:
@@ -302,6 +435,93 @@ class AnalyzerDetectionMixin:
             logger.warning(f"   ⚠ Failed to query asset(): {e}")
             return None
 
+    def _multicall_asset_results(self, chain_id: int, addresses: list[str]) -> list[str | None] | None:
+        """
+        Run asset() on ``addresses`` through Multicall3, one eth_call per chunk of calls.
+
+        Returns one raw return word per address (None where that vault's call failed), or None
+        when Multicall3 is unavailable on the chain so the caller can fall back.
+        """
+        results: list[str | None] = []
+        for offset in range(0, len(addresses), _MULTICALL_MAX_CALLS):
+            chunk = addresses[offset : offset + _MULTICALL_MAX_CALLS]
+            try:
+                call_data = _encode_asset_multicall(chunk)
+            except Exception as exc:
+                logger.debug(f"   Could not encode Multicall3 asset() call on chain {chain_id}: {exc}")
+                return None
+            result, error, rpc_url = rpc_eth_call(int(chain_id), _MULTICALL3_ADDRESS, call_data, session=self._session)
+            decoded = _decode_asset_multicall(result, len(chunk)) if result and not error else None
+            if decoded is None:
+                logger.debug(f"   Multicall3 asset() query unavailable on chain {chain_id} ({rpc_url}): {error}")
+                return None
+            results.extend(decoded)
+        return results
+
+    def _query_erc4626_assets_batch(
+        self, targets: list[tuple[str, int]], first_only: bool = False
+    ) -> dict[tuple[str, int], str | None]:
+        """
+        Query asset() for several vault deployments with one aggregated call per chain.
+
+        Each chain is tried through Multicall3 first (one eth_call per 20 vaults), then as a
+        JSON-RPC batch. Chains where both are unavailable, and individual calls that fail,
+        fall back to the per-contract Etherscan query, one deployment at a time.
+
+        Args:
+            targets: (contract_address, chain_id) pairs to query
+            first_only: Skip per-contract fallbacks for deployments after the first one with an asset
+
+        Returns:
+            Dict mapping each (contract_address, chain_id) pair to its asset address or None
+        """
+        results: dict[tuple[str, int], str | None] = {}
+        fallback_targets: list[tuple[str, int]] = []
+        # One pass groups targets per chain; dict keys double as an ordered, de-duplicated address set
+        targets_by_chain: defaultdict[int, dict[str, None]] = defaultdict(dict)
+        for contract_address, chain_id in targets:
+            targets_by_chain[chain_id][contract_address] = None
+
+        for chain_id, chain_targets in targets_by_chain.items():
+            addresses = list(chain_targets)
+            logger.info(f"🏦 Querying asset() for {len(addresses)} ERC4626 vault(s) on chain {chain_id} (batched)...")
+            multicall_results = self._multicall_asset_results(chain_id, addresses)
+            if multicall_results is not None:
+                responses = [
+                    (result, None if result else "asset() call failed in Multicall3") for result in multicall_results
+                ]
+            else:
+                calls = [("eth_call", [{"to": address, "data": _ASSET_SELECTOR}, "latest"]) for address in addresses]
+                responses, error, rpc_url = rpc_batch_request(int(chain_id), calls, session=self._session)
+
+                if responses is None:
+                    logger.debug(f"   Batch asset() query unavailable on chain {chain_id} ({rpc_url}): {error}")
+                    fallback_targets.extend((address, chain_id) for address in addresses)
+                    continue
+
+            for address, (result, call_error) in zip(addresses, responses, strict=True):
+                if call_error:
+                    logger.debug(f"   Batched asset() call failed for {address}: {call_error}")
+                    fallback_targets.append((address, chain_id))
+                    continue
+                asset_address = _asset_address_from_result(result)
+                if asset_address:
+                    logger.info(f"   ✓ ERC4626 asset() returned for {address}: {asset_address}")
+                else:
+                    logger.info(f"   ⚠ asset() returned an empty or zero address for {address}")
+                results[(address, chain_id)] = asset_address
+
+        # Fallbacks run in deployment order; with first_only, those after the first deployment that
+        # has an asset are skipped, so the caller still picks the same deployment as a sequential scan
+        pending_fallbacks = set(fallback_targets)
+        found = False
+        for target in dict.fromkeys(targets):
+            if target in pending_fallbacks:
+                results[target] = None if first_only and found else self._query_erc4626_asset(*target)
+            found = found or bool(results.get(target))
+
+        return results
+
     def _build_erc4626_context(
         self,
         includes_detected: bool,
@@ -0,0 +1,94 @@
+"""Persistent SQLite cache for source-code standard detection results."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from ..disk_cache import DISABLED_VALUES, cache_root
+
+logger = logging.getLogger(__name__)
+
+# Set to a file path to relocate the cache, or to 0/false/off to disable it
+DETECTION_CACHE_ENV = "ERC7730_DETECTION_CACHE"
+
+# Bump whenever detection logic changes so results from older detectors are not reused
+DETECTION_VERSION = 1
+
+
+def source_digest(source_code: str) -> bytes:
+    """Return a compact digest identifying a contract source."""
+    return hashlib.blake2b(source_code.encode("utf-8"), digest_size=16).digest()
+
+
+class DetectionCache:
+    """
+    Detection results keyed by (source digest, contract name, detector version).
+
+    Verified source at a given address never changes, and detection depends only on the source,
+    the deployed contract name and the detector itself, so results can be reused across runs.
+    Rows written by other detector versions are dropped on open. The connection is shared
+    between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS detection ("
+                "source_hash BLOB NOT NULL, contract_name TEXT NOT NULL, "
+                "detector_version INTEGER NOT NULL, result TEXT NOT NULL, "
+                "PRIMARY KEY (source_hash, contract_name, detector_version))"
+            )
+            self._conn.execute("DELETE FROM detection WHERE detector_version != ?", (DETECTION_VERSION,))
+
+    def get(self, source_hash: bytes, contract_name: str | None) -> dict[str, Any] | None:
+        """Return the cached detection result, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM detection WHERE source_hash = ? AND contract_name = ? AND detector_version = ?",
+                (source_hash, contract_name or "", DETECTION_VERSION),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, source_hash: bytes, contract_name: str | None, result: dict[str, Any]) -> None:
+        """Store a detection result, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO detection (source_hash, contract_name, detector_version, result) "
+                "VALUES (?, ?, ?, ?)",
+                (source_hash, contract_name or "", DETECTION_VERSION, json.dumps(result)),
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_detection_cache() -> DetectionCache | None:
+    """Open the process-wide detection cache, or return None when disabled or unavailable."""
+    configured = os.getenv(DETECTION_CACHE_ENV, "").strip()
+    if configured.lower() in DISABLED_VALUES:
+        return None
+
+    root = cache_root()
+    if configured:
+        path = Path(configured).expanduser()
+    elif root:
+        path = root / "detection.sqlite"
+    else:
+        return None
+    try:
+        return DetectionCache(path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(f"Detection cache unavailable at {path}: {exc}")
+        return None
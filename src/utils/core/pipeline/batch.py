@@ -12,46 +12,64 @@ logger = logging.getLogger(__name__)
 
 class AnalyzerPipelineBatchMixin:
     def _run_batch_audits(self, context: dict[str, Any]) -> None:
-        """Execute audit tasks concurrently and cache results by selector."""
+        """Execute audit tasks concurrently and attach each result to its prepared selector."""
         prepared_selectors = context["prepared_selectors"]
         # ====================================================================
         # PHASE 2: BATCH API CALLS (Concurrent - maximum efficiency)
         # ====================================================================
         # Execute all API calls concurrently using asyncio.
 
-        # Collect all audit tasks that need API calls
-        audit_tasks = [p["audit_task"] for p in prepared_selectors if p["audit_task"] is not None]
-
-        audit_results = []
-        if audit_tasks:
+        # Audits started during preparation have been running in the background; just collect them
+        stream = context.pop("audit_stream", None)
+        if stream is not None:
+            task_indices = context.pop("streamed_task_indices")
             logger.info(f"\n{'=' * 60}")
-            logger.info(f"PHASE 2: Executing {len(audit_tasks)} API calls concurrently...")
+            logger.info(f"PHASE 2: Waiting for {len(stream)} API calls started during preparation...")
             logger.info(f"{'=' * 60}")
-
-            # Execute batch API calls with concurrency limit and retry logic
-            audit_results = generate_clear_signing_audits_batch(
-                tasks=audit_tasks, max_concurrent=self.max_concurrent_api_calls, max_retries=self.max_api_retries
-            )
-
+            try:
+                audit_results = stream.results()
+            finally:
+                stream.close()
             logger.info(f"\n{'=' * 60}")
             logger.info("PHASE 2 COMPLETE: All API calls finished")
             logger.info(f"{'=' * 60}")
         else:
-            logger.info(f"\n{'=' * 60}")
-            logger.info("PHASE 2 SKIPPED: No audit tasks to process")
-            logger.info(f"{'=' * 60}")
+            # Collect all audit tasks that need API calls, remembering which prepared entry each belongs to
+            task_indices = [i for i, p in enumerate(prepared_selectors) if p["audit_task"] is not None]
+            audit_tasks = [prepared_selectors[i]["audit_task"] for i in task_indices]
+
+            audit_results = []
+            if audit_tasks:
+                logger.info(f"\n{'=' * 60}")
+                logger.info(f"PHASE 2: Executing {len(audit_tasks)} API calls concurrently...")
+                logger.info(f"{'=' * 60}")
+
+                # Execute batch API calls with concurrency limit and retry logic
+                audit_results = generate_clear_signing_audits_batch(
+                    tasks=audit_tasks, max_concurrent=self.max_concurrent_api_calls, max_retries=self.max_api_retries
+                )
+
+                logger.info(f"\n{'=' * 60}")
+                logger.info("PHASE 2 COMPLETE: All API calls finished")
+                logger.info(f"{'=' * 60}")
+            else:
+                logger.info(f"\n{'=' * 60}")
+                logger.info("PHASE 2 SKIPPED: No audit tasks to process")
+                logger.info(f"{'=' * 60}")
 
-        # Create a map from selector to audit result for easy lookup
-        audit_results_map = {r.selector: r for r in audit_results}
+        # Batch results come back in task order, so stamp them onto their prepared entries directly
+        for i, audit_result in zip(task_indices, audit_results, strict=True):
+            prepared_selectors[i]["audit_result"] = audit_result
+        audit_result_count = len(audit_results)
 
         for prepared in prepared_selectors:
             synthetic_report_data = prepared.get("synthetic_report_data")
             selector = prepared.get("selector")
-            if not selector or not synthetic_report_data or selector in audit_results_map:
+            if not selector or not synthetic_report_data or prepared.get("audit_result"):
                 continue
 
             critical_report, detailed_report = format_audit_reports(synthetic_report_data)
-            audit_results_map[selector] = AuditResult(
+            prepared["audit_result"] = AuditResult(
                 selector=selector,
                 function_signature=prepared["function_data"]["signature"],
                 critical_report=critical_report,
@@ -59,6 +77,7 @@ class AnalyzerPipelineBatchMixin:
                 report_data=synthetic_report_data,
                 success=True,
             )
+            audit_result_count += 1
             logger.info("Synthesized report for %s without AI because selector is missing from merged ABI", selector)
 
-        context["audit_results_map"] = audit_results_map
+        context["audit_result_count"] = audit_result_count
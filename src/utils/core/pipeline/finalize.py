@@ -1,93 +1,125 @@
 """Pipeline stage: attach audit results to selector output structure."""
 
 import logging
-from typing import Any
+from typing import Any, TypedDict
+
+from ...auditing.models import AuditResult
 
 logger = logging.getLogger(__name__)
 
 
+class SelectorResult(TypedDict):
+    """Per-selector record stored in ``results["selectors"]`` and consumed by the reporters."""
+
+    function_name: str
+    function_signature: str
+    descriptor_format_key: str | None
+    abi_resolution: dict[str, Any] | None
+    contract_address: str
+    chain_id: int
+    transactions: list[dict[str, Any]]
+    erc7730_format: dict[str, Any]
+    erc7730_format_expanded: dict[str, Any] | None
+    audit_report_critical: str | None
+    audit_report_detailed: str | None
+    audit_report_json: dict[str, Any]
+    source_code: dict[str, Any] | None
+    source_resolution: dict[str, Any] | None
+    screenshot_data: list[dict[str, Any]] | None
+
+
 class AnalyzerPipelineFinalizeMixin:
     def _finalize_results(self, context: dict[str, Any]) -> dict[str, Any]:
         """Merge prepared selector data and audit output into final results."""
         prepared_selectors = context["prepared_selectors"]
-        audit_results_map = context["audit_results_map"]
         results = context["results"]
+        # Bind logger methods once; the per-selector loop below calls them many times
+        _debug = logger.debug
+        _info = logger.info
+        _warn = logger.warning
         # ====================================================================
         # PHASE 3: POST-PROCESSING (Sequential - maintains log coherence)
         # ====================================================================
         # Process results in order, logging each report to maintain coherent output.
 
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"PHASE 3: Processing results for {len(prepared_selectors)} selectors...")
-        logger.info(f"{'=' * 60}")
-
-        for prepared in prepared_selectors:
-            selector = prepared["selector"]
-            format_key = prepared.get("format_key")
-            function_name = prepared["function_name"]
-            function_data = prepared["function_data"]
-            abi_resolution = prepared.get("abi_resolution")
-            selector_deployment = prepared["selector_deployment"]
-            decoded_txs = prepared["decoded_txs"]
-            erc7730_format = prepared["erc7730_format"]
-            function_source = prepared["function_source"]
-            source_resolution = prepared.get("source_resolution")
-
-            logger.info(f"\n{'=' * 60}")
-            logger.info(f"Processing results for: {selector} ({function_name})")
-            logger.info(f"{'=' * 60}")
-
-            # Get the audit result for this selector
-            audit_result = audit_results_map.get(selector)
-
-            audit_report_critical = None
-            audit_report_detailed = None
-            audit_report_json = {}
-            expanded_erc7730_format = None
-
-            if audit_result:
-                audit_report_critical = audit_result.critical_report
-                audit_report_detailed = audit_result.detailed_report
-                audit_report_json = audit_result.report_data
-                expanded_erc7730_format = audit_report_json.get("erc7730_format")
-
-                if audit_result.success:
-                    logger.debug(f"\nCritical Report:\n{audit_report_critical}\n")
-                    logger.debug(f"\nDetailed Report:\n{audit_report_detailed}\n")
+        separator = "=" * 60
+        _info(f"\n{separator}\nPHASE 3: Processing results for {len(prepared_selectors)} selectors...\n{separator}")
+
+        screenshot_map = context.get("screenshot_data", {})
+
+        if not context.get("audit_result_count"):
+            # Static-only run: there is nothing to look up, so store selector data directly
+            _warn(f"No audit results available - storing static data for {len(prepared_selectors)} selector(s)")
+            for prepared in prepared_selectors:
+                self._store_selector_result(results, prepared, None, screenshot_map)
+        else:
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for prepared in prepared_selectors:
+                selector = prepared["selector"]
+
+                # Banner and reports go out as one record each; warnings stay separate records
+                # so they keep routing to warning-level handlers.
+                _info(f"\n{separator}\nProcessing results for: {selector} ({prepared['function_name']})\n{separator}")
+
+                audit_result = prepared.get("audit_result")
+                if audit_result:
+                    if audit_result.success:
+                        if debug_enabled:
+                            _debug(
+                                f"\nCritical Report:\n{audit_result.critical_report}\n\n"
+                                f"\nDetailed Report:\n{audit_result.detailed_report}\n"
+                            )
+                    else:
+                        _warn(f"Audit failed for {selector}: {audit_result.error}")
                 else:
-                    logger.warning(f"Audit failed for {selector}: {audit_result.error}")
-            else:
-                logger.warning(f"No audit result found for selector {selector}")
+                    _warn(f"No audit result found for selector {selector}")
 
-            # Attach screenshot data if available (None when absent)
-            screenshot_map = context.get("screenshot_data", {})
-            selector_screenshot_data = screenshot_map.get(selector.lower()) or None
-
-            # Store results
-            results["selectors"][selector] = {
-                "function_name": function_name,
-                "function_signature": function_data["signature"],
-                "descriptor_format_key": format_key,
-                "abi_resolution": abi_resolution,
-                "contract_address": selector_deployment["address"],
-                "chain_id": selector_deployment["chainId"],
-                "transactions": decoded_txs,
-                "erc7730_format": erc7730_format,
-                "erc7730_format_expanded": expanded_erc7730_format,
-                "audit_report_critical": audit_report_critical,
-                "audit_report_detailed": audit_report_detailed,
-                "audit_report_json": audit_report_json,
-                "source_code": function_source,
-                "source_resolution": source_resolution,
-                "screenshot_data": selector_screenshot_data,
-            }
-
-        logger.info(f"\n{'=' * 60}")
-        logger.info("PHASE 3 COMPLETE: All results processed")
-        logger.info(f"{'=' * 60}")
-
-        logger.info(f"\n{'=' * 60}")
-        logger.info("Analysis complete!")
-        logger.info(f"{'=' * 60}")
+                self._store_selector_result(results, prepared, audit_result, screenshot_map)
+
+        _info(
+            f"\n{separator}\nPHASE 3 COMPLETE: All results processed\n{separator}"
+            f"\n\n{separator}\nAnalysis complete!\n{separator}"
+        )
 
         return results
+
+    def _store_selector_result(
+        self,
+        results: dict[str, Any],
+        prepared: dict[str, Any],
+        audit_result: AuditResult | None,
+        screenshot_map: dict[str, Any],
+    ) -> None:
+        """Store one selector entry in the final results, with audit fields left empty when absent."""
+        selector = prepared["selector"]
+        selector_deployment = prepared["selector_deployment"]
+
+        audit_report_critical = None
+        audit_report_detailed = None
+        audit_report_json = {}
+        expanded_erc7730_format = None
+        if audit_result:
+            audit_report_critical = audit_result.critical_report
+            audit_report_detailed = audit_result.detailed_report
+            audit_report_json = audit_result.report_data
+            expanded_erc7730_format = audit_report_json.get("erc7730_format")
+
+        record: SelectorResult = {
+            "function_name": prepared["function_name"],
+            "function_signature": prepared["function_data"]["signature"],
+            "descriptor_format_key": prepared.get("format_key"),
+            "abi_resolution": prepared.get("abi_resolution"),
+            "contract_address": selector_deployment["address"],
+            "chain_id": selector_deployment["chainId"],
+            "transactions": prepared["decoded_txs"],
+            "erc7730_format": prepared["erc7730_format"],
+            "erc7730_format_expanded": expanded_erc7730_format,
+            "audit_report_critical": audit_report_critical,
+            "audit_report_detailed": audit_report_detailed,
+            "audit_report_json": audit_report_json,
+            "source_code": prepared["function_source"],
+            "source_resolution": prepared.get("source_resolution"),
+            # Attach screenshot data if available (None when absent)
+            "screenshot_data": screenshot_map.get(selector) or None,
+        }
+        results["selectors"][selector] = record
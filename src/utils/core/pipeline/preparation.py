@@ -1,14 +1,109 @@
 """Pipeline stage: decode samples and prepare audit tasks."""
 
 import logging
-import time
+from concurrent.futures import Future, wait
 from typing import Any
 
-from ...auditing import prepare_audit_task
+from ...auditing import AuditTaskStream, prepare_audit_task
+from ...clients.transactions import APPROVAL_EVENT_TOPIC, TRANSFER_EVENT_TOPIC, TX_HASH_RE
+from ...reporting.reporter.expansion import expand_erc7730_format_with_refs
+from ...selectors import SELECTOR_RE
+from ..descriptor import _signature_selector
 from ..helpers import truncate_byte_arrays
 
 logger = logging.getLogger(__name__)
 
+# Calls to these functions never change state, so their receipts never contain event logs
+_LOG_FREE_MUTABILITIES = frozenset({"view", "pure"})
+# Distinguishes "not decoded yet" from a cached failed decode (None)
+_NOT_DECODED = object()
+# Log events whose amounts are formatted with the emitting token's symbol and decimals
+_TOKEN_AMOUNT_EVENT_TOPICS = frozenset({TRANSFER_EVENT_TOPIC, APPROVAL_EVENT_TOPIC})
+
+
+def _copy_future_outcome(source: Future, target: Future) -> None:
+    """Resolve ``target`` with the result or exception of the finished ``source`` future."""
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+def _build_source_code_block(function_source: dict[str, Any]) -> str:
+    """Render the source snippet sent to the model as a single log block."""
+    docstring = function_source.get("function_docstring")
+    custom_types = function_source.get("custom_types") or ()
+    using_statements = function_source.get("using_statements") or ()
+    constants = function_source.get("constants") or ()
+    modifiers = function_source.get("modifiers") or ()
+    structs = function_source.get("structs") or ()
+    enums = function_source.get("enums") or ()
+    internal_functions = function_source.get("internal_functions") or ()
+    parent_functions = function_source.get("parent_functions") or ()
+    libraries = function_source.get("libraries") or ()
+
+    separator = "=" * 60
+    parts = [f"\n{separator}\nSOURCE CODE (being sent to AI):\n{separator}\n\n"]
+
+    if docstring:
+        parts.append(f"// Docstring:\n{docstring}\n\n")
+
+    # One join per section rather than one concatenation per item
+    for header, items, item_separator in (
+        ("// Custom types:\n", custom_types, "\n"),
+        ("// Using statements:\n", using_statements, "\n"),
+        ("// Constants:\n", constants, "\n"),
+        ("// Modifiers used by main function:\n", modifiers, "\n\n"),
+        ("// Structs:\n", structs, "\n"),
+        ("// Enums:\n", enums, "\n"),
+    ):
+        if items:
+            parts.extend((header, item_separator.join(map(str, items)), "\n\n"))
+
+    parts.append("// Main function:\n")
+    parts.append(function_source["function"])
+
+    if internal_functions:
+        parts.append("\n\n// Internal functions called:\n")
+        for internal_func in internal_functions:
+            internal_docstring = internal_func.get("docstring")
+            if internal_docstring:
+                parts.extend((internal_docstring, "\n"))
+            parts.extend((internal_func["body"], "\n\n"))
+
+    if parent_functions:
+        parts.append("\n\n// Parent contract implementations (from super. calls):\n")
+        for parent_func in parent_functions:
+            parts.extend(
+                (
+                    "// From ",
+                    parent_func.get("parent_contract", "Unknown"),
+                    ".",
+                    parent_func.get("function_name", "unknown"),
+                    "():\n",
+                    parent_func["body"],
+                    "\n\n",
+                )
+            )
+
+    if libraries:
+        parts.extend(("\n// Libraries:\n", "\n\n".join(map(str, libraries)), "\n\n"))
+
+    parts.append(f"\n{separator}\n")
+    return "".join(parts)
+
+
+class _CodeBlock:
+    """Defer rendering of a source block until a handler actually formats the record."""
+
+    __slots__ = ("_function_source",)
+
+    def __init__(self, function_source: dict[str, Any]):
+        self._function_source = function_source
+
+    def __str__(self) -> str:
+        return _build_source_code_block(self._function_source)
+
 
 class AnalyzerPipelinePreparationMixin:
     def _resolve_function_data_with_abi_status(self, selector: str) -> tuple[dict[str, Any] | None, dict[str, Any]]:
@@ -55,80 +150,177 @@ class AnalyzerPipelinePreparationMixin:
             "error": error,
         }
 
+    def _decode_and_truncate_input(self, tx_input: str, function_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Decode calldata and truncate large byte arrays, keeping any raw fallback intact for the AI."""
+        decoded = self.tx_fetcher.decode_transaction_input(tx_input, function_data, self.abi_helper)
+        if decoded is None:
+            return None
+        # Extract _raw_fallback before truncation (keep it intact for AI)
+        raw_fallback = decoded.pop("_raw_fallback", None)
+
+        # Truncate large byte arrays to reduce token usage
+        decoded_clean = truncate_byte_arrays(decoded, max_bytes_length=100)
+
+        # Re-add raw fallback if it existed (untruncated)
+        if raw_fallback:
+            decoded_clean["_raw_fallback"] = raw_fallback
+        return decoded_clean
+
+    def _fetch_transaction_receipts(
+        self,
+        tx_hashes: list[str],
+        chain_id: int,
+        prefetched: dict[tuple[int, str], Future] | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Fetch receipts for ``tx_hashes`` concurrently, returned in the same order.
+
+        Calls share the analyzer's I/O pool; Etherscan requests are paced by the session's shared
+        rate limiter, so cached or Snowflake-served receipts never wait. Only valid transaction
+        hashes (0x + 64 hex chars) are looked up; other entries (e.g. manual transactions) get None.
+        Lookups already started by ``_prefetch_transaction_receipts`` are reused.
+        """
+        prefetched = prefetched or {}
+        futures = {}
+        for tx_hash in tx_hashes:
+            if tx_hash in futures:
+                continue
+            if (chain_id, tx_hash) in prefetched:
+                futures[tx_hash] = prefetched[(chain_id, tx_hash)]
+            elif TX_HASH_RE.fullmatch(tx_hash):
+                logger.debug(f"Fetching receipt for transaction {tx_hash}")
+                futures[tx_hash] = self._io_executor.submit(
+                    self.tx_fetcher.fetch_transaction_receipt, tx_hash, chain_id
+                )
+            else:
+                logger.debug(f"Skipping receipt fetch for transaction {tx_hash} (not a valid TX hash)")
+
+        receipts: dict[str, dict[str, Any] | None] = {}
+        for tx_hash, future in futures.items():
+            try:
+                receipts[tx_hash] = future.result()
+            except Exception as exc:
+                logger.warning(f"Failed to fetch receipt for {tx_hash}: {exc}")
+                receipts[tx_hash] = None
+        return [receipts.get(tx_hash) for tx_hash in tx_hashes]
+
+    def _prefetch_transaction_receipts(self, context: dict[str, Any]) -> dict[tuple[int, str], Future]:
+        """
+        Start receipt lookups for every selector's samples before the preparation loop runs.
+
+        Preparation stays sequential so its logs read in selector order, but the receipt I/O for
+        later selectors then proceeds while earlier ones are being decoded and matched to source.
+        On chains with a configured RPC node, receipts are requested in JSON-RPC batches rather
+        than one explorer call each. Returns futures keyed by (chain id, tx hash), in selector order.
+        """
+        selector_function_data = context.get("selector_function_data", {})
+        selector_abi_resolution = context.get("selector_abi_resolution", {})
+        hashes_per_chain: dict[int, dict[str, None]] = {}
+        for selector_lower, transactions in context["all_selector_txs"].items():
+            function_data = selector_function_data.get(selector_lower) or {}
+            abi_resolution = selector_abi_resolution.get(selector_lower) or {}
+            if not transactions or abi_resolution.get("status", "merged_abi") != "merged_abi":
+                continue
+            if function_data.get("stateMutability") in _LOG_FREE_MUTABILITIES:
+                continue
+            chain_id = context["deployment_per_selector"].get(selector_lower, context["default_deployment"])["chainId"]
+            chain_hashes = hashes_per_chain.setdefault(chain_id, {})
+            for tx in transactions:
+                tx_hash = tx.get("hash") or ""
+                if TX_HASH_RE.fullmatch(tx_hash):
+                    chain_hashes[tx_hash] = None
+
+        fetcher = self.tx_fetcher
+        prefetched: dict[tuple[int, str], Future] = {}
+        for chain_id, chain_hashes in hashes_per_chain.items():
+            if len(chain_hashes) > 1 and fetcher.supports_receipt_batching(chain_id):
+                pending = {tx_hash: Future() for tx_hash in chain_hashes}
+                batch = self._io_executor.submit(fetcher.fetch_transaction_receipts_batch, list(chain_hashes), chain_id)
+                batch.add_done_callback(lambda done, p=pending, c=chain_id: self._settle_batched_receipts(done, p, c))
+                prefetched.update(((chain_id, tx_hash), future) for tx_hash, future in pending.items())
+                continue
+            for tx_hash in chain_hashes:
+                prefetched[(chain_id, tx_hash)] = self._io_executor.submit(
+                    fetcher.fetch_transaction_receipt, tx_hash, chain_id
+                )
+        if prefetched:
+            logger.info(f"Prefetching {len(prefetched)} transaction receipt(s) in the background")
+        return prefetched
+
+    def _settle_batched_receipts(self, batch: Future, pending: dict[str, Future], chain_id: int) -> None:
+        """
+        Resolve per-transaction futures from a finished batched receipt lookup.
+
+        Receipts the batch did not return are looked up one by one on the I/O pool, so they go
+        through the usual Snowflake/explorer/RPC fallbacks.
+        """
+        if batch.exception():
+            logger.warning(f"Batched receipt lookup failed on chain {chain_id}: {batch.exception()}")
+        receipts = {} if batch.exception() else batch.result()
+        for tx_hash, future in pending.items():
+            if tx_hash in receipts:
+                future.set_result(receipts[tx_hash])
+                continue
+            fallback = self._io_executor.submit(self.tx_fetcher.fetch_transaction_receipt, tx_hash, chain_id)
+            fallback.add_done_callback(lambda done, target=future: _copy_future_outcome(done, target))
+
+    def _prefetch_token_metadata(self, receipts: list[dict[str, Any] | None], chain_id: int) -> None:
+        """
+        Look up symbol and decimals for every token moved or approved in ``receipts`` at once.
+
+        Log decoding formats each Transfer/Approval amount with the token's metadata; without
+        this, every token seen for the first time costs two sequential explorer calls mid-decode.
+        Results land in the fetcher's token caches, so decoding afterwards is local. Lookups run on
+        a dedicated pool so they never wait behind receipts prefetched for later selectors.
+        """
+        tokens = {
+            log["address"]
+            for receipt in receipts
+            if receipt
+            for log in receipt.get("logs") or []
+            if log.get("address")
+            and len(log.get("topics") or []) >= 3
+            and log["topics"][0] in _TOKEN_AMOUNT_EVENT_TOPICS
+        }
+        fetcher = self.tx_fetcher
+        futures = []
+        for token in tokens:
+            cache_key = f"{chain_id}:{token.lower()}"
+            if cache_key not in fetcher.token_symbol_cache:
+                futures.append(self._metadata_executor.submit(fetcher.get_token_symbol, token, chain_id))
+            if cache_key not in fetcher.token_decimals_cache:
+                futures.append(self._metadata_executor.submit(fetcher.get_token_decimals, token, chain_id))
+        if futures:
+            logger.debug(f"Fetching metadata for {len(tokens)} token(s) on chain {chain_id}")
+            wait(futures)
+
     def _log_function_source_block(self, function_source: dict[str, Any]) -> None:
         """Log the final source snippet sent to the model."""
         if not function_source or not function_source.get("function"):
             return
-        if not logger.isEnabledFor(logging.INFO):
+
+        logger.debug("%s", _CodeBlock(function_source))
+
+    def _log_function_source_summary(self, function_source: dict[str, Any]) -> None:
+        """Log per-section counts for an extracted function source packet."""
+        if not logger.isEnabledFor(logging.DEBUG):
             return
 
-        code_block = f"\n{'=' * 60}\n"
-        code_block += "SOURCE CODE (being sent to AI):\n"
-        code_block += f"{'=' * 60}\n\n"
-
-        if function_source.get("function_docstring"):
-            code_block += f"// Docstring:\n{function_source['function_docstring']}\n\n"
-
-        if function_source.get("custom_types"):
-            code_block += "// Custom types:\n"
-            for custom_type in function_source["custom_types"]:
-                code_block += f"{custom_type}\n"
-            code_block += "\n"
-
-        if function_source.get("using_statements"):
-            code_block += "// Using statements:\n"
-            for using_stmt in function_source["using_statements"]:
-                code_block += f"{using_stmt}\n"
-            code_block += "\n"
-
-        if function_source.get("constants"):
-            code_block += "// Constants:\n"
-            for constant in function_source["constants"]:
-                code_block += f"{constant}\n"
-            code_block += "\n"
-
-        if function_source.get("modifiers"):
-            code_block += "// Modifiers used by main function:\n"
-            for modifier in function_source["modifiers"]:
-                code_block += f"{modifier}\n\n"
-
-        if function_source.get("structs"):
-            code_block += "// Structs:\n"
-            for struct in function_source["structs"]:
-                code_block += f"{struct}\n"
-            code_block += "\n"
-
-        if function_source.get("enums"):
-            code_block += "// Enums:\n"
-            for enum in function_source["enums"]:
-                code_block += f"{enum}\n"
-            code_block += "\n"
-
-        code_block += "// Main function:\n"
-        code_block += function_source["function"]
-
-        if function_source.get("internal_functions"):
-            code_block += "\n\n// Internal functions called:\n"
-            for internal_func in function_source["internal_functions"]:
-                if internal_func.get("docstring"):
-                    code_block += f"{internal_func['docstring']}\n"
-                code_block += f"{internal_func['body']}\n\n"
-
-        if function_source.get("parent_functions"):
-            code_block += "\n\n// Parent contract implementations (from super. calls):\n"
-            for parent_func in function_source["parent_functions"]:
-                parent_name = parent_func.get("parent_contract", "Unknown")
-                func_name = parent_func.get("function_name", "unknown")
-                code_block += f"// From {parent_name}.{func_name}():\n"
-                code_block += f"{parent_func['body']}\n\n"
-
-        if function_source.get("libraries"):
-            code_block += "\n// Libraries:\n"
-            for library in function_source["libraries"]:
-                code_block += f"{library}\n\n"
-
-        code_block += f"\n{'=' * 60}\n"
-        logger.debug(code_block)
+        parent_functions = function_source.get("parent_functions") or []
+        lines = [
+            f"✓ Extracted function code ({function_source['total_lines']} lines)",
+            f"  - Constants: {len(function_source.get('constants', []))}",
+            f"  - Modifiers: {len(function_source.get('modifiers', []))}",
+            f"  - Structs: {len(function_source['structs'])}",
+            f"  - Enums: {len(function_source['enums'])}",
+            f"  - Internal functions: {len(function_source['internal_functions'])}",
+        ]
+        if parent_functions:
+            lines.append(f"  - Parent functions (from super.): {len(parent_functions)}")
+            lines.extend(f"      └─ {pf['parent_contract']}.{pf['function_name']}()" for pf in parent_functions)
+        if function_source["truncated"]:
+            lines.append("  ⚠ Code was truncated to fit within line limit")
+        logger.debug("\n".join(lines))
 
     def _build_missing_abi_report_data(
         self,
@@ -206,8 +398,9 @@ class AnalyzerPipelinePreparationMixin:
         function_name = function_data["name"]
 
         format_key = self.selector_to_format_key.get(selector, selector)
+        is_selector_key = SELECTOR_RE.fullmatch(format_key) is not None
         abi_format_match = None
-        if not (format_key.startswith("0x") and len(format_key) == 10):
+        if not is_selector_key:
             abi_format_match = self._match_function_signature_to_abi(format_key)
 
         normalized_format_key = (
@@ -219,17 +412,14 @@ class AnalyzerPipelinePreparationMixin:
                 else format_key
             )
         )
-        selector_lower = selector.lower()
-        if format_key.startswith("0x") and len(format_key) == 10:
+        if is_selector_key:
             format_key_selector = format_key.lower()
             format_key_function_name = None
         else:
-            format_key_selector = (
-                "0x" + self.w3.keccak(text=normalized_format_key).hex()[:8] if normalized_format_key else None
-            )
+            format_key_selector = _signature_selector(normalized_format_key) if normalized_format_key else None
             format_key_function_name = format_key.split("(", 1)[0].strip() if "(" in format_key else format_key.strip()
 
-        if format_key.startswith("0x") and len(format_key) == 10:
+        if is_selector_key:
             descriptor_key_style = "legacy_selector"
         elif abi_format_match and format_key == abi_format_match.get("display_signature"):
             descriptor_key_style = "signature_with_names"
@@ -238,11 +428,16 @@ class AnalyzerPipelinePreparationMixin:
         else:
             descriptor_key_style = "signature_with_names"
 
-        erc7730_format = erc7730_data.get("display", {}).get("formats", {}).get(format_key, {})
-
-        from ...reporting.reporter import expand_erc7730_format_with_refs
-
-        erc7730_format_expanded = expand_erc7730_format_with_refs(erc7730_format, erc7730_data, format_key)
+        descriptor_formats = context.get("descriptor_formats")
+        if descriptor_formats is None:
+            descriptor_formats = erc7730_data.get("display", {}).get("formats", {})
+        erc7730_format = descriptor_formats.get(format_key, {})
+        # Expansions are shared per format key with the other selectors and the agentic descriptor tool
+        expanded_formats = context.setdefault("expanded_formats", {})
+        erc7730_format_expanded = expanded_formats.get(format_key)
+        if erc7730_format_expanded is None:
+            erc7730_format_expanded = expand_erc7730_format_with_refs(erc7730_format, erc7730_data, format_key)
+            expanded_formats[format_key] = erc7730_format_expanded
 
         source_resolution = source_resolution or {
             "match_mode": "not_found",
@@ -252,7 +447,9 @@ class AnalyzerPipelinePreparationMixin:
             "truncated": False,
         }
 
-        self._log_function_source_block(function_source)
+        # The block is logged at DEBUG, so production runs skip it (and its rendering) entirely
+        if context.get("debug_enabled", True):
+            self._log_function_source_block(function_source)
 
         audit_task = None
         if erc7730_format and abi_resolution.get("status") == "merged_abi":
@@ -272,18 +469,14 @@ class AnalyzerPipelinePreparationMixin:
                 "deployments": deployments,
                 "selector_deployment": selector_deployment,
                 "binding_checks": {
-                    "selector": selector_lower,
+                    "selector": selector,
                     "format_key": format_key,
                     "normalized_format_key": normalized_format_key,
                     "format_key_selector": format_key_selector,
                     "format_key_function_name": format_key_function_name,
-                    "format_key_matches_selector": format_key_selector == selector_lower
-                    if format_key_selector
-                    else None,
+                    "format_key_matches_selector": format_key_selector == selector if format_key_selector else None,
                     "format_key_matches_function_signature": (
-                        normalized_format_key == function_data["signature"]
-                        if not (format_key.startswith("0x") and len(format_key) == 10)
-                        else None
+                        normalized_format_key == function_data["signature"] if not is_selector_key else None
                     ),
                     "format_key_matches_function_name": (
                         format_key_function_name == function_name if format_key_function_name else None
@@ -295,7 +488,7 @@ class AnalyzerPipelinePreparationMixin:
                 descriptor_context["factory"] = factory_constraint
 
             screenshot_map = context.get("screenshot_data", {})
-            selector_screenshot_data = screenshot_map.get(selector.lower()) or None
+            selector_screenshot_data = screenshot_map.get(selector) or None
 
             audit_task = prepare_audit_task(
                 selector=selector,
@@ -313,8 +506,10 @@ class AnalyzerPipelinePreparationMixin:
                 analysis_mode=self.analysis_mode,
                 tool_context={
                     "abi": context["abi"],
+                    "abi_helper": self.abi_helper,
                     "deployments": deployments,
                     "erc7730_data": erc7730_data,
+                    "expanded_formats": expanded_formats,
                     "extracted_codes": self.extracted_codes,
                     "source_extractor": self.source_extractor,
                     "selector_sources": self.selector_sources,
@@ -344,6 +539,20 @@ class AnalyzerPipelinePreparationMixin:
             "synthetic_report_data": synthetic_report_data,
         }
 
+    def _stream_audit_task(self, context: dict[str, Any], prepared_selectors: list[dict[str, Any]]) -> None:
+        """Start the audit for the most recently prepared selector while the next one is prepared."""
+        audit_task = prepared_selectors[-1]["audit_task"]
+        if audit_task is None:
+            return
+        stream = context.get("audit_stream")
+        if stream is None:
+            stream = context["audit_stream"] = AuditTaskStream(
+                max_concurrent=self.max_concurrent_api_calls, max_retries=self.max_api_retries
+            )
+            context["streamed_task_indices"] = []
+        stream.submit(audit_task)
+        context["streamed_task_indices"].append(len(prepared_selectors) - 1)
+
     def _prepare_selector_audit_tasks(self, context: dict[str, Any]) -> None:
         """Prepare decoded tx samples, source snippets, and audit payload tasks."""
         selectors = context["selectors"]
@@ -353,47 +562,60 @@ class AnalyzerPipelinePreparationMixin:
         erc7730_data = context["erc7730_data"]
         selector_abi_resolution = context.get("selector_abi_resolution", {})
         selector_function_data = context.get("selector_function_data", {})
+        # Bind logger methods once; the per-selector loop below calls them many times
+        _debug = logger.debug
+        _info = logger.info
+        _warn = logger.warning
         # ====================================================================
         # PHASE 1: PRE-PROCESSING (Sequential - maintains log coherence)
         # ====================================================================
         # Prepare all data and audit tasks before making any API calls.
         # This keeps the preparation logs in order and allows batch API calls.
 
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"PHASE 1: Preparing audit tasks for {len(selectors)} selectors...")
-        logger.info(f"{'=' * 60}")
+        _info(f"\n{'=' * 60}")
+        _info(f"PHASE 1: Preparing audit tasks for {len(selectors)} selectors...")
+        _info(f"{'=' * 60}")
+
+        # Resolve the DEBUG gate and the descriptor's format table once per run instead of once per selector
+        debug_enabled = context["debug_enabled"] = logger.isEnabledFor(logging.DEBUG)
+        descriptor_formats = context["descriptor_formats"] = erc7730_data.get("display", {}).get("formats", {})
+
+        # Receipt I/O for every selector proceeds in the background while the loop below works through them
+        prefetched_receipts = self._prefetch_transaction_receipts(context)
 
         # Store prepared data for each selector
         prepared_selectors = []  # List of dicts with all pre-processed data
+        # Identical calldata (repeated approvals, keeper calls, ...) decodes to the same parameters, so each
+        # distinct input is decoded and truncated once per run. The cleaned dicts are shared read-only.
+        decoded_inputs: dict[str, dict[str, Any] | None] = {}
 
         for selector in selectors:
-            logger.info(f"Preparing selector: {selector}")
+            _info(f"Preparing selector: {selector}")
 
             # Get function metadata
-            function_data = selector_function_data.get(selector.lower())
-            abi_resolution = selector_abi_resolution.get(selector.lower())
+            function_data = selector_function_data.get(selector)
+            abi_resolution = selector_abi_resolution.get(selector)
             if function_data is None or abi_resolution is None:
                 function_data, abi_resolution = self._resolve_function_data_with_abi_status(selector)
             if not function_data:
-                logger.warning(f"Skipping selector {selector} - no matching ABI entry")
+                _warn(f"Skipping selector {selector} - no matching ABI entry")
                 continue
 
             function_name = function_data["name"]
-            logger.debug(f"Function name: {function_name}")
-            logger.debug(f"Function signature: {function_data['signature']}")
+            function_signature = function_data["signature"]
+            _debug(f"Function name: {function_name}")
+            _debug(f"Function signature: {function_signature}")
 
             if abi_resolution.get("status") != "merged_abi":
-                logger.warning(
+                _warn(
                     "Skipping tx/source/AI for %s because it was not found in the merged ABI",
                     selector,
                 )
-                selector_deployment = deployment_per_selector.get(selector.lower(), default_deployment)
+                selector_deployment = deployment_per_selector.get(selector, default_deployment)
                 synthetic_report_data = self._build_missing_abi_report_data(
                     selector=selector,
-                    function_signature=function_data["signature"],
-                    erc7730_format=erc7730_data.get("display", {})
-                    .get("formats", {})
-                    .get(self.selector_to_format_key.get(selector, selector), {}),
+                    function_signature=function_signature,
+                    erc7730_format=descriptor_formats.get(self.selector_to_format_key.get(selector, selector), {}),
                     abi_resolution=abi_resolution,
                     format_key=self.selector_to_format_key.get(selector, selector),
                 )
@@ -419,35 +641,28 @@ class AnalyzerPipelinePreparationMixin:
                 continue
 
             # Get the pre-fetched transactions for this selector
-            transactions = all_selector_txs.get(selector.lower(), [])
+            transactions = all_selector_txs.get(selector, [])
 
             # Get the deployment used for this selector (for chain_id and contract_address)
-            selector_deployment = deployment_per_selector.get(selector.lower(), default_deployment)
+            selector_deployment = deployment_per_selector.get(selector, default_deployment)
+            deployment_chain_id = selector_deployment["chainId"]
 
             if not transactions:
-                logger.warning(f"No transactions found for selector {selector} - will perform static analysis only")
+                _warn(f"No transactions found for selector {selector} - will perform static analysis only")
             else:
-                logger.debug(
-                    f"Found {len(transactions)} transactions for selector {selector} on chain {selector_deployment['chainId']}"
-                )
+                _debug(f"Found {len(transactions)} transactions for selector {selector} on chain {deployment_chain_id}")
 
             # Decode each transaction
-            decoded_txs = []
+            decoded_entries = []
             for i, tx in enumerate(transactions, 1):
-                logger.debug(f"\nTransaction {i}/{len(transactions)}: {tx['hash']}")
-
-                decoded = self.tx_fetcher.decode_transaction_input(tx["input"], function_data, self.abi_helper)
-                if decoded is not None:
-                    # Extract _raw_fallback before truncation (keep it intact for AI)
-                    raw_fallback = decoded.pop("_raw_fallback", None)
-
-                    # Truncate large byte arrays to reduce token usage
-                    decoded_clean = truncate_byte_arrays(decoded, max_bytes_length=100)
-
-                    # Re-add raw fallback if it existed (untruncated)
-                    if raw_fallback:
-                        decoded_clean["_raw_fallback"] = raw_fallback
-
+                if debug_enabled:
+                    _debug(f"\nTransaction {i}/{len(transactions)}: {tx['hash']}")
+
+                tx_input = tx["input"]
+                decoded_clean = decoded_inputs.get(tx_input, _NOT_DECODED)
+                if decoded_clean is _NOT_DECODED:
+                    decoded_clean = decoded_inputs[tx_input] = self._decode_and_truncate_input(tx_input, function_data)
+                if decoded_clean is not None:
                     tx_data = {
                         "hash": tx["hash"],
                         "block": tx["blockNumber"],
@@ -457,47 +672,50 @@ class AnalyzerPipelinePreparationMixin:
                         "value": tx["value"],
                         "decoded_input": decoded_clean,
                     }
+                    decoded_entries.append((tx_data, decoded_clean))
+
+            # Receipts are independent lookups: fetch them together, then decode logs locally.
+            # View/pure functions cannot emit events, so their receipts would carry no logs.
+            if function_data.get("stateMutability") in _LOG_FREE_MUTABILITIES:
+                _debug(f"Skipping receipt fetch for {selector} ({function_data['stateMutability']} function)")
+                receipts = [None] * len(decoded_entries)
+            else:
+                receipts = self._fetch_transaction_receipts(
+                    [tx_data["hash"] for tx_data, _ in decoded_entries], deployment_chain_id, prefetched_receipts
+                )
+                self._prefetch_token_metadata(receipts, deployment_chain_id)
+            decoded_txs = []
+            for (tx_data, decoded_clean), receipt in zip(decoded_entries, receipts, strict=True):
+                if receipt and receipt.get("logs"):
+                    decoded_logs = []
+                    for log in receipt["logs"]:
+                        decoded_log = self.tx_fetcher.decode_log_event(log, deployment_chain_id)
+                        if decoded_log:
+                            decoded_logs.append(decoded_log)
+
+                    if decoded_logs:
+                        tx_data["receipt_logs"] = decoded_logs
+                    # Per-log and per-parameter lines are only rendered when DEBUG is on
+                    if decoded_logs and debug_enabled:
+                        _debug(f"Decoded {len(decoded_logs)} log events:")
+                        for log in decoded_logs:
+                            if log.get("event") == "Transfer":
+                                _debug(
+                                    f"  Transfer: {log['value_formatted']} from {log['from'][:10]}... to {log['to'][:10]}..."
+                                )
+                            elif log.get("event") == "Approval":
+                                _debug(
+                                    f"  Approval: {log['value_formatted']} from {log['owner'][:10]}... to {log['spender'][:10]}..."
+                                )
+                            else:
+                                _debug(f"  {log.get('event', 'Unknown')}: {log.get('address', 'unknown')[:10]}...")
+
+                decoded_txs.append(tx_data)
 
-                    # Fetch transaction receipt and decode logs
-                    # Only fetch receipt if we have a valid transaction hash (starts with 0x and is 66 chars)
-                    tx_hash = tx.get("hash", "")
-                    if tx_hash.startswith("0x") and len(tx_hash) == 66:
-                        logger.debug(f"Fetching receipt for transaction {tx_hash}")
-                        receipt = self.tx_fetcher.fetch_transaction_receipt(tx_hash, selector_deployment["chainId"])
-                    else:
-                        logger.debug(f"Skipping receipt fetch for transaction {tx_hash} (not a valid TX hash)")
-                        receipt = None
-
-                    if receipt and receipt.get("logs"):
-                        decoded_logs = []
-                        for log in receipt["logs"]:
-                            decoded_log = self.tx_fetcher.decode_log_event(log, selector_deployment["chainId"])
-                            if decoded_log:
-                                decoded_logs.append(decoded_log)
-
-                        if decoded_logs:
-                            tx_data["receipt_logs"] = decoded_logs
-                            logger.debug(f"Decoded {len(decoded_logs)} log events:")
-                            for log in decoded_logs:
-                                if log.get("event") == "Transfer":
-                                    logger.debug(
-                                        f"  Transfer: {log['value_formatted']} from {log['from'][:10]}... to {log['to'][:10]}..."
-                                    )
-                                elif log.get("event") == "Approval":
-                                    logger.debug(
-                                        f"  Approval: {log['value_formatted']} from {log['owner'][:10]}... to {log['spender'][:10]}..."
-                                    )
-                                else:
-                                    logger.debug(
-                                        f"  {log.get('event', 'Unknown')}: {log.get('address', 'unknown')[:10]}..."
-                                    )
-
-                    decoded_txs.append(tx_data)
-                    time.sleep(0.2)
-
-                    logger.debug("Decoded parameters:")
+                if debug_enabled:
+                    _debug("Decoded parameters:")
                     for param_name, param_value in decoded_clean.items():
-                        logger.debug(f"  {param_name}: {param_value}")
+                        _debug(f"  {param_name}: {param_value}")
 
             # Extract source code for this specific function (search across all deployments)
             function_source = None
@@ -509,12 +727,12 @@ class AnalyzerPipelinePreparationMixin:
                 "truncated": False,
             }
             if self.extracted_codes:
-                logger.debug(
-                    f"Searching for function '{function_name}' ({function_data['signature']}) across {len(self.extracted_codes)} contract(s)..."
+                _debug(
+                    f"Searching for function '{function_name}' ({function_signature}) across {len(self.extracted_codes)} contract(s)..."
                 )
 
                 # PHASE 1: Search ALL contracts for EXACT SELECTOR match first
-                logger.debug(
+                _debug(
                     f"  Phase 1: Searching for exact selector match across all {len(self.extracted_codes)} contracts..."
                 )
                 for _deployment_key, extracted_code in self.extracted_codes.items():
@@ -523,22 +741,22 @@ class AnalyzerPipelinePreparationMixin:
 
                     chain_id = extracted_code["chain_id"]
                     address = extracted_code["address"]
-                    logger.debug(f"  Checking {address} on chain {chain_id} (selector only)...")
+                    _debug(f"  Checking {address} on chain {chain_id} (selector only)...")
 
                     # Log what we know about this selector's mapping
                     if selector in self.selector_sources:
                         sources = self.selector_sources[selector]
                         source_chains = [s.get("chain_id") for s in sources]
-                        logger.debug(f"    Selector {selector} is mapped to chains: {source_chains}")
+                        _debug(f"    Selector {selector} is mapped to chains: {source_chains}")
                         if chain_id not in source_chains:
-                            logger.debug(f"    → Skipping chain {chain_id} (selector not on this chain)")
+                            _debug(f"    → Skipping chain {chain_id} (selector not on this chain)")
                             continue
 
                     # Try to find by EXACT SELECTOR only (no name fallback)
                     function_source = self.source_extractor.get_function_with_dependencies(
                         function_name,
                         extracted_code,
-                        function_signature=function_data["signature"],
+                        function_signature=function_signature,
                         max_lines=1000,
                         selector_only=True,  # Only match by exact selector, skip name matching
                         selector=selector,  # Pass selector for Diamond proxy facet-specific lookup
@@ -552,37 +770,22 @@ class AnalyzerPipelinePreparationMixin:
                             "selector_mapped": selector in self.selector_sources,
                             "truncated": bool(function_source.get("truncated")),
                         }
-                        logger.debug(f"✓ Found EXACT SELECTOR MATCH at {address} on chain {chain_id}!")
-                        logger.debug(f"✓ Extracted function code ({function_source['total_lines']} lines)")
-                        logger.debug(f"  - Constants: {len(function_source.get('constants', []))}")
-                        logger.debug(f"  - Modifiers: {len(function_source.get('modifiers', []))}")
-                        logger.debug(f"  - Structs: {len(function_source['structs'])}")
-                        logger.debug(f"  - Enums: {len(function_source['enums'])}")
-                        logger.debug(f"  - Internal functions: {len(function_source['internal_functions'])}")
-                        if function_source.get("parent_functions"):
-                            logger.debug(
-                                f"  - Parent functions (from super.): {len(function_source['parent_functions'])}"
-                            )
-                            for pf in function_source["parent_functions"]:
-                                logger.debug(f"      └─ {pf['parent_contract']}.{pf['function_name']}()")
-                        if function_source["truncated"]:
-                            logger.debug("  ⚠ Code was truncated to fit within line limit")
+                        _debug(f"✓ Found EXACT SELECTOR MATCH at {address} on chain {chain_id}!")
+                        self._log_function_source_summary(function_source)
                         break  # Stop searching - found exact selector match!
 
                 # PHASE 2: If no exact selector match found, try NAME-based matching in first contract
                 if not function_source or not function_source.get("function"):
-                    logger.debug(
+                    _debug(
                         "  Phase 2: No exact selector match found. Trying name-based matching with inheritance in first contract..."
                     )
 
                     # IMPORTANT: Check if this selector is in any facet ABI
                     # If not, the ERC-7730 may refer to an old version that has been upgraded
                     if selector not in self.selector_sources:
-                        logger.warning(f"  ⚠️  SELECTOR MISMATCH: {selector} is NOT in any facet ABI!")
-                        logger.warning("  ⚠️  The ERC-7730 may refer to an OLD function version that has been upgraded.")
-                        logger.warning(
-                            "  ⚠️  Name-based matching may find a DIFFERENT version with different parameters!"
-                        )
+                        _warn(f"  ⚠️  SELECTOR MISMATCH: {selector} is NOT in any facet ABI!")
+                        _warn("  ⚠️  The ERC-7730 may refer to an OLD function version that has been upgraded.")
+                        _warn("  ⚠️  Name-based matching may find a DIFFERENT version with different parameters!")
 
                     # Get extracted_code from a chain where the selector IS mapped
                     # This is critical for Diamond proxies - the selector may only exist on certain chains
@@ -594,7 +797,7 @@ class AnalyzerPipelinePreparationMixin:
                         for _deployment_key, extracted_code in self.extracted_codes.items():
                             if extracted_code["source_code"] and extracted_code.get("chain_id") in mapped_chains:
                                 first_extracted_code = extracted_code
-                                logger.debug(
+                                _debug(
                                     f"  Using extracted_code from chain {extracted_code.get('chain_id')} where selector is mapped"
                                 )
                                 break
@@ -609,12 +812,12 @@ class AnalyzerPipelinePreparationMixin:
                     if first_extracted_code:
                         chain_id = first_extracted_code["chain_id"]
                         address = first_extracted_code["address"]
-                        logger.debug(f"  Checking {address} on chain {chain_id} (with name fallback)...")
+                        _debug(f"  Checking {address} on chain {chain_id} (with name fallback)...")
 
                         function_source = self.source_extractor.get_function_with_dependencies(
                             function_name,
                             first_extracted_code,
-                            function_signature=function_data["signature"],
+                            function_signature=function_signature,
                             max_lines=1000,
                             selector_only=False,  # Allow name-based fallback with inheritance
                             selector=selector,  # Pass selector for Diamond proxy facet-specific lookup
@@ -628,26 +831,11 @@ class AnalyzerPipelinePreparationMixin:
                                 "selector_mapped": selector in self.selector_sources,
                                 "truncated": bool(function_source.get("truncated")),
                             }
-                            logger.debug(f"✓ Found by name (with inheritance) at {address} on chain {chain_id}")
-                            logger.debug(f"✓ Extracted function code ({function_source['total_lines']} lines)")
-                            logger.debug(f"  - Constants: {len(function_source.get('constants', []))}")
-                            logger.debug(f"  - Modifiers: {len(function_source.get('modifiers', []))}")
-                            logger.debug(f"  - Structs: {len(function_source['structs'])}")
-                            logger.debug(f"  - Enums: {len(function_source['enums'])}")
-                            logger.debug(f"  - Internal functions: {len(function_source['internal_functions'])}")
-                            if function_source.get("parent_functions"):
-                                logger.debug(
-                                    f"  - Parent functions (from super.): {len(function_source['parent_functions'])}"
-                                )
-                                for pf in function_source["parent_functions"]:
-                                    logger.debug(f"      └─ {pf['parent_contract']}.{pf['function_name']}()")
-                            if function_source["truncated"]:
-                                logger.debug("  ⚠ Code was truncated to fit within line limit")
+                            _debug(f"✓ Found by name (with inheritance) at {address} on chain {chain_id}")
+                            self._log_function_source_summary(function_source)
 
                 if not function_source or not function_source.get("function"):
-                    logger.warning(
-                        f"Function '{function_name}' not found in any of the {len(self.extracted_codes)} contract(s)"
-                    )
+                    _warn(f"Function '{function_name}' not found in any of the {len(self.extracted_codes)} contract(s)")
 
             prepared_selectors.append(
                 self._build_selector_task_entry(
@@ -662,10 +850,11 @@ class AnalyzerPipelinePreparationMixin:
                     synthetic_report_data=None,
                 )
             )
+            self._stream_audit_task(context, prepared_selectors)
 
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"PHASE 1 COMPLETE: Prepared {len(prepared_selectors)} audit tasks")
-        logger.info(f"{'=' * 60}")
+        _info(f"\n{'=' * 60}")
+        _info(f"PHASE 1 COMPLETE: Prepared {len(prepared_selectors)} audit tasks")
+        _info(f"{'=' * 60}")
         context["prepared_selectors"] = prepared_selectors
 
     def _prepare_selector_audit_tasks_from_prepared_inputs(self, context: dict[str, Any]) -> None:
@@ -674,6 +863,10 @@ class AnalyzerPipelinePreparationMixin:
         deployments = context["deployments"]
         erc7730_data = context["erc7730_data"]
         prepared_inputs_data = context.get("prepared_inputs_data") or {}
+        # Bind logger methods once; the per-selector loop below calls them many times
+        _debug = logger.debug
+        _info = logger.info
+        _warn = logger.warning
         default_deployment = (
             deployments[0]
             if deployments
@@ -732,17 +925,19 @@ class AnalyzerPipelinePreparationMixin:
         if prepared_inputs_data.get("protocol_name"):
             self.protocol_name = prepared_inputs_data["protocol_name"]
 
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"PHASE 1: Preparing audit tasks for {len(selectors)} selectors from prepared benchmark inputs...")
-        logger.info(f"{'=' * 60}")
-        logger.debug(f"Loaded {len(self.extracted_codes)} cached source packet(s) from prepared benchmark inputs")
+        _info(f"\n{'=' * 60}")
+        _info(f"PHASE 1: Preparing audit tasks for {len(selectors)} selectors from prepared benchmark inputs...")
+        _info(f"{'=' * 60}")
+        _debug(f"Loaded {len(self.extracted_codes)} cached source packet(s) from prepared benchmark inputs")
 
+        context["debug_enabled"] = logger.isEnabledFor(logging.DEBUG)
+        descriptor_formats = context["descriptor_formats"] = erc7730_data.get("display", {}).get("formats", {})
         prepared_selectors = []
         for selector in selectors:
-            logger.info(f"Preparing selector from frozen inputs: {selector}")
+            _info(f"Preparing selector from frozen inputs: {selector}")
 
-            function_data = selector_function_data.get(selector.lower())
-            abi_resolution = selector_abi_resolution.get(selector.lower())
+            function_data = selector_function_data.get(selector)
+            abi_resolution = selector_abi_resolution.get(selector)
             if function_data is None or abi_resolution is None:
                 function_data, abi_resolution = self._resolve_function_data_with_abi_status(selector)
             if not function_data:
@@ -754,31 +949,27 @@ class AnalyzerPipelinePreparationMixin:
                 if function_data:
                     abi_resolution = {
                         "status": "descriptor_fallback",
-                        "selector": selector.lower(),
+                        "selector": selector,
                         "format_key": format_key,
                         "selector_found_in_merged_abi": False,
                         "error": (
-                            f"Selector {selector.lower()} was not found in the merged ABI. "
+                            f"Selector {selector} was not found in the merged ABI. "
                             f"The analyzer used descriptor-derived fallback metadata from "
                             f"'{format_key}' instead."
                         ),
                     }
-                    logger.debug(
-                        f"Using descriptor-derived function metadata for {selector}: {function_data['signature']}"
-                    )
+                    _debug(f"Using descriptor-derived function metadata for {selector}: {function_data['signature']}")
                 else:
-                    logger.warning(f"Skipping selector {selector} - no matching ABI entry or descriptor fallback")
+                    _warn(f"Skipping selector {selector} - no matching ABI entry or descriptor fallback")
                     continue
 
             function_name = function_data["name"]
-            logger.debug(f"Function name: {function_name}")
-            logger.debug(f"Function signature: {function_data['signature']}")
+            _debug(f"Function name: {function_name}")
+            _debug(f"Function signature: {function_data['signature']}")
 
-            selector_inputs = (
-                prepared_selector_inputs.get(selector) or prepared_selector_inputs.get(selector.lower()) or {}
-            )
+            selector_inputs = prepared_selector_inputs.get(selector) or {}
             if not selector_inputs:
-                logger.warning(f"No frozen selector inputs found for {selector} - continuing with static-only context")
+                _warn(f"No frozen selector inputs found for {selector} - continuing with static-only context")
 
             selector_deployment = selector_inputs.get("selector_deployment") or default_deployment
             decoded_txs = selector_inputs.get("decoded_transactions") or selector_inputs.get("decoded_txs") or []
@@ -793,7 +984,7 @@ class AnalyzerPipelinePreparationMixin:
 
             synthetic_report_data = None
             if abi_resolution.get("status") != "merged_abi":
-                logger.warning(
+                _warn(
                     "Skipping cached tx/source/AI for %s because it was not found in the merged ABI",
                     selector,
                 )
@@ -809,14 +1000,12 @@ class AnalyzerPipelinePreparationMixin:
                 synthetic_report_data = self._build_missing_abi_report_data(
                     selector=selector,
                     function_signature=function_data["signature"],
-                    erc7730_format=erc7730_data.get("display", {})
-                    .get("formats", {})
-                    .get(self.selector_to_format_key.get(selector, selector), {}),
+                    erc7730_format=descriptor_formats.get(self.selector_to_format_key.get(selector, selector), {}),
                     abi_resolution=abi_resolution,
                     format_key=self.selector_to_format_key.get(selector, selector),
                 )
 
-            logger.debug(
+            _debug(
                 f"Loaded {len(decoded_txs)} decoded transaction(s) and "
                 f"{'found' if function_source else 'did not find'} cached source context for {selector}"
             )
@@ -835,7 +1024,7 @@ class AnalyzerPipelinePreparationMixin:
                 )
             )
 
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"PHASE 1 COMPLETE: Prepared {len(prepared_selectors)} audit tasks from frozen benchmark inputs")
-        logger.info(f"{'=' * 60}")
+        _info(f"\n{'=' * 60}")
+        _info(f"PHASE 1 COMPLETE: Prepared {len(prepared_selectors)} audit tasks from frozen benchmark inputs")
+        _info(f"{'=' * 60}")
         context["prepared_selectors"] = prepared_selectors
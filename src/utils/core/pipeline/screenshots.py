@@ -79,6 +79,7 @@ class AnalyzerPipelineScreenshotsMixin:
             cs_tester_root=getattr(self, "cs_tester_root", None),
             coin_apps_path=getattr(self, "coin_apps_path", None),
             device=getattr(self, "screenshot_device", "stax"),
+            session=self._session,
         )
 
         if not runner.is_available():
@@ -117,11 +118,11 @@ class AnalyzerPipelineScreenshotsMixin:
         # Build work items for all selectors that have transactions
         selectors_info = []
         for selector in selectors:
-            txs = all_selector_txs.get(selector.lower(), [])
+            txs = all_selector_txs.get(selector, [])
             if not txs:
                 logger.info("[SCREENSHOTS][%s] No transactions — skipping", selector)
                 continue
-            deployment = deployment_per_selector.get(selector.lower(), default_deployment)
+            deployment = deployment_per_selector.get(selector, default_deployment)
             selectors_info.append(
                 {
                     "selector": selector,
@@ -1,12 +1,16 @@
 """Pipeline stage: descriptor/ABI loading and selector setup."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from ... import fast_json
 from ...abi import ABI, fetch_contract_abi, fetch_single_contract_abi
 from ...abi.merger import ABIMerger, merge_abis_from_deployments
+from ...disk_cache import JsonFileCache
+
+# Proxies can be upgraded, so cached deployment ABIs are refreshed after a week
+ABI_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +66,7 @@ class AnalyzerPipelineSetupMixin:
         if prepared_inputs_file and prepared_inputs_file.exists() and prepared_inputs_file.is_file():
             logger.info(f"Loading prepared benchmark inputs from {prepared_inputs_file}")
             try:
-                with open(prepared_inputs_file, encoding="utf-8") as f:
-                    prepared_inputs_data = json.load(f)
+                prepared_inputs_data = fast_json.loads(prepared_inputs_file.read_bytes())
                 if not isinstance(prepared_inputs_data, dict):
                     raise ValueError("prepared inputs file must contain a JSON object")
             except Exception as exc:
@@ -115,8 +118,7 @@ class AnalyzerPipelineSetupMixin:
             # Try loading from ABI file if provided and valid
             logger.info(f"Loading ABI from file: {abi_file}")
             try:
-                with open(abi_file) as f:
-                    abi = json.load(f)
+                abi = fast_json.loads(abi_file.read_bytes())
                 logger.info(f"Successfully loaded ABI from file ({len(abi)} entries)")
             except Exception as e:
                 logger.warning(f"Failed to load ABI from file: {e}")
@@ -135,8 +137,30 @@ class AnalyzerPipelineSetupMixin:
         if not abi or not isinstance(abi, list) or len(abi) == 0:
             logger.info("No ABI from ERC-7730 file or ABI file, fetching from API...")
             # Fetch and merge ABIs from all deployments
+            abi_cache = JsonFileCache("abi", ttl_seconds=ABI_CACHE_TTL_SECONDS)
+
+            def fetch_deployment_abi(address: str, chain_id: int, api_key: str):
+                cache_key = f"{chain_id}_{address.lower()}"
+                cached = abi_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Using cached ABI for {address} on chain {chain_id}")
+                    return cached["abi"], cached["selector_sources"], cached["is_diamond"]
+
+                fetched_abi, fetched_sources, is_diamond = fetch_contract_abi(
+                    address, chain_id, api_key, session=self._session
+                )
+                if fetched_abi:
+                    abi_cache.put(
+                        cache_key,
+                        {"abi": fetched_abi, "selector_sources": fetched_sources, "is_diamond": is_diamond},
+                    )
+                return fetched_abi, fetched_sources, is_diamond
+
             abi, _fetch_results, selector_sources = merge_abis_from_deployments(
-                deployments, fetch_contract_abi, self.etherscan_api_key
+                deployments,
+                fetch_deployment_abi,
+                self.etherscan_api_key,
+                executor=self._io_executor,
             )
             # Store selector sources for efficient Diamond proxy source extraction
             self.selector_sources = selector_sources
@@ -174,12 +198,24 @@ class AnalyzerPipelineSetupMixin:
 
             merger = ABIMerger()
 
-            for deployment in deployments:
+            # Probe all deployments concurrently; results are consumed in deployment order below
+            diamond_probes = [
+                self._io_executor.submit(
+                    detect_diamond_abi,
+                    deployment.get("address", ""),
+                    deployment.get("chainId", 1),
+                    self.etherscan_api_key,
+                    session=self._session,
+                )
+                for deployment in deployments
+            ]
+
+            for deployment, diamond_probe in zip(deployments, diamond_probes, strict=True):
                 dep_address = deployment.get("address", "")
                 dep_chain_id = deployment.get("chainId", 1)
 
                 logger.info(f"Checking {dep_address} on chain {dep_chain_id} for Diamond proxy...")
-                facet_addresses = detect_diamond_abi(dep_address, dep_chain_id, self.etherscan_api_key)
+                facet_addresses = diamond_probe.result()
 
                 if facet_addresses:
                     logger.info(f"✓ Diamond proxy detected on chain {dep_chain_id} with {len(facet_addresses)} facets")
@@ -191,9 +227,19 @@ class AnalyzerPipelineSetupMixin:
                     success_count = 0
                     fail_count = 0
                     total_functions = 0
-                    for facet_addr in facet_addresses:
+                    facet_fetches = [
+                        self._io_executor.submit(
+                            fetch_single_contract_abi,
+                            facet_addr,
+                            dep_chain_id,
+                            self.etherscan_api_key,
+                            session=self._session,
+                        )
+                        for facet_addr in facet_addresses
+                    ]
+                    for facet_addr, facet_fetch in zip(facet_addresses, facet_fetches, strict=True):
                         try:
-                            facet_abi = fetch_single_contract_abi(facet_addr, dep_chain_id, self.etherscan_api_key)
+                            facet_abi = facet_fetch.result()
                             if facet_abi:
                                 func_count = len([item for item in facet_abi if item.get("type") == "function"])
                                 merger.add_abi(facet_abi, dep_chain_id, facet_addr, source_kind="facet")
@@ -233,14 +279,25 @@ class AnalyzerPipelineSetupMixin:
             missing_selectors = [s for s in selectors if s not in self.selector_sources]
             if missing_selectors and self.source_extractor:
                 logger.info(f"Attempting facetAddress() fallback for {len(missing_selectors)} unmapped selectors...")
-                for deployment in deployments:
-                    dep_address = deployment.get("address", "")
+                # Query every deployment at once; earlier deployments still win when merging below
+                facet_lookups = [
+                    self._io_executor.submit(
+                        self.source_extractor.detect_diamond_proxy,
+                        deployment.get("address", ""),
+                        deployment.get("chainId", 1),
+                        missing_selectors,
+                    )
+                    for deployment in deployments
+                ]
+                for position, (deployment, facet_lookup) in enumerate(zip(deployments, facet_lookups, strict=True)):
                     dep_chain_id = deployment.get("chainId", 1)
 
                     # Use source_code.py's detect_diamond_proxy which calls facetAddress(selector)
-                    facet_mapping = self.source_extractor.detect_diamond_proxy(
-                        dep_address, dep_chain_id, missing_selectors
-                    )
+                    try:
+                        facet_mapping = facet_lookup.result()
+                    except Exception as e:
+                        logger.warning(f"  facetAddress() fallback failed on chain {dep_chain_id}: {e}")
+                        continue
 
                     if facet_mapping and "_is_diamond_but_unmapped" not in facet_mapping:
                         for selector, facet_addr in facet_mapping.items():
@@ -259,6 +316,8 @@ class AnalyzerPipelineSetupMixin:
                         # Update missing list
                         missing_selectors = [s for s in selectors if s not in self.selector_sources]
                         if not missing_selectors:
+                            for pending in facet_lookups[position + 1 :]:
+                                pending.cancel()
                             break
 
                 if missing_selectors:
@@ -267,14 +326,17 @@ class AnalyzerPipelineSetupMixin:
         selector_abi_resolution = {}
         selector_function_data = {}
         abi_backed_selectors = []
+        payable_selectors = set()
         descriptor_fallback_selectors = []
         for selector in selectors:
             function_data, abi_resolution = self._resolve_function_data_with_abi_status(selector)
-            selector_abi_resolution[selector.lower()] = abi_resolution
+            selector_abi_resolution[selector] = abi_resolution
             if function_data:
-                selector_function_data[selector.lower()] = function_data
+                selector_function_data[selector] = function_data
             if abi_resolution.get("status") == "merged_abi":
                 abi_backed_selectors.append(selector)
+                if function_data and function_data.get("stateMutability") == "payable":
+                    payable_selectors.add(selector)
             else:
                 descriptor_fallback_selectors.append(selector)
 
@@ -302,11 +364,14 @@ class AnalyzerPipelineSetupMixin:
         return {
             "erc7730_data": erc7730_data,
             "deployments": deployments,
+            # (address, chainId) pairs, built once for the per-deployment on-chain queries
+            "deployment_targets": [(deployment["address"], deployment["chainId"]) for deployment in deployments],
             "abi": abi,
             "selectors": selectors,
             "abi_backed_selectors": abi_backed_selectors,
             "selector_abi_resolution": selector_abi_resolution,
             "selector_function_data": selector_function_data,
+            "payable_selectors": frozenset(payable_selectors),
             "results": results,
             "prepared_inputs_data": prepared_inputs_data,
         }
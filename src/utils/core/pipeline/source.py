@@ -1,12 +1,71 @@
 """Pipeline stage: source extraction and ERC context enrichment."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..detection_cache import source_digest
+
 logger = logging.getLogger(__name__)
 
+# Deployments are independent Etherscan lookups; cap how many run at once
+SOURCE_EXTRACTION_WORKERS = 4
+
 
 class AnalyzerPipelineSourceMixin:
+    def _start_source_extraction(self, context: dict[str, Any]) -> None:
+        """
+        Schedule source extraction for every distinct deployment without waiting for it.
+
+        Extraction only needs the selectors and provenance resolved during setup, so the workflow
+        starts it before collecting transactions and capturing screenshots; the explorer round
+        trips then overlap those stages. ``_extract_source_and_context`` consumes the futures.
+        """
+        deployments = context["deployments"]
+        selectors = context.get("abi_backed_selectors") or context["selectors"]
+        if not (self.enable_source_code and self.source_extractor and deployments and selectors):
+            return
+        if "source_extraction" in context:
+            return
+
+        # Clear cache to ensure fresh extraction with current selector_sources
+        self.source_extractor.clear_cache()
+
+        # Track which (chain_id, address) pairs we've already scheduled to avoid duplicates
+        extraction_targets: list[tuple[int, str]] = []
+        for deployment in deployments:
+            contract_key = (deployment["chainId"], deployment["address"].lower())  # Normalize to lowercase
+            if contract_key in extraction_targets:
+                logger.info(f"Skipping {contract_key[1]} on chain {contract_key[0]} - already extracted")
+                continue
+            extraction_targets.append(contract_key)
+
+        # Log selector_sources state for debugging
+        if self.selector_sources:
+            # Show a few sample mappings
+            sample_sels = list(self.selector_sources.keys())[:3]
+            logger.info(f"  Using {len(self.selector_sources)} selector provenance entries (sample: {sample_sels})")
+        else:
+            logger.warning("  No selector_sources available - Diamond detection may have failed")
+
+        def extract(chain_id: int, address: str) -> dict[str, Any]:
+            logger.info(f"\n📦 Extracting from chain {chain_id} at {address}")
+            return self.source_extractor.extract_contract_code(
+                address,
+                chain_id,
+                selectors=selectors,
+                selector_sources=self.selector_sources,  # Pass selector provenance for efficient Diamond extraction
+            )
+
+        # Chains are independent, so fetch them concurrently; results are consumed in deployment order.
+        # Shutting down without waiting lets the queued extractions finish in the background.
+        workers = min(SOURCE_EXTRACTION_WORKERS, len(extraction_targets))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source-extract")
+        futures = [executor.submit(extract, chain_id, address) for chain_id, address in extraction_targets]
+        executor.shutdown(wait=False)
+        context["source_extraction"] = list(zip(extraction_targets, futures, strict=True))
+        logger.info(f"Started source code extraction for {len(extraction_targets)} deployment(s) in the background")
+
     def _extract_source_and_context(self, context: dict[str, Any]) -> None:
         """Extract source code and build ERC4626/ERC20 context when possible."""
         deployments = context["deployments"]
@@ -23,46 +82,20 @@ class AnalyzerPipelineSourceMixin:
                 self.extracted_codes = {}
                 return
 
-            # Clear cache to ensure fresh extraction with current selector_sources
-            self.source_extractor.clear_cache()
-
-            # Track which (chain_id, address) pairs we've already extracted to avoid duplicates
-            extracted_contracts = set()
-
-            for deployment in deployments:
-                chain_id = deployment["chainId"]
-                address = deployment["address"].lower()  # Normalize to lowercase
-
-                # Skip if we already extracted this specific contract
-                contract_key = (chain_id, address)
-                if contract_key in extracted_contracts:
-                    logger.info(f"Skipping {address} on chain {chain_id} - already extracted")
+            # Reuse extractions started by the workflow, or run them now when called on its own
+            self._start_source_extraction(context)
+            for (chain_id, address), future in context.pop("source_extraction", ()):
+                try:
+                    extracted_code = future.result()
+                except Exception as exc:
+                    # One failing chain must not abort extraction for the others
+                    logger.warning(f"Could not extract source code for {address} on chain {chain_id}: {exc}")
                     continue
 
-                logger.info(f"\n📦 Extracting from chain {chain_id} at {address}")
-
-                # Log selector_sources state for debugging
-                if self.selector_sources:
-                    # Show a few sample mappings
-                    sample_sels = list(self.selector_sources.keys())[:3]
-                    logger.info(
-                        f"  Using {len(self.selector_sources)} selector provenance entries (sample: {sample_sels})"
-                    )
-                else:
-                    logger.warning("  No selector_sources available - Diamond detection may have failed")
-
-                extracted_code = self.source_extractor.extract_contract_code(
-                    address,
-                    chain_id,
-                    selectors=selectors,
-                    selector_sources=self.selector_sources,  # Pass selector provenance for efficient Diamond extraction
-                )
-
                 if extracted_code["source_code"]:
                     # Store with unique key combining chain_id and address
                     storage_key = f"{chain_id}_{address}"
                     self.extracted_codes[storage_key] = extracted_code
-                    extracted_contracts.add(contract_key)
 
                     logger.info(f"✓ Source code extracted successfully for {address} on chain {chain_id}")
                     logger.debug(f"  - Functions: {len(extracted_code['functions'])}")
@@ -82,15 +115,29 @@ class AnalyzerPipelineSourceMixin:
                     f"\n✓ Successfully extracted source code from {len(self.extracted_codes)} contract(s): {list(self.extracted_codes.keys())}"
                 )
 
+                # ERC4626 and ERC20 detection share one parse per contract; results are reused by both loops.
+                # The same contract verified on several chains has identical source, so key by content
+                # rather than by deployment and scan each distinct source once.
+                standards_by_source: dict[tuple[bytes, str | None], dict[str, dict[str, Any]]] = {}
+
+                def detect_standards(deployment_key: str, extracted_code: dict[str, Any]) -> dict[str, dict[str, Any]]:
+                    source_code = extracted_code["source_code"]
+                    contract_name = extracted_code.get("contract_name")
+                    source_key = (source_digest(source_code), contract_name)
+                    if source_key not in standards_by_source:
+                        standards_by_source[source_key] = self._detect_standards_from_source(
+                            source_code, contract_name=contract_name
+                        )
+                    else:
+                        logger.debug(f"   Reusing standard detection for identical source at {deployment_key}")
+                    return standards_by_source[source_key]
+
                 # Detect ERC4626 from source code if not already detected from includes
                 if not self.erc4626_context:
                     logger.info("\n🔍 Checking source code for ERC4626 patterns...")
-                    for _deployment_key, extracted_code in self.extracted_codes.items():
+                    for deployment_key, extracted_code in self.extracted_codes.items():
                         if extracted_code.get("source_code") and isinstance(extracted_code["source_code"], str):
-                            contract_name = extracted_code.get("contract_name")
-                            source_detection = self._detect_erc4626_from_source(
-                                extracted_code["source_code"], contract_name=contract_name
-                            )
+                            source_detection = detect_standards(deployment_key, extracted_code)["erc4626"]
                             if source_detection["is_erc4626"]:
                                 chain_id = extracted_code["chain_id"]
                                 address = extracted_code["address"]
@@ -121,12 +168,9 @@ class AnalyzerPipelineSourceMixin:
                 # Detect ERC20 from source code (if not ERC4626, since ERC4626 extends ERC20)
                 if not self.erc20_context and not self.erc4626_context:
                     logger.info("\n🔍 Checking source code for ERC20 patterns...")
-                    for _deployment_key, extracted_code in self.extracted_codes.items():
+                    for deployment_key, extracted_code in self.extracted_codes.items():
                         if extracted_code.get("source_code") and isinstance(extracted_code["source_code"], str):
-                            contract_name = extracted_code.get("contract_name")
-                            source_detection = self._detect_erc20_from_source(
-                                extracted_code["source_code"], contract_name=contract_name
-                            )
+                            source_detection = detect_standards(deployment_key, extracted_code)["erc20"]
                             if source_detection["is_erc20"]:
                                 chain_id = extracted_code["chain_id"]
                                 address = extracted_code["address"]
@@ -150,8 +194,10 @@ class AnalyzerPipelineSourceMixin:
                 # If detected from includes but no on-chain query yet, do it now
                 if self.erc4626_context and not self.erc4626_context.get("asset_from_chain"):
                     logger.info("🔍 Querying on-chain asset() for ERC4626 vault...")
-                    for deployment in deployments:
-                        asset_from_chain = self._query_erc4626_asset(deployment["address"], deployment["chainId"])
+                    deployment_targets = context["deployment_targets"]
+                    deployment_assets = self._query_erc4626_assets_batch(deployment_targets, first_only=True)
+                    for deployment_target in deployment_targets:
+                        asset_from_chain = deployment_assets.get(deployment_target)
                         if asset_from_chain:
                             self.erc4626_context["asset_from_chain"] = asset_from_chain
                             logger.info("   ✓ Updated ERC4626 context with on-chain asset")
@@ -169,3 +215,11 @@ class AnalyzerPipelineSourceMixin:
                     logger.info(f"{'=' * 60}\n")
             else:
                 logger.warning("Could not extract source code from any deployment, continuing without it")
+
+    def _release_source_caches(self) -> None:
+        """Drop full contract sources once results only need the per-selector snippets."""
+        # results["selectors"][...]["source_code"] holds the trimmed snippet each report renders;
+        # the whole-contract sources below are only needed while preparing audit tasks.
+        self.extracted_codes = {}
+        if self.source_extractor:
+            self.source_extractor.clear_cache()
@@ -1,10 +1,12 @@
 """Pipeline stage: transaction collection and optional manual tx integration."""
 
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from ...clients.transactions import TX_HASH_RE
 from ...clients.transactions.fetcher import TransactionFetcher
 
 logger = logging.getLogger(__name__)
@@ -19,31 +21,29 @@ class AnalyzerPipelineTransactionsMixin:
         """Fetch transaction samples per selector across deployments."""
         selectors = context["selectors"]
         abi_backed_selectors = context.get("abi_backed_selectors", selectors)
-        abi_backed_selector_set = {s.lower() for s in abi_backed_selectors}
+        # Selectors are lowercase from extraction onwards, so they key every lookup below as-is
+        abi_backed_selector_set = set(abi_backed_selectors)
         deployments = context["deployments"]
         abi = context["abi"]
-        # First, identify which selectors are payable by checking their ABI
-        logger.info(f"\n{'=' * 60}")
-        logger.info("Identifying payable functions...")
-        logger.info(f"{'=' * 60}")
-
-        payable_selectors = set()
-        for selector in abi_backed_selectors:
-            function_data = (context.get("selector_function_data", {}) or {}).get(selector.lower())
-            if function_data is None:
-                function_data = self.get_function_abi_by_selector(selector)
-            if function_data and function_data.get("stateMutability") == "payable":
-                payable_selectors.add(selector.lower())
-                logger.debug(f"Function {function_data['name']} ({selector}) is payable")
+        # Setup flags payable selectors while resolving their ABI entries
+        payable_selectors = context.get("payable_selectors")
+        if payable_selectors is None:
+            selector_function_data = context.get("selector_function_data") or {}
+            payable_selectors = frozenset(
+                selector_lower
+                for selector_lower in abi_backed_selector_set
+                if (selector_function_data.get(selector_lower) or {}).get("stateMutability") == "payable"
+            )
 
         if payable_selectors:
             logger.info(f"Found {len(payable_selectors)} payable function(s)")
+            logger.debug(f"Payable selectors: {sorted(payable_selectors)}")
 
         # Fetch transactions for ALL selectors at once
         logger.info(f"\n{'=' * 60}")
         logger.info(f"Fetching transactions for all {len(selectors)} selectors at once...")
         logger.info(f"{'=' * 60}")
-        skipped_selectors = [s for s in selectors if s.lower() not in abi_backed_selector_set]
+        skipped_selectors = [s for s in selectors if s not in abi_backed_selector_set]
         if skipped_selectors:
             logger.warning(
                 "Skipping transaction fetch for %d selector(s) not found in merged ABI: %s",
@@ -53,8 +53,12 @@ class AnalyzerPipelineTransactionsMixin:
 
         # Initialize transaction storage and track how many samples are still needed
         transactions_per_selector = 5  # Matches tx_fetcher default
-        all_selector_txs = {s.lower(): [] for s in selectors}
-        selectors_remaining = {s.lower(): transactions_per_selector for s in abi_backed_selectors}
+        all_selector_txs = {s: [] for s in selectors}
+        selectors_remaining = dict.fromkeys(abi_backed_selectors, transactions_per_selector)
+        # Selectors still short of samples, in query order; entries leave as soon as they are satisfied
+        selectors_pending = dict.fromkeys(selectors_remaining)
+        # Explorer workers snapshot selectors_pending when they start; removals happen under this lock
+        pending_lock = threading.Lock()
         deployment_per_selector = {}  # Track which deployment was used for each selector
         default_deployment = deployments[0] if deployments else {"address": "N/A", "chainId": 1}
 
@@ -65,24 +69,29 @@ class AnalyzerPipelineTransactionsMixin:
             source_label: str | None = None,
         ) -> None:
             chain_id = completed_deployment["chainId"]
-            for selector, txs in deployment_txs.items():
+            # Fetchers key their results by the lowercase selectors they were given
+            for selector_lower, txs in deployment_txs.items():
                 if not txs:
                     continue
 
-                selector_lower = selector.lower()
-                if selector_lower not in selectors_remaining:
+                if selector_lower not in selectors_pending:
                     continue
 
                 remaining_needed = selectors_remaining[selector_lower]
-                if remaining_needed <= 0:
-                    continue
 
-                to_add = txs[:remaining_needed]
+                # Explorer records without a well-formed hash can't be looked up later; drop them here so
+                # every fetched sample downstream carries a real transaction hash
+                to_add = [tx for tx in txs if TX_HASH_RE.fullmatch(tx.get("hash") or "")][:remaining_needed]
                 if not to_add:
                     continue
 
                 all_selector_txs[selector_lower].extend(to_add)
-                selectors_remaining[selector_lower] = max(0, remaining_needed - len(to_add))
+                # to_add is capped at remaining_needed, so the count never drops below zero
+                remaining_needed -= len(to_add)
+                selectors_remaining[selector_lower] = remaining_needed
+                if not remaining_needed:
+                    with pending_lock:
+                        del selectors_pending[selector_lower]
                 deployment_per_selector.setdefault(selector_lower, completed_deployment)
                 if source_label:
                     logger.debug(
@@ -97,7 +106,7 @@ class AnalyzerPipelineTransactionsMixin:
                         f"(added {len(to_add)} from chain {chain_id})"
                     )
 
-        selectors_to_query = list(selectors_remaining.keys())
+        selectors_to_query = list(selectors_pending)
         if deployments and selectors_to_query:
             deployments_by_chain: dict[int, list[tuple[int, dict[str, Any]]]] = {}
             for deployment_index, deployment in enumerate(deployments):
@@ -139,7 +148,9 @@ class AnalyzerPipelineTransactionsMixin:
                         len(addresses),
                         chain_id,
                     )
-                    worker_fetcher = TransactionFetcher(self.etherscan_api_key, self.lookback_days)
+                    worker_fetcher = TransactionFetcher(
+                        self.etherscan_api_key, self.lookback_days, session=self._session
+                    )
                     chain_result = worker_fetcher._fetch_transactions_from_snowflake_for_addresses(
                         contract_addresses=addresses,
                         selectors=selectors_to_query,
@@ -200,6 +211,8 @@ class AnalyzerPipelineTransactionsMixin:
                 if batched_snowflake_results:
                     logger.info("Merging chain-batched Snowflake results in deployment order...")
                     for deployment_index, _deployment in enumerate(deployments):
+                        if not selectors_pending:
+                            break
                         result_bundle = batched_snowflake_results.get(deployment_index)
                         if result_bundle is None:
                             continue
@@ -220,7 +233,7 @@ class AnalyzerPipelineTransactionsMixin:
                         len(fallback_deployment_indices),
                     )
 
-            selectors_to_query = [selector for selector, remaining in selectors_remaining.items() if remaining > 0]
+            selectors_to_query = list(selectors_pending)
             fallback_deployments = [(idx, deployments[idx]) for idx in sorted(fallback_deployment_indices)]
             if not selectors_to_query:
                 logger.info("Snowflake satisfied all selector transaction requirements before explorer fallback")
@@ -229,14 +242,24 @@ class AnalyzerPipelineTransactionsMixin:
                     "Snowflake query completed for all deployment batches; keeping Snowflake results without explorer fallback"
                 )
             else:
-                # Explorer APIs (Etherscan / Blockscout) are rate-limited,
-                # so we must call them sequentially — unlike Snowflake.
-                fallback_workers = 1
+                # Explorer APIs (Etherscan / Blockscout) are rate-limited, so keep the
+                # fan-out within the configured API concurrency.
+                fallback_workers = max(
+                    1,
+                    min(
+                        len(fallback_deployments),
+                        int(getattr(self, "max_concurrent_api_calls", 1) or 1),
+                    ),
+                )
                 logger.info(
-                    "Launching sequential explorer fallback fetches for %d deployment(s)",
+                    "Launching explorer fallback fetches for %d deployment(s) with up to %d worker(s)",
                     len(fallback_deployments),
+                    fallback_workers,
                 )
 
+                # Set once every selector is satisfied so in-flight scans stop at their next page
+                all_satisfied = threading.Event()
+
                 def _fetch_deployment_transactions(
                     deployment_index: int,
                     deployment: dict[str, Any],
@@ -249,13 +272,20 @@ class AnalyzerPipelineTransactionsMixin:
                 ]:
                     contract_address = deployment["address"]
                     chain_id = deployment["chainId"]
+                    # Deployments queued behind others only look for selectors still short of samples
+                    with pending_lock:
+                        deployment_selectors = list(selectors_pending)
+                    if not deployment_selectors:
+                        return deployment_index, deployment, {}, {}, {}
                     logger.info("Trying deployment: %s on chain %s", contract_address, chain_id)
-                    logger.info("  Looking for transactions for %d remaining selector(s)", len(selectors_to_query))
+                    logger.info("  Looking for transactions for %d remaining selector(s)", len(deployment_selectors))
 
-                    worker_fetcher = TransactionFetcher(self.etherscan_api_key, self.lookback_days)
+                    worker_fetcher = TransactionFetcher(
+                        self.etherscan_api_key, self.lookback_days, session=self._session, stop_event=all_satisfied
+                    )
                     deployment_txs = worker_fetcher.fetch_all_transactions_for_selectors(
                         contract_address,
-                        selectors_to_query,
+                        deployment_selectors,
                         chain_id,
                         per_selector=transactions_per_selector,
                         payable_selectors=payable_selectors,
@@ -269,23 +299,15 @@ class AnalyzerPipelineTransactionsMixin:
                         dict(getattr(worker_fetcher, "api_type_per_chain", {})),
                     )
 
-                deployment_results: dict[
-                    int,
-                    tuple[
-                        dict[str, Any],
-                        dict[str, list[dict[str, Any]]],
-                        dict[tuple[int, str], dict[str, Any]],
-                        dict[int, str],
-                    ],
-                ] = {}
-
+                # All deployments are fetched concurrently, but results are merged in deployment
+                # (priority) order so the per-selector truncation matches a sequential pass.
                 with ThreadPoolExecutor(max_workers=fallback_workers) as executor:
-                    future_map = {
-                        executor.submit(_fetch_deployment_transactions, idx, deployment): idx
+                    futures = [
+                        executor.submit(_fetch_deployment_transactions, idx, deployment)
                         for idx, deployment in fallback_deployments
-                    }
-                    for future in as_completed(future_map):
-                        deployment_index = future_map[future]
+                    ]
+                    for position, future in enumerate(futures):
+                        deployment_index = fallback_deployments[position][0]
                         deployment = deployments[deployment_index]
                         contract_address = deployment["address"]
                         chain_id = deployment["chainId"]
@@ -301,31 +323,29 @@ class AnalyzerPipelineTransactionsMixin:
                                 exc,
                             )
                             continue
-                        deployment_results[deployment_index] = (
-                            completed_deployment,
-                            deployment_txs,
-                            snowflake_cache,
-                            api_type_per_chain,
-                        )
                         logger.info(
                             "Completed transaction fetch for deployment %s on chain %s",
                             contract_address,
                             chain_id,
                         )
 
-                for deployment_index, _deployment in enumerate(deployments):
-                    result_bundle = deployment_results.get(deployment_index)
-                    if result_bundle is None:
-                        continue
-
-                    completed_deployment, deployment_txs, snowflake_cache, api_type_per_chain = result_bundle
-                    self.tx_fetcher._snowflake_transaction_row_cache.update(snowflake_cache)
-                    self.tx_fetcher.api_type_per_chain.update(api_type_per_chain)
-                    _merge_deployment_transactions(completed_deployment, deployment_txs)
+                        self.tx_fetcher._snowflake_transaction_row_cache.update(snowflake_cache)
+                        self.tx_fetcher.api_type_per_chain.update(api_type_per_chain)
+                        _merge_deployment_transactions(completed_deployment, deployment_txs)
+
+                        if not selectors_pending:
+                            # Every selector has its samples; stop running scans and drop fetches not yet started
+                            all_satisfied.set()
+                            cancelled = sum(pending.cancel() for pending in futures[position + 1 :])
+                            if cancelled:
+                                logger.info(
+                                    "All selectors satisfied; cancelled %d pending deployment fetch(es)", cancelled
+                                )
+                            break
 
         # Log final results
-        satisfied_selectors = [sel for sel, remaining in selectors_remaining.items() if remaining <= 0]
-        selectors_missing = [sel for sel, remaining in selectors_remaining.items() if remaining > 0]
+        selectors_missing = list(selectors_pending)
+        satisfied_selectors = [sel for sel in selectors_remaining if sel not in selectors_pending]
 
         found_count = len(satisfied_selectors)
         not_found_count = len(selectors_missing)
@@ -71,6 +71,8 @@ class AnalyzerPipelineMixin(
                 self._prepare_selector_audit_tasks_from_prepared_inputs(context)
             else:
                 _check_cancelled()
+                # Source extraction only needs setup's output; let it run while samples are collected
+                self._start_source_extraction(context)
                 self.report_progress(f"Fetching transactions for {selector_count} selector(s)")
                 self._collect_selector_transactions(context, raw_txs_file)
                 _check_cancelled()
@@ -87,9 +89,17 @@ class AnalyzerPipelineMixin(
             self._run_batch_audits(context)
         except _CancelledError:
             logger.warning("[PIPELINE] Returning partial results after cancellation")
+        finally:
+            # Audits still streaming from preparation are abandoned when a later stage is skipped
+            stream = context.pop("audit_stream", None)
+            if stream is not None:
+                stream.close(cancel_pending=True)
+            for _target, future in context.pop("source_extraction", ()):
+                future.cancel()
 
         self.report_progress("Finalizing analysis results")
         results = self._finalize_results(context)
+        self._release_source_caches()
 
         if hasattr(self, "tx_fetcher") and hasattr(self.tx_fetcher, "close_snowflake_connections"):
             self.tx_fetcher.close_snowflake_connections()
@@ -0,0 +1,78 @@
+"""Small on-disk JSON caches for explorer data that rarely or never changes between runs."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Set to a directory to relocate every on-disk cache, or to 0/false/off to disable them
+CACHE_DIR_ENV = "ERC7730_CACHE_DIR"
+DISABLED_VALUES = ("0", "false", "no", "off")
+
+
+def cache_root() -> Path | None:
+    """Return the analyzer's cache directory, or None when on-disk caching is disabled."""
+    configured = os.getenv(CACHE_DIR_ENV, "").strip()
+    if configured.lower() in DISABLED_VALUES:
+        return None
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "erc7730-analyzer"
+
+
+class JsonFileCache:
+    """
+    One JSON file per key under ``<cache root>/<namespace>``.
+
+    Entries older than ``ttl_seconds`` are treated as misses (``None`` keeps them forever).
+    Writes go through a temporary file and ``os.replace`` so concurrent readers never see a
+    partial document. Every I/O error degrades to a miss; the cache is never required.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: float | None = None):
+        root = cache_root()
+        self.directory = root / namespace if root else None
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        # Keys may contain characters that are awkward in file names (e.g. ':'), so hash long/odd ones
+        safe_key = key if key.replace("_", "").isalnum() else hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{safe_key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss or stale entry."""
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            if self.ttl_seconds is not None and time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            # Stdlib json keeps integers beyond 64 bits (uint256 amounts) exact; orjson turns them into floats
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {exc}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` (JSON-serializable) under ``key``."""
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(value), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(f"Could not write cache entry {path}: {exc}")
@@ -17,6 +17,8 @@ from typing import Any
 import rlp
 from eth_utils import to_hex
 
+from .. import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -195,8 +197,8 @@ def load_raw_transactions(file_path: Path, fetch_by_hash_callback=None) -> list[
         List of parsed transactions with metadata
     """
     try:
-        with open(file_path) as f:
-            raw_txs = json.load(f)
+        with open(file_path, "rb") as f:
+            raw_txs = fast_json.loads(f.read())
 
         if not isinstance(raw_txs, list):
             logger.error("Raw transactions file must contain a JSON array")
@@ -1,5 +1,6 @@
 """Target function resolution stage for dependency extraction."""
 
+import logging
 import re
 from typing import Any
 
@@ -7,54 +8,18 @@ from ..parser import SolidityCodeParser
 from ..shared import logger
 
 
-def resolve_target_function(
-    self,
-    function_name: str,
-    extracted_code: dict[str, Any],
-    function_signature: str | None,
-    selector_only: bool,
-    selector: str | None,
-) -> tuple[dict[str, Any] | None, dict[str, Any] | None, str | None, dict[str, Any] | None]:
-    # Find the function
-    target_function = None
+def _type_mappings(
+    self, extracted_code: dict[str, Any], type_source: dict[str, Any], type_source_name: str
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Return the (custom type, struct) -> ABI type mappings for ``type_source``.
 
-    # For Diamond proxies: try to use facet-specific source code for faster lookups
-    facet_specific_code = None
-    facet_source_text = None
-    facet_addr = None
-    if selector:
-        selector_to_facet = extracted_code.get("_selector_to_facet", {})
-        per_facet_codes = extracted_code.get("_per_facet_codes", {})
-
-        # DEBUG: Log what's available
-        logger.debug(
-            f"  🔍 DEBUG: _selector_to_facet has {len(selector_to_facet)} mappings, _per_facet_codes has {len(per_facet_codes)} facets"
-        )
-
-        facet_addr = selector_to_facet.get(selector)
-        logger.debug(
-            f"  🔍 DEBUG: Looking for facet_addr={facet_addr}, per_facet_codes keys={list(per_facet_codes.keys())[:3]}..."
-        )
-        if facet_addr and facet_addr in per_facet_codes:
-            facet_specific_code = per_facet_codes[facet_addr]
-            facet_source_text = facet_specific_code.get("source_code", "")
-            facet_func_count = len(facet_specific_code.get("functions", {}))
-            facet_struct_count = len(facet_specific_code.get("structs", {}))
-            facet_struct_names = list(facet_specific_code.get("structs", {}).keys())
-            logger.debug(
-                f"  🎯 Using facet-specific source for {selector} (facet: {facet_addr[:10]}..., {facet_func_count} functions, {facet_struct_count} structs)"
-            )
-            logger.debug(
-                f"  🎯 Facet-specific structs: {facet_struct_names[:10]}{'...' if len(facet_struct_names) > 10 else ''}"
-            )
-        elif facet_addr:
-            logger.warning(f"  ⚠ Facet {facet_addr[:10]}... not in per_facet_codes (has {len(per_facet_codes)} facets)")
-        elif selector_to_facet:
-            logger.warning(
-                f"  ⚠ Selector {selector} not in selector_to_facet mapping (has {len(selector_to_facet)} selectors)"
-            )
-        else:
-            logger.debug("  No _selector_to_facet mapping available - using full merged source")
+    They depend only on the source, not on the function being resolved, so they are built once
+    and kept on the code dict like ``_functions_by_name``.
+    """
+    cached = type_source.get("_type_mappings")
+    if cached is not None:
+        return cached
 
     # Get custom types mapping for resolving type aliases
     custom_types = extracted_code.get("custom_types", {})
@@ -67,11 +32,6 @@ def resolve_target_function(
             custom_type_mapping[type_name] = base_type
             logger.debug(f"  Custom type mapping: {type_name} -> {base_type}")
 
-    # IMPORTANT: For Diamond proxies, prefer facet-specific types to avoid name collisions
-    # The same struct name can have DIFFERENT definitions in different facets!
-    type_source = facet_specific_code if facet_specific_code else extracted_code
-    type_source_name = f"facet {facet_addr[:10]}..." if (facet_specific_code and facet_addr) else "merged source"
-
     # Add interfaces and contracts (they all map to address in ABI)
     interfaces = type_source.get("interfaces", [])
     for interface_name in interfaces:
@@ -93,8 +53,6 @@ def resolve_target_function(
     if "StargateData" in structs:
         logger.debug(f"  🔍 DEBUG StargateData raw definition from {type_source_name}:")
         logger.debug(f"  {structs['StargateData'][:500]}...")
-        if facet_addr:
-            logger.debug(f"  🔍 DEBUG: Facet address used = {facet_addr}")
     struct_type_mapping = {}
     for struct_name, struct_def in structs.items():
         # Extract tuple representation from struct, resolving custom types and nested structs
@@ -105,6 +63,67 @@ def resolve_target_function(
         else:
             logger.warning(f"  ⚠️  Failed to parse struct: {struct_name}")
 
+    type_source["_type_mappings"] = (custom_type_mapping, struct_type_mapping)
+    return custom_type_mapping, struct_type_mapping
+
+
+def resolve_target_function(
+    self,
+    function_name: str,
+    extracted_code: dict[str, Any],
+    function_signature: str | None,
+    selector_only: bool,
+    selector: str | None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, str | None, dict[str, Any] | None]:
+    # Per-candidate diagnostics are rendered only when DEBUG logging is on
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Find the function
+    target_function = None
+
+    # For Diamond proxies: try to use facet-specific source code for faster lookups
+    facet_specific_code = None
+    facet_source_text = None
+    facet_addr = None
+    if selector:
+        selector_to_facet = extracted_code.get("_selector_to_facet", {})
+        per_facet_codes = extracted_code.get("_per_facet_codes", {})
+
+        facet_addr = selector_to_facet.get(selector)
+        if debug_enabled:
+            logger.debug(
+                f"  🔍 DEBUG: _selector_to_facet has {len(selector_to_facet)} mappings, _per_facet_codes has {len(per_facet_codes)} facets"
+            )
+            logger.debug(
+                f"  🔍 DEBUG: Looking for facet_addr={facet_addr}, per_facet_codes keys={list(per_facet_codes.keys())[:3]}..."
+            )
+        if facet_addr and facet_addr in per_facet_codes:
+            facet_specific_code = per_facet_codes[facet_addr]
+            facet_source_text = facet_specific_code.get("source_code", "")
+            if debug_enabled:
+                facet_func_count = len(facet_specific_code.get("functions", {}))
+                facet_struct_names = list(facet_specific_code.get("structs", {}).keys())
+                logger.debug(
+                    f"  🎯 Using facet-specific source for {selector} (facet: {facet_addr[:10]}..., {facet_func_count} functions, {len(facet_struct_names)} structs)"
+                )
+                logger.debug(
+                    f"  🎯 Facet-specific structs: {facet_struct_names[:10]}{'...' if len(facet_struct_names) > 10 else ''}"
+                )
+        elif facet_addr:
+            logger.warning(f"  ⚠ Facet {facet_addr[:10]}... not in per_facet_codes (has {len(per_facet_codes)} facets)")
+        elif selector_to_facet:
+            logger.warning(
+                f"  ⚠ Selector {selector} not in selector_to_facet mapping (has {len(selector_to_facet)} selectors)"
+            )
+        else:
+            logger.debug("  No _selector_to_facet mapping available - using full merged source")
+
+    # IMPORTANT: For Diamond proxies, prefer facet-specific types to avoid name collisions
+    # The same struct name can have DIFFERENT definitions in different facets!
+    type_source = facet_specific_code if facet_specific_code else extracted_code
+    type_source_name = f"facet {facet_addr[:10]}..." if (facet_specific_code and facet_addr) else "merged source"
+    custom_type_mapping, struct_type_mapping = _type_mappings(self, extracted_code, type_source, type_source_name)
+
     # Pre-cache extracted functions for fast lookup (avoid O(n) scans)
     all_functions_cache = extracted_code.get("functions", {}) or {}
     functions_by_name = extracted_code.get("_functions_by_name")
@@ -117,8 +136,12 @@ def resolve_target_function(
     # Build facet-specific functions cache if using facet-specific code
     facet_functions_by_name = {}
     if facet_specific_code:
-        for func_data in facet_specific_code.get("functions", {}).values():
-            facet_functions_by_name.setdefault(func_data["name"], []).append(func_data)
+        facet_functions_by_name = facet_specific_code.get("_functions_by_name")
+        if facet_functions_by_name is None:
+            facet_functions_by_name = {}
+            for func_data in facet_specific_code.get("functions", {}).values():
+                facet_functions_by_name.setdefault(func_data["name"], []).append(func_data)
+            facet_specific_code["_functions_by_name"] = facet_functions_by_name
 
     # If signature is provided, normalize it for comparison
     normalized_target_sig = None
@@ -137,9 +160,13 @@ def resolve_target_function(
 
     # Extract inheritance relationships from source code
     # For Diamond proxies: use facet source code for inheritance parsing
-    source_for_parsing = facet_source_text if facet_source_text else extracted_code.get("source_code", "")
-    parser = SolidityCodeParser(source_for_parsing)
-    inheritance_map = parser.extract_inheritance_chain()
+    # The inheritance map only depends on the parsed source, so it is cached alongside it
+    parsed_code = facet_specific_code if facet_source_text else extracted_code
+    inheritance_map = parsed_code.get("_inheritance_map")
+    if inheritance_map is None:
+        source_for_parsing = facet_source_text if facet_source_text else extracted_code.get("source_code", "")
+        inheritance_map = SolidityCodeParser(source_for_parsing).extract_inheritance_chain()
+        parsed_code["_inheritance_map"] = inheritance_map
 
     # DEBUG: Log inheritance extraction results
     logger.debug(f"  🔍 DEBUG: main_contract_name = '{main_contract_name}'")
@@ -237,9 +264,10 @@ def resolve_target_function(
                 func_selector = self._compute_function_selector(func_sig, custom_type_mapping, struct_type_mapping)
 
                 # Debug logging to diagnose selector mismatch
-                logger.debug(f"    Checking: {func['signature'][:80]}...")
-                logger.debug(f"      Normalized: {func_sig[:80]}...")
-                logger.debug(f"      Computed selector: {func_selector} (target: {target_selector})")
+                if debug_enabled:
+                    logger.debug(f"    Checking: {func['signature'][:80]}...")
+                    logger.debug(f"      Normalized: {func_sig[:80]}...")
+                    logger.debug(f"      Computed selector: {func_selector} (target: {target_selector})")
 
                 if func_selector == target_selector:
                     # Found exact selector match!
@@ -266,7 +294,8 @@ def resolve_target_function(
 
                 func_selector = self._compute_function_selector(func_sig, custom_type_mapping, struct_type_mapping)
 
-                logger.debug(f"    Checking: {func['signature'][:60]}... -> {func_selector}")
+                if debug_enabled:
+                    logger.debug(f"    Checking: {func['signature'][:60]}... -> {func_selector}")
 
                 if func_selector == target_selector:
                     # Found exact selector match!
@@ -2,24 +2,41 @@
 
 import re
 
-from ..shared import logger
+import requests
+
+from ....disk_cache import JsonFileCache
+from ....rpc_helpers import build_explorer_session
+from ..shared import BLOCKSCOUT_URLS, logger
+
+# Proxies can be upgraded, so cached implementation addresses expire like cached ABIs
+PROXY_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 
 
 class SourceCodeFetchingBaseMixin:
-    def __init__(self, etherscan_api_key: str, coredao_api_key: str | None = None):
+    def __init__(
+        self,
+        etherscan_api_key: str,
+        coredao_api_key: str | None = None,
+        session: requests.Session | None = None,
+    ):
         """
         Initialize the extractor.
 
         Args:
             etherscan_api_key: Etherscan API key
             coredao_api_key: Core DAO API key (optional)
+            session: Shared HTTP session for explorer calls (a pooled one is created if omitted)
         """
         import threading
 
         self.etherscan_api_key = etherscan_api_key
         self.coredao_api_key = coredao_api_key
+        self.session = session or build_explorer_session(BLOCKSCOUT_URLS.values())
         self.code_cache = {}  # Cache: contract_address -> extracted code dict
         self._cache_lock = threading.Lock()  # Thread-safe cache access
+        # Verified source and contract names at an address never change, so keep them across runs
+        self._source_cache = JsonFileCache("sources")
+        self._proxy_cache = JsonFileCache("proxies", ttl_seconds=PROXY_CACHE_TTL_SECONDS)
 
     def clear_cache(self):
         """Clear the source code cache to force fresh extraction."""
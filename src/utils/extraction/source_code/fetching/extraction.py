@@ -4,7 +4,7 @@ import re
 from typing import Any
 
 from ..parser import SolidityCodeParser
-from ..shared import BLOCKSCOUT_URLS, logger
+from ..shared import logger
 
 
 class SourceCodeFetchingExtractionMixin:
@@ -192,11 +192,7 @@ class SourceCodeFetchingExtractionMixin:
                 max_retries = 3
                 for attempt in range(max_retries):
                     # Try Sourcify first, then Etherscan, then Blockscout
-                    source_code = self.fetch_source_from_sourcify(facet_addr, chain_id)
-                    if not source_code:
-                        source_code = self.fetch_source_from_etherscan(facet_addr, chain_id)
-                    if not source_code:
-                        source_code = self.fetch_source_from_blockscout(facet_addr, chain_id)
+                    source_code = self.fetch_verified_source(facet_addr, chain_id)
 
                     if source_code:
                         break
@@ -332,18 +328,13 @@ class SourceCodeFetchingExtractionMixin:
                 logger.info(f"Using implementation address: {impl_address}")
 
         # Fetch contract name from Etherscan (most reliable source)
-        contract_name = self.get_contract_name_from_etherscan(contract_address, chain_id)
+        contract_name = self.get_deployed_contract_name(contract_address, chain_id)
         if contract_name:
             result["contract_name"] = contract_name
             logger.info(f"✓ Deployed contract: {contract_name}")
 
         # Fetch source code (try Sourcify first, then Etherscan, then Blockscout)
-        source_code = self.fetch_source_from_sourcify(contract_address, chain_id)
-        if not source_code:
-            source_code = self.fetch_source_from_etherscan(contract_address, chain_id)
-        if not source_code and chain_id in BLOCKSCOUT_URLS:
-            logger.info(f"Chain {chain_id} has Blockscout support - trying Blockscout...")
-            source_code = self.fetch_source_from_blockscout(contract_address, chain_id)
+        source_code = self.fetch_verified_source(contract_address, chain_id)
 
         if not source_code:
             logger.warning(f"Could not fetch source code for {contract_address}")
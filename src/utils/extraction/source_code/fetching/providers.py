@@ -1,9 +1,9 @@
 """Source-provider fetchers (Sourcify/Etherscan/Blockscout)."""
 
 import json
+from collections.abc import Callable
 
-import requests
-
+from .... import fast_json
 from ....rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
     is_etherscan_contract_endpoint_unsupported,
@@ -13,6 +13,43 @@ from ..shared import BLOCKSCOUT_URLS, logger
 
 
 class SourceCodeFetchingProviderMixin:
+    def _cached_contract_lookup(self, key: str, fetch: Callable[[], str | None]) -> str | None:
+        """Return ``fetch()``'s result through the on-disk source cache; misses are never stored."""
+        cached = self._source_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Using cached {key}")
+            return cached["value"]
+        value = fetch()
+        if value:
+            self._source_cache.put(key, {"value": value})
+        return value
+
+    def get_deployed_contract_name(self, contract_address: str, chain_id: int) -> str | None:
+        """Get the deployed contract name, reusing the on-disk cache before asking Etherscan."""
+        return self._cached_contract_lookup(
+            f"name_{chain_id}_{contract_address.lower()}",
+            lambda: self.get_contract_name_from_etherscan(contract_address, chain_id),
+        )
+
+    def fetch_verified_source(self, contract_address: str, chain_id: int) -> str | None:
+        """
+        Fetch verified source code, trying Sourcify, then Etherscan, then Blockscout.
+
+        Successful lookups are cached on disk per (chain, address); proxies are resolved by the
+        caller first, so an upgraded implementation is looked up under its own address.
+        """
+
+        def fetch() -> str | None:
+            source_code = self.fetch_source_from_sourcify(contract_address, chain_id)
+            if not source_code:
+                source_code = self.fetch_source_from_etherscan(contract_address, chain_id)
+            if not source_code and chain_id in BLOCKSCOUT_URLS:
+                logger.info(f"Chain {chain_id} has Blockscout support - trying Blockscout...")
+                source_code = self.fetch_source_from_blockscout(contract_address, chain_id)
+            return source_code
+
+        return self._cached_contract_lookup(f"source_{chain_id}_{contract_address.lower()}", fetch)
+
     def get_contract_name_from_blockscout(self, contract_address: str, chain_id: int) -> str | None:
         """Get the deployed contract name from Blockscout when available."""
         if chain_id not in BLOCKSCOUT_URLS or chain_id == 1116:
@@ -20,9 +57,9 @@ class SourceCodeFetchingProviderMixin:
 
         try:
             url = f"{BLOCKSCOUT_URLS[chain_id]}/api/v2/smart-contracts/{contract_address}"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = fast_json.loads(response.content)
             name = data.get("name")
             if isinstance(name, str) and name.strip():
                 logger.debug("Contract name from Blockscout: %s", name)
@@ -45,13 +82,13 @@ class SourceCodeFetchingProviderMixin:
         """
         try:
             base_url = f"https://sourcify.dev/server/v2/contract/{chain_id}/{contract_address}"
-            response = requests.get(base_url, headers={"accept": "application/json"})
+            response = self.session.get(base_url, headers={"accept": "application/json"})
 
             if response.status_code != 200:
                 logger.debug(f"Contract not found on Sourcify (chain {chain_id})")
                 return None
 
-            data = response.json()
+            data = fast_json.loads(response.content)
 
             # Combine all source files
             sources = data.get("sources", {})
@@ -94,9 +131,9 @@ class SourceCodeFetchingProviderMixin:
                 "apikey": self.etherscan_api_key,
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
+            response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = fast_json.loads(response.content)
 
             if etherscan_response_indicates_chain_unsupported(data):
                 mark_etherscan_contract_endpoint_unsupported(chain_id)
@@ -140,9 +177,9 @@ class SourceCodeFetchingProviderMixin:
                 "apikey": self.etherscan_api_key,
             }
 
-            response = requests.get(base_url, params=params)
+            response = self.session.get(base_url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = fast_json.loads(response.content)
 
             if etherscan_response_indicates_chain_unsupported(data):
                 mark_etherscan_contract_endpoint_unsupported(chain_id)
@@ -166,7 +203,7 @@ class SourceCodeFetchingProviderMixin:
             if source_code.startswith("{{"):
                 try:
                     json_str = source_code[1:-1]  # Remove outer braces
-                    sources_dict = json.loads(json_str)
+                    sources_dict = fast_json.loads(json_str)
 
                     combined_code = []
                     if "sources" in sources_dict:
@@ -222,7 +259,7 @@ class SourceCodeFetchingProviderMixin:
 
                 logger.info(f"Fetching from Core DAO API: {url}")
                 try:
-                    response = requests.get(url, params=params, timeout=10)
+                    response = self.session.get(url, params=params, timeout=10)
                     logger.debug(f"Core DAO API response status: {response.status_code}")
 
                     if response.status_code == 401:
@@ -230,7 +267,7 @@ class SourceCodeFetchingProviderMixin:
                         return None
 
                     response.raise_for_status()
-                    data = response.json()
+                    data = fast_json.loads(response.content)
                     logger.debug(
                         f"Core DAO API response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}"
                     )
@@ -245,10 +282,8 @@ class SourceCodeFetchingProviderMixin:
                             if source_code:
                                 # Parse multi-file format (JSON string starting with {{)
                                 if source_code.startswith("{{"):
-                                    import json
-
                                     # Remove outer braces and parse
-                                    source_json = json.loads(source_code[1:-1])
+                                    source_json = fast_json.loads(source_code[1:-1])
                                     sources = source_json.get("sources", {})
 
                                     combined_code = []
@@ -283,9 +318,9 @@ class SourceCodeFetchingProviderMixin:
             # Standard Blockscout v2 API
             url = f"{base_url}/api/v2/smart-contracts/{contract_address}"
 
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = fast_json.loads(response.content)
 
             # Check if source code is available
             if not data or "source_code" not in data:
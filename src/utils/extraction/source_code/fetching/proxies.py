@@ -1,8 +1,6 @@
 """Proxy and diamond detection helpers."""
 
-import requests
-from web3 import Web3
-
+from .... import fast_json
 from ....rpc_helpers import (
     etherscan_response_indicates_chain_unsupported,
     is_etherscan_contract_endpoint_unsupported,
@@ -18,6 +16,32 @@ class SourceCodeFetchingProxyMixin:
         """
         Detect if contract is a proxy and return implementation address.
 
+        Detected implementations are kept in the on-disk proxy cache for a week (the same
+        horizon as the ABI cache), so later runs skip the storage-slot and explorer lookups.
+        Non-proxies are not cached: a failed lookup looks the same as an empty slot.
+
+        Args:
+            contract_address: Contract address
+            chain_id: Chain ID
+
+        Returns:
+            Implementation address or None
+        """
+        cache_key = f"impl_{chain_id}_{contract_address.lower()}"
+        cached = self._proxy_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached proxy implementation for {contract_address}: {cached['implementation']}")
+            return cached["implementation"]
+
+        impl_address = self._detect_proxy_implementation_uncached(contract_address, chain_id)
+        if impl_address:
+            self._proxy_cache.put(cache_key, {"implementation": impl_address})
+        return impl_address
+
+    def _detect_proxy_implementation_uncached(self, contract_address: str, chain_id: int) -> str | None:
+        """
+        Detect if contract is a proxy and return implementation address.
+
         Checks common proxy patterns:
         - EIP-1967 implementation slot
         - EIP-1822 (UUPS) proxies
@@ -41,6 +65,8 @@ class SourceCodeFetchingProxyMixin:
             if rpc_url:
                 logger.info("  Trying direct RPC call to read storage slot...")
                 try:
+                    from web3 import Web3  # Deferred: slow to import and only needed for this slot read
+
                     w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
                     if w3.is_connected():
                         # Read the EIP-1967 implementation storage slot
@@ -108,7 +134,7 @@ class SourceCodeFetchingProxyMixin:
                     }
 
                 try:
-                    response = requests.get(base_url, params=params, timeout=10)
+                    response = self.session.get(base_url, params=params, timeout=10)
                     response.raise_for_status()
                     data = response.json()
 
@@ -148,8 +174,8 @@ class SourceCodeFetchingProxyMixin:
                         "apikey": self.etherscan_api_key,
                     }
 
-                    response = requests.get(base_url_etherscan, params=params, timeout=10)
-                    data = response.json()
+                    response = self.session.get(base_url_etherscan, params=params, timeout=10)
+                    data = fast_json.loads(response.content)
 
                     if etherscan_response_indicates_chain_unsupported(data):
                         mark_etherscan_contract_endpoint_unsupported(chain_id)
@@ -168,7 +194,7 @@ class SourceCodeFetchingProxyMixin:
                 try:
                     base_url_blockscout = BLOCKSCOUT_URLS[chain_id]
                     url = f"{base_url_blockscout}/api/v2/smart-contracts/{contract_address}"
-                    response = requests.get(url, timeout=10)
+                    response = self.session.get(url, timeout=10)
                     response.raise_for_status()
                     data = response.json()
 
@@ -216,8 +242,8 @@ class SourceCodeFetchingProxyMixin:
             }
 
             base_url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
-            response = requests.get(base_url, params=params)
-            data = response.json()
+            response = self.session.get(base_url, params=params)
+            data = fast_json.loads(response.content)
 
             if etherscan_response_indicates_chain_unsupported(data):
                 mark_etherscan_contract_endpoint_unsupported(chain_id)
@@ -295,7 +321,7 @@ class SourceCodeFetchingProxyMixin:
                     "apikey": self.etherscan_api_key,
                 }
                 try:
-                    response = requests.get(base_url, params=params, timeout=10)
+                    response = self.session.get(base_url, params=params, timeout=10)
                     response.raise_for_status()
                     data = response.json()
                 except Exception as exc:
@@ -1,7 +1,6 @@
 """Selector computation and inheritance-aware signature normalization."""
 
-from eth_utils import keccak
-
+from ....selectors import signature_selector
 from ..shared import logger
 
 
@@ -28,9 +27,8 @@ class SourceCodeSignatureSelectorMixin:
             function_signature, custom_type_mapping or {}, struct_type_mapping or {}
         )
 
-        # Compute keccak256 hash and take first 4 bytes
-        selector = "0x" + keccak(text=normalized_sig).hex()[:8]
-        return selector
+        # First 4 bytes of the keccak256 hash, memoized across calls
+        return signature_selector(normalized_sig)
 
     def _build_inheritance_hierarchy(self, contract_name: str, inheritance_map: dict[str, list[str]]) -> list[str]:
         """
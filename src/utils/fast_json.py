@@ -0,0 +1,31 @@
+"""JSON helpers that use orjson when installed and fall back to the standard library."""
+
+import json
+from typing import Any
+
+try:  # orjson is optional (the "fast-json" extra); it parses large documents several times faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_sorted(value: Any) -> str:
+    """
+    Serialize compactly with sorted keys and raw UTF-8.
+
+    The output matches ``json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)``,
+    so prompts built from it are byte-stable whichever backend is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits (uint256 amounts), which orjson refuses to encode
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
@@ -1,5 +1,6 @@
 """ERC-7730 format expansion utilities."""
 
+import re
 from typing import Any
 
 
@@ -9,24 +10,8 @@ def _extract_reference_name(value: str, prefix: str) -> str | None:
     return value[len(prefix) :] or None
 
 
-def _extract_embedded_reference_names(value: str, prefix: str) -> set[str]:
-    names: set[str] = set()
-    start = 0
-    while True:
-        idx = value.find(prefix, start)
-        if idx == -1:
-            break
-        remainder = value[idx + len(prefix) :]
-        name_chars = []
-        for char in remainder:
-            if char.isalnum() or char in {"_", "-"}:
-                name_chars.append(char)
-            else:
-                break
-        if name_chars:
-            names.add("".join(name_chars))
-        start = idx + len(prefix)
-    return names
+# Inline "$.metadata.<kind>.<name>" references; names stop at the first non-word, non-dash char
+_EMBEDDED_METADATA_REF_RE = re.compile(r"\$\.metadata\.(constants|enums|maps)\.([\w-]+)")
 
 
 def _scan_string_references(
@@ -36,9 +21,12 @@ def _scan_string_references(
     referenced_enums: set[str],
     referenced_maps: set[str],
 ) -> None:
-    referenced_constants.update(_extract_embedded_reference_names(value, "$.metadata.constants."))
-    referenced_enums.update(_extract_embedded_reference_names(value, "$.metadata.enums."))
-    referenced_maps.update(_extract_embedded_reference_names(value, "$.metadata.maps."))
+    # Most strings (labels, paths) reference no metadata; skip the regex for them
+    if "$.metadata." not in value:
+        return
+    targets = {"constants": referenced_constants, "enums": referenced_enums, "maps": referenced_maps}
+    for match in _EMBEDDED_METADATA_REF_RE.finditer(value):
+        targets[match.group(1)].add(match.group(2))
 
 
 def expand_erc7730_format_with_refs(
@@ -226,85 +226,73 @@ def format_source_code_section(source_code: dict) -> str:
     if not source_code or not source_code.get("function"):
         return ""
 
-    code_block = ""
+    # Collect fragments and join once; the block can be several kB for large contracts
+    parts: list[str] = []
+    append = parts.append
+
+    # Sections rendered as a header followed by one entry per line
+    def add_lines(header: str, items: list[Any], item_suffix: str = "\n", trailer: str = "\n") -> None:
+        append(header)
+        parts.extend(f"{item}{item_suffix}" for item in items)
+        append(trailer)
 
     # Add custom types if available (HIGHEST PRIORITY - needed for bitpacked params)
     if source_code.get("custom_types"):
-        code_block += "// Custom types:\n"
-        for custom_type in source_code["custom_types"]:
-            code_block += f"{custom_type}\n"
-        code_block += "\n"
+        add_lines("// Custom types:\n", source_code["custom_types"])
 
     # Add using statements if available
     if source_code.get("using_statements"):
-        code_block += "// Using statements:\n"
-        for using_stmt in source_code["using_statements"]:
-            code_block += f"{using_stmt}\n"
-        code_block += "\n"
+        add_lines("// Using statements:\n", source_code["using_statements"])
 
     # Add function docstring if available
     if source_code.get("function_docstring"):
-        code_block += f"// Docstring:\n{source_code['function_docstring']}\n\n"
+        append(f"// Docstring:\n{source_code['function_docstring']}\n\n")
 
     # Add constants if available
     if source_code.get("constants"):
-        code_block += "// Constants:\n"
-        for constant in source_code["constants"]:
-            code_block += f"{constant}\n"
-        code_block += "\n"
+        add_lines("// Constants:\n", source_code["constants"])
 
     # Add modifiers if available
     if source_code.get("modifiers"):
-        code_block += "// Modifiers:\n"
-        for modifier in source_code["modifiers"]:
-            code_block += f"{modifier}\n\n"
+        add_lines("// Modifiers:\n", source_code["modifiers"], item_suffix="\n\n", trailer="")
 
     # Add structs if available
     if source_code.get("structs"):
-        code_block += "// Structs:\n"
-        for struct in source_code["structs"]:
-            code_block += f"{struct}\n"
-        code_block += "\n"
+        add_lines("// Structs:\n", source_code["structs"])
 
     # Add enums if available
     if source_code.get("enums"):
-        code_block += "// Enums:\n"
-        for enum in source_code["enums"]:
-            code_block += f"{enum}\n"
-        code_block += "\n"
+        add_lines("// Enums:\n", source_code["enums"])
 
     # Add main function
-    code_block += "// Main function:\n"
-    code_block += source_code["function"]
+    append("// Main function:\n")
+    append(source_code["function"])
 
     # Add internal functions if available
     if source_code.get("internal_functions"):
-        code_block += "\n\n// Internal functions called:\n"
+        append("\n\n// Internal functions called:\n")
         for internal_func in source_code["internal_functions"]:
             if internal_func.get("docstring"):
-                code_block += f"{internal_func['docstring']}\n"
-            code_block += f"{internal_func['body']}\n\n"
+                append(f"{internal_func['docstring']}\n")
+            append(f"{internal_func['body']}\n\n")
 
     # Add parent functions (from super. calls) if available
     if source_code.get("parent_functions"):
-        code_block += "\n\n// Parent contract implementations (from super. calls):\n"
+        append("\n\n// Parent contract implementations (from super. calls):\n")
         for parent_func in source_code["parent_functions"]:
             parent_name = parent_func.get("parent_contract", "Unknown")
             func_name = parent_func.get("function_name", "unknown")
-            code_block += f"// From {parent_name}.{func_name}():\n"
-            code_block += f"{parent_func['body']}\n\n"
+            append(f"// From {parent_name}.{func_name}():\n{parent_func['body']}\n\n")
 
     # Add libraries if available (LOWEST PRIORITY - shown last)
     if source_code.get("libraries"):
-        code_block += "\n// Libraries:\n"
-        for library in source_code["libraries"]:
-            code_block += f"{library}\n\n"
+        add_lines("\n// Libraries:\n", source_code["libraries"], item_suffix="\n\n", trailer="")
 
     # Add truncation warning if needed
     if source_code.get("truncated"):
-        code_block += "\n// ⚠️ Note: Code was truncated to fit within line limit\n"
+        append("\n// ⚠️ Note: Code was truncated to fit within line limit\n")
 
-    return code_block
+    return "".join(parts)
 
 
 def _truncate_value(val: Any, max_len: int = 120) -> str:
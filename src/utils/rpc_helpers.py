@@ -4,9 +4,17 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 DEFAULT_RPC_URLS = {
     1: "https://eth.llamarpc.com",
@@ -20,6 +28,11 @@ DEFAULT_RPC_URLS = {
     1116: "https://rpc.coredao.org",
 }
 
+ETHERSCAN_API_HOST = "api.etherscan.io"
+# Free Etherscan keys allow 5 calls/sec
+ETHERSCAN_CALLS_PER_SECOND = 5
+# Public Blockscout instances throttle anonymous API clients per host
+BLOCKSCOUT_CALLS_PER_SECOND = 5
 ETHERSCAN_CHAIN_COVERAGE_ERROR = "Free API access is not supported for this chain"
 _ETHERSCAN_CHAIN_COVERAGE_UNSUPPORTED_CHAINS: set[int] = set()
 _ETHERSCAN_PROXY_ETH_CALL_UNSUPPORTED_CHAINS: set[int] = set()
@@ -27,6 +40,90 @@ _ETHERSCAN_CONTRACT_ENDPOINT_UNSUPPORTED_CHAINS: set[int] = set()
 _ETHERSCAN_TX_ENDPOINT_UNSUPPORTED_CHAINS: set[int] = set()
 
 
+class RateLimiter:
+    """
+    Thread-safe pacing limiter allowing at most ``rate_per_sec`` calls per second.
+
+    Each ``acquire()`` reserves the next free slot under a lock and sleeps outside it, so
+    concurrent callers are spaced out instead of bursting past explorer rate limits.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self._min_interval = 1.0 / rate_per_sec
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    Session that paces requests to selected hosts through shared ``RateLimiter`` instances.
+
+    Every client holding the session is throttled together, so the limit holds no matter how
+    many threads or fetchers issue explorer calls, and requests to other hosts are untouched.
+    """
+
+    def __init__(self, host_limiters: dict[str, RateLimiter]):
+        super().__init__()
+        self.host_limiters = host_limiters
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        host = urlsplit(url if isinstance(url, str) else url.decode()).hostname or ""
+        limiter = self.host_limiters.get(host)
+        if limiter is not None:
+            limiter.acquire()
+        return super().request(method, url, *args, **kwargs)
+
+
+def build_http_session(
+    pool_maxsize: int = 32, *, host_limiters: dict[str, RateLimiter] | None = None
+) -> requests.Session:
+    """
+    Create a pooled HTTP session for explorer and RPC calls.
+
+    Keeps connections (and TLS sessions) alive across requests to the same host and retries
+    idempotent requests on transient 429/5xx responses with a short backoff. When
+    ``host_limiters`` is given, requests to those hosts wait for their limiter first.
+    """
+    session = RateLimitedSession(host_limiters) if host_limiters else requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def blockscout_host_limiters(base_urls: Iterable[str]) -> dict[str, RateLimiter]:
+    """Return a fresh limiter for each distinct host among the Blockscout ``base_urls``."""
+    hosts = {urlsplit(url).hostname for url in base_urls}
+    return {host: RateLimiter(BLOCKSCOUT_CALLS_PER_SECOND) for host in hosts if host}
+
+
+def build_explorer_session(blockscout_urls: Iterable[str] = ()) -> requests.Session:
+    """
+    Create a pooled session with its own explorer limiters, for clients used on their own.
+
+    Etherscan is always paced; each host in ``blockscout_urls`` gets a limiter of its own.
+    """
+    return build_http_session(
+        host_limiters={
+            ETHERSCAN_API_HOST: RateLimiter(ETHERSCAN_CALLS_PER_SECOND),
+            **blockscout_host_limiters(blockscout_urls),
+        }
+    )
+
+
 def _resolve_infura_url(chain_id: int) -> str | None:
     """Resolve an Infura URL when a key is configured for supported chains."""
     infura_key = os.getenv(f"INFURA_RPC_KEY_{chain_id}") or os.getenv("INFURA_RPC_KEY") or os.getenv("INFURA_API_KEY")
@@ -62,6 +159,12 @@ def resolve_rpc_url(chain_id: int) -> str | None:
     return None
 
 
+def has_dedicated_rpc_url(chain_id: int) -> bool:
+    """Return True when the chain's RPC URL comes from configuration rather than the public defaults."""
+    rpc_url = resolve_rpc_url(chain_id)
+    return bool(rpc_url) and rpc_url != DEFAULT_RPC_URLS.get(chain_id)
+
+
 def etherscan_response_indicates_chain_unsupported(payload: object) -> bool:
     """Return True when an explorer response indicates free-tier chain coverage is unavailable."""
     if isinstance(payload, dict):
@@ -135,6 +238,7 @@ def rpc_request(
     params: list[Any],
     *,
     timeout: int = 10,
+    session: requests.Session | None = None,
 ) -> tuple[Any | None, str | None, str | None]:
     """
     Perform a raw JSON-RPC request.
@@ -154,8 +258,9 @@ def rpc_request(
         "params": params,
     }
 
+    post = session.post if session else requests.post
     try:
-        response = requests.post(rpc_url, json=payload, timeout=timeout)
+        response = post(rpc_url, json=payload, timeout=timeout)
         response.raise_for_status()
         rpc_data = response.json()
     except Exception as exc:  # pragma: no cover - network failures are environment-specific
@@ -173,12 +278,79 @@ def rpc_request(
     return rpc_data.get("result"), None, display_rpc_url
 
 
+def rpc_batch_request(
+    chain_id: int,
+    calls: list[tuple[str, list[Any]]],
+    *,
+    timeout: int = 10,
+    max_batch_size: int = 10,
+    session: requests.Session | None = None,
+) -> tuple[list[tuple[Any | None, str | None]] | None, str | None, str | None]:
+    """
+    Perform several JSON-RPC calls as batch POSTs of at most ``max_batch_size`` entries.
+
+    Some public endpoints cap batches at 10 entries, hence the default chunk size.
+
+    Returns:
+        tuple(per_call_results_or_none, error_message_or_none, rpc_url_or_none)
+
+        ``per_call_results`` holds one ``(result, error)`` pair per call, in call order.
+        It is None when the endpoint rejects batching altogether so callers can fall back.
+    """
+    rpc_url = resolve_rpc_url(chain_id)
+    if not rpc_url:
+        return None, "No RPC URL configured", None
+    display_rpc_url = _display_rpc_url(rpc_url)
+
+    post = session.post if session else requests.post
+    results: list[tuple[Any | None, str | None]] = []
+    for offset in range(0, len(calls), max_batch_size):
+        chunk = calls[offset : offset + max_batch_size]
+        payload = [
+            {"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+            for index, (method, params) in enumerate(chunk)
+        ]
+
+        try:
+            response = post(rpc_url, json=payload, timeout=timeout)
+            response.raise_for_status()
+            rpc_data = response.json()
+        except Exception as exc:  # pragma: no cover - network failures are environment-specific
+            return None, str(exc), display_rpc_url
+
+        # Endpoints without batch support answer with a single error object instead of an array
+        if not isinstance(rpc_data, list):
+            error = rpc_data.get("error") if isinstance(rpc_data, dict) else None
+            if isinstance(error, dict):
+                error = error.get("message") or str(error)
+            return None, str(error or "Batch requests not supported"), display_rpc_url
+
+        # Responses may come back in any order; map them back by id
+        by_id = {item.get("id"): item for item in rpc_data if isinstance(item, dict)}
+        for index in range(len(chunk)):
+            item = by_id.get(index)
+            if item is None:
+                results.append((None, "Missing batch response entry"))
+            elif "error" in item:
+                error = item["error"]
+                if isinstance(error, dict):
+                    error = error.get("message") or str(error)
+                results.append((None, str(error)))
+            elif "result" not in item:
+                results.append((None, "Missing result field"))
+            else:
+                results.append((item["result"], None))
+
+    return results, None, display_rpc_url
+
+
 def rpc_eth_call(
     chain_id: int,
     to: str,
     data: str,
     *,
     timeout: int = 10,
+    session: requests.Session | None = None,
 ) -> tuple[str | None, str | None, str | None]:
     """
     Perform a raw JSON-RPC eth_call.
@@ -191,6 +363,7 @@ def rpc_eth_call(
         "eth_call",
         [{"to": to, "data": data}, "latest"],
         timeout=timeout,
+        session=session,
     )
 
 
@@ -221,6 +394,7 @@ def rpc_get_transaction_by_hash(
     tx_hash: str,
     *,
     timeout: int = 10,
+    session: requests.Session | None = None,
 ) -> tuple[dict[str, Any] | None, str | None, str | None]:
     """
     Fetch a full transaction object via JSON-RPC eth_getTransactionByHash.
@@ -228,7 +402,9 @@ def rpc_get_transaction_by_hash(
     Returns:
         tuple(transaction_dict_or_none, error_message_or_none, rpc_url_or_none)
     """
-    result, error, rpc_url = rpc_request(chain_id, "eth_getTransactionByHash", [tx_hash], timeout=timeout)
+    result, error, rpc_url = rpc_request(
+        chain_id, "eth_getTransactionByHash", [tx_hash], timeout=timeout, session=session
+    )
     if error:
         return None, error, rpc_url
     if result is None:
@@ -126,8 +126,10 @@ def _fetch_tx_fields(
     tx_hash: str,
     chain_id: int,
     etherscan_api_key: str,
+    session: requests.Session | None = None,
 ) -> dict[str, Any] | None:
     """Fetch transaction fields with explorer-first behavior and RPC fallback."""
+    get = session.get if session else requests.get
     use_explorer = bool(etherscan_api_key) and not is_etherscan_tx_endpoint_unsupported(chain_id)
     if use_explorer:
         url = f"https://api.etherscan.io/v2/api?chainid={chain_id}"
@@ -140,7 +142,7 @@ def _fetch_tx_fields(
 
         for attempt in range(RAW_TX_MAX_RETRIES):
             try:
-                resp = requests.get(url, params=params, timeout=15)
+                resp = get(url, params=params, timeout=15)
                 resp.raise_for_status()
                 data = resp.json()
                 result = data.get("result")
@@ -192,7 +194,7 @@ def _fetch_tx_fields(
         )
 
     for attempt in range(RAW_TX_MAX_RETRIES):
-        result, error_msg, rpc_url = rpc_get_transaction_by_hash(chain_id, tx_hash, timeout=15)
+        result, error_msg, rpc_url = rpc_get_transaction_by_hash(chain_id, tx_hash, timeout=15, session=session)
         if result:
             logger.info("[RAW_TX] Loaded tx %s via RPC fallback %s", tx_hash, rpc_url)
             return result
@@ -221,6 +223,7 @@ def fetch_raw_transaction(
     tx_hash: str,
     chain_id: int,
     etherscan_api_key: str,
+    session: requests.Session | None = None,
 ) -> str | None:
     """
     Fetch a transaction by hash and return its raw RLP-encoded form.
@@ -229,11 +232,12 @@ def fetch_raw_transaction(
         tx_hash: Transaction hash (0x-prefixed).
         chain_id: Chain ID.
         etherscan_api_key: Explorer API key, used before RPC fallback when supported.
+        session: Shared HTTP session whose explorer rate limits apply (plain requests if omitted).
 
     Returns:
         Raw signed transaction hex string, or None on failure.
     """
-    result = _fetch_tx_fields(tx_hash, chain_id, etherscan_api_key)
+    result = _fetch_tx_fields(tx_hash, chain_id, etherscan_api_key, session)
     if not result:
         return None
 
@@ -254,6 +258,7 @@ async def fetch_raw_transaction_async(
     tx_hash: str,
     chain_id: int,
     etherscan_api_key: str,
+    session: requests.Session | None = None,
 ) -> str | None:
     """Async wrapper — offloads blocking HTTP + RLP to a thread."""
-    return await asyncio.to_thread(fetch_raw_transaction, tx_hash, chain_id, etherscan_api_key)
+    return await asyncio.to_thread(fetch_raw_transaction, tx_hash, chain_id, etherscan_api_key, session)
@@ -20,6 +20,7 @@ from typing import Any, TypedDict
 
 import requests
 
+from ..rpc_helpers import build_explorer_session
 from .raw_tx import fetch_raw_transaction_async
 
 logger = logging.getLogger(__name__)
@@ -227,8 +228,11 @@ class ScreenshotRunner:
         cs_tester_root: str | None = None,
         coin_apps_path: str | None = None,
         device: str = "stax",
+        session: requests.Session | None = None,
     ):
         self.etherscan_api_key = etherscan_api_key
+        # Raw transaction lookups hit Etherscan; share the analyzer's session so its rate limit holds
+        self.session = session or build_explorer_session()
         self.cs_tester_root = Path(cs_tester_root or os.getenv("CS_TESTER_ROOT", DEFAULT_CS_TESTER_ROOT))
         self.coin_apps_path = Path(coin_apps_path or os.getenv("COIN_APPS_PATH", DEFAULT_COIN_APPS_PATH))
         self.eth_app_elf_root = Path(os.getenv("ETH_APP_ELF_ROOT", DEFAULT_ETH_APP_ELF_ROOT))
@@ -738,6 +742,7 @@ class ScreenshotRunner:
                             tx_hash,
                             chain_id,
                             self.etherscan_api_key,
+                            self.session,
                         ),
                     )
                 )
@@ -0,0 +1,18 @@
+"""Function selector helpers shared by the descriptor, ABI and source-code modules."""
+
+import re
+from functools import lru_cache
+
+from eth_hash.auto import keccak
+
+# Descriptor format keys and lookups that are already a 4-byte selector rather than a signature
+SELECTOR_RE = re.compile(r"0x[0-9a-fA-F]{8}")
+
+
+# The same signatures are hashed over and over (every format key, ABI entry and source
+# function candidate), so selectors are memoized process-wide. eth_hash is called directly on
+# the encoded bytes to skip eth_utils' input-type dispatch on every miss.
+@lru_cache(maxsize=8192)
+def signature_selector(signature: str) -> str:
+    """Return the 4-byte selector (``0x``-prefixed hex) for a canonical function signature."""
+    return "0x" + keccak(signature.encode("utf-8")).hex()[:8]
@@ -7,6 +7,9 @@ from starlette.testclient import TestClient
 
 # Local tests: avoid requiring real OIDC / secrets when importing the service app.
 os.environ.setdefault("DISABLE_OIDC_AUTH", "1")
+# Keep the persistent caches out of the developer's home directory during tests.
+os.environ.setdefault("ERC7730_CACHE_DIR", "0")
+os.environ.setdefault("ERC7730_DETECTION_CACHE", "0")
 
 
 @pytest.fixture
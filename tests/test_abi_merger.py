@@ -0,0 +1,86 @@
+"""Tests for multi-deployment ABI fetching, merging and explorer rate limiting."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.abi.merger import merge_abis_from_deployments
+
+
+def _function(name: str) -> dict:
+    return {"type": "function", "name": name, "inputs": [], "outputs": []}
+
+
+def test_concurrent_fetch_merges_in_deployment_order() -> None:
+    deployments = [
+        {"chainId": 1, "address": "0x" + "11" * 20},
+        {"chainId": 10, "address": "0x" + "22" * 20},
+    ]
+
+    def fetch(address: str, chain_id: int, api_key: str):
+        # The first deployment answers last; merge order must not depend on timing
+        time.sleep(0.05 if chain_id == 1 else 0)
+        return [_function("shared"), _function(f"only{chain_id}")]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        abi, fetch_results, _ = merge_abis_from_deployments(deployments, fetch, "key", executor=executor)
+
+    assert [item["name"] for item in abi] == ["only1", "only10", "shared"]
+    # chain 1 is merged first even though it responded last
+    assert fetch_results[1]["new_functions"] == 2
+    assert fetch_results[10]["duplicate_functions"] == 1
+
+
+def test_shared_session_paces_only_etherscan_requests(monkeypatch) -> None:
+    import requests
+
+    from utils.core import ERC7730Analyzer
+
+    monkeypatch.setattr(requests.Session, "request", lambda self, method, url, *args, **kwargs: url)
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    acquired = []
+    monkeypatch.setattr(analyzer._etherscan_limiter, "acquire", lambda: acquired.append(True))
+
+    analyzer.tx_fetcher.session.get("https://api.etherscan.io/v2/api?chainid=1")
+    analyzer.source_extractor.session.get("https://eth.blockscout.com/api/v2/stats")
+
+    assert acquired == [True]
+
+
+def test_fetch_contract_abi_sends_every_request_through_session(monkeypatch) -> None:
+    import json
+
+    from utils import abi as abi_module
+
+    class FakeResponse:
+        content = json.dumps({"status": "1", "result": json.dumps([_function("foo")])}).encode()
+
+        def raise_for_status(self) -> None:
+            pass
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        def get(self, url, params=None, timeout=None):
+            self.urls.append(url)
+            return FakeResponse()
+
+    session = FakeSession()
+    seen_sessions = []
+
+    def no_diamond(address, chain_id, api_key, *, session=None):
+        seen_sessions.append(session)
+        return None
+
+    def no_proxy(address, chain_id, api_key, *, session=None):
+        seen_sessions.append(session)
+        return None
+
+    monkeypatch.setattr(abi_module, "detect_diamond_proxy", no_diamond)
+    monkeypatch.setattr(abi_module, "detect_proxy_implementation", no_proxy)
+    abi, selector_sources, is_diamond = abi_module.fetch_contract_abi("0x" + "11" * 20, 1, "key", session=session)
+
+    assert abi == [_function("foo")]
+    assert (selector_sources, is_diamond) == ({}, False)
+    assert seen_sessions == [session, session]
+    assert len(session.urls) == 1
@@ -0,0 +1,314 @@
+"""Tests for streaming audit tasks onto a background event loop."""
+
+import asyncio
+
+from utils.auditing import AuditResult, AuditTask, AuditTaskStream
+from utils.auditing import batch as audit_batch
+
+
+class _FakeClient:
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _task(selector: str) -> AuditTask:
+    return AuditTask(
+        selector=selector,
+        function_signature=f"f_{selector}()",
+        decoded_transactions=[],
+        erc7730_format={},
+        source_code=None,
+        use_smart_referencing=True,
+        erc4626_context=None,
+        erc20_context=None,
+        descriptor_context=None,
+        abi_resolution=None,
+        source_resolution=None,
+        analysis_mode="single",
+    )
+
+
+def test_audit_stream_runs_tasks_and_keeps_submission_order(monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(audit_batch, "AsyncOpenAI", lambda: client)
+
+    async def fake_run(task, client, semaphore, max_retries):
+        if task.selector == "0x02":
+            raise RuntimeError("boom")
+        # Finish later tasks first so results have to be re-ordered
+        await asyncio.sleep(0.01 if task.selector == "0x01" else 0)
+        return AuditResult(
+            selector=task.selector,
+            function_signature=task.function_signature,
+            critical_report="",
+            detailed_report="",
+            report_data={},
+            success=True,
+        )
+
+    monkeypatch.setattr(audit_batch, "_run_task_with_selected_mode", fake_run)
+    audit_batch.close_shared_audit_runtime()
+    try:
+        stream = AuditTaskStream(max_concurrent=2)
+        for selector in ("0x01", "0x02", "0x03"):
+            stream.submit(_task(selector))
+        results = stream.results()
+        stream.close()
+
+        # Later runs reuse the same client (and its warm connections) until the process exits
+        assert AuditTaskStream()._client is client
+        assert client.closed is False
+    finally:
+        audit_batch.close_shared_audit_runtime()
+
+    assert [r.selector for r in results] == ["0x01", "0x02", "0x03"]
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == "boom"
+    assert client.closed is True
+
+
+def test_single_pass_payload_is_serialized_once_and_reused_on_retry(monkeypatch) -> None:
+    import json
+
+    sent = []
+
+    class _FailingResponses:
+        async def parse(self, *, input, **kwargs):
+            sent.append(input[1]["content"])
+            raise RuntimeError("rate limited")
+
+    class _Client:
+        responses = _FailingResponses()
+
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(audit_batch.asyncio, "sleep", no_sleep)
+    task = audit_batch.prepare_audit_task(
+        selector="0x01",
+        decoded_transactions=[],
+        erc7730_format={"intent": "Send", "fields": []},
+        function_signature="f()",
+        protocol_name="Protocol",
+    )
+    assert json.loads(task.audit_payload_json) == task.audit_payload
+    # Stable fields lead and the per-run transaction samples close the prompt, with nested keys sorted
+    assert task.audit_payload_json.startswith(
+        '{"function_signature":"f()","selector":"0x01","erc7730_format":{"fields"'
+    )
+    assert task.audit_payload_json.endswith(',"protocol_name":"Protocol","decoded_transactions":[]}')
+
+    # Retries must resend the prepared string rather than re-serializing the payload
+    task.audit_payload = None
+    result = asyncio.run(
+        audit_batch.generate_clear_signing_audit_async(task, _Client(), asyncio.Semaphore(1), max_retries=1)
+    )
+
+    assert result.success is False
+    assert sent == [task.audit_payload_json, task.audit_payload_json]
+
+
+def test_sorted_payload_serialization_matches_stdlib_output() -> None:
+    import json
+
+    from utils import fast_json
+
+    # uint256 amounts exceed 64 bits and descriptor labels may carry non-ASCII text
+    payload = {"z": [2**255, "€ fee"], "a": {"nested": True, "b": None, "0": 1.5}}
+    assert fast_json.dumps_sorted(payload) == json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def test_payload_hash_ignores_nested_key_order() -> None:
+    def prepare(erc7730_format, decoded_transactions):
+        return audit_batch.prepare_audit_task(
+            selector="0x01",
+            decoded_transactions=decoded_transactions,
+            erc7730_format=erc7730_format,
+            function_signature="f(uint256)",
+        )
+
+    tx = {"hash": "0xaa", "decoded_input": {"amount": 1, "to": "0xbb"}}
+    reordered_tx = {"decoded_input": {"to": "0xbb", "amount": 1}, "hash": "0xaa"}
+    first = prepare({"intent": "Send", "fields": []}, [tx])
+    second = prepare({"fields": [], "intent": "Send"}, [reordered_tx])
+    changed = prepare({"intent": "Swap", "fields": []}, [tx])
+
+    assert first.audit_payload_json == second.audit_payload_json
+    assert first.audit_payload_hash == second.audit_payload_hash
+    assert changed.audit_payload_hash != first.audit_payload_hash
+
+
+def test_identical_single_pass_prompts_reuse_the_cached_report(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from utils.reporting import markdown_formatter
+
+    monkeypatch.setenv("ERC7730_CACHE_DIR", str(tmp_path))
+    label = "v1"
+    monkeypatch.setattr(markdown_formatter, "format_audit_reports", lambda report: (f"critical {label}", "detailed"))
+    calls = []
+
+    class _Responses:
+        async def parse(self, **kwargs):
+            calls.append(kwargs["model"])
+            report = {"summary": "ok", "amount": 10**21}
+            return SimpleNamespace(usage=None, output_parsed=SimpleNamespace(model_dump=lambda: report))
+
+    client = SimpleNamespace(responses=_Responses())
+
+    def run(**overrides):
+        task = audit_batch.prepare_audit_task(
+            selector="0x01",
+            decoded_transactions=[],
+            erc7730_format={"intent": "Send"},
+            function_signature="f()",
+            **overrides,
+        )
+        return asyncio.run(audit_batch.generate_clear_signing_audit_async(task, client, asyncio.Semaphore(1)))
+
+    first = run()
+    label = "v2"
+    again = run()
+    other_model = run(llm_model="gpt-5.4")
+    monkeypatch.setattr(audit_batch, "AUDIT_REPORT_SCHEMA_VERSION", audit_batch.AUDIT_REPORT_SCHEMA_VERSION + 1)
+    new_schema = run()
+
+    assert calls == ["gpt-5.4-nano", "gpt-5.4", "gpt-5.4-nano"]
+    assert again.success is True
+    # Cached reports are re-rendered from their structured data
+    assert (again.critical_report, again.detailed_report) == ("critical v2", "detailed")
+    assert again.report_data == first.report_data
+    # uint256-sized integers survive the cache round trip exactly
+    assert type(again.report_data["amount"]) is int
+    assert again.report_data["amount"] == 10**21
+    assert other_model.success is True
+    assert new_schema.success is True
+
+
+def test_adaptive_semaphore_halves_on_rate_limits_and_recovers() -> None:
+    from utils.auditing.concurrency import AdaptiveSemaphore, record_call_outcome
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    async def scenario():
+        semaphore = AdaptiveSemaphore(8, increase_after=2)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with semaphore:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        record_call_outcome(semaphore, RateLimitError())
+        record_call_outcome(semaphore, RateLimitError())
+        record_call_outcome(semaphore, RuntimeError("not a rate limit"))
+        assert semaphore.limit == 2
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+
+        for _ in range(4):
+            record_call_outcome(semaphore)
+        assert semaphore.limit == 4
+        for _ in range(20):
+            record_call_outcome(semaphore)
+        assert semaphore.limit == 8
+
+    asyncio.run(scenario())
+
+
+def test_deterministic_request_errors_are_not_retried(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from utils.auditing.concurrency import retry_delay
+
+    class BadRequestError(Exception):
+        status_code = 400
+
+    class RateLimitError(Exception):
+        status_code = 429
+        response = SimpleNamespace(headers={"retry-after-ms": "1500"})
+
+    attempts = []
+
+    class _Responses:
+        async def parse(self, **kwargs):
+            attempts.append(kwargs["model"])
+            raise BadRequestError("unknown parameter")
+
+    task = audit_batch.prepare_audit_task(
+        selector="0x01", decoded_transactions=[], erc7730_format={}, function_signature="f()"
+    )
+    result = asyncio.run(
+        audit_batch.generate_clear_signing_audit_async(
+            task, SimpleNamespace(responses=_Responses()), asyncio.Semaphore(1), max_retries=3
+        )
+    )
+
+    assert len(attempts) == 1
+    assert result.success is False
+    assert "after 1 attempt(s)" in result.critical_report
+    assert retry_delay(RateLimitError(), attempt=0, max_delay=30) == 1.5
+    assert all(0 <= retry_delay(RuntimeError(), attempt=3, max_delay=5) <= 5 for _ in range(20))
+
+
+def test_prompt_source_code_drops_empty_placeholders_only() -> None:
+    source_code = {
+        "function": "function f() external {}",
+        "function_docstring": None,
+        "custom_types": [],
+        "libraries": ["library L {}"],
+        "parent_functions": [{"body": "function f() internal {}"}],
+        "constants": [],
+        "total_lines": 3,
+        "truncated": False,
+    }
+    task = audit_batch.prepare_audit_task(
+        selector="0x01", decoded_transactions=[], erc7730_format={}, function_signature="f()", source_code=source_code
+    )
+
+    assert task.audit_payload["source_code"] == {
+        "function": "function f() external {}",
+        "libraries": ["library L {}"],
+        "parent_functions": [{"body": "function f() internal {}"}],
+    }
+    # The untrimmed source stays on the task for the reports
+    assert task.source_code is source_code
+    assert audit_batch._prompt_source_code({"function": "x", "truncated": True}) == {"function": "x", "truncated": True}
+
+
+def test_prompt_transactions_are_trimmed_but_task_keeps_full_samples(monkeypatch) -> None:
+    monkeypatch.setattr(audit_batch, "MAX_PROMPT_TX_SAMPLES", 2)
+    monkeypatch.setattr(audit_batch, "MAX_PROMPT_RECEIPT_LOGS", 3)
+    txs = [
+        {
+            "hash": f"0x{i:02x}",
+            "block": "100",
+            "timestamp": "1700000000",
+            "value": "0",
+            "decoded_input": {"amount": i},
+            "receipt_logs": [{"event": "Transfer"}] * (5 if i == 0 else 1),
+        }
+        for i in range(3)
+    ]
+    task = audit_batch.prepare_audit_task(
+        selector="0x01", decoded_transactions=txs, erc7730_format={}, function_signature="f()"
+    )
+
+    prompt_txs = task.audit_payload["decoded_transactions"]
+    assert [tx["hash"] for tx in prompt_txs] == ["0x00", "0x01"]
+    assert "timestamp" not in prompt_txs[0]
+    assert prompt_txs[0]["block"] == "100"
+    assert len(prompt_txs[0]["receipt_logs"]) == 3
+    assert prompt_txs[0]["receipt_logs_omitted"] == 2
+    assert "receipt_logs_omitted" not in prompt_txs[1]
+    assert task.decoded_transactions is txs
+    assert len(txs[0]["receipt_logs"]) == 5 and "timestamp" in txs[0]
@@ -25,6 +25,20 @@ def test_parse_resolves_sibling_under_include_root(tmp_path: Path) -> None:
     assert data.get("metadata", {}).get("a") == 1
 
 
+def test_parse_keeps_large_integer_constants_exact(tmp_path: Path) -> None:
+    main = tmp_path / "main.json"
+    inc = tmp_path / "inc.json"
+    main.write_text('{"includes": "inc.json", "metadata": {"constants": {"max": 1000000000000000000000}}}')
+    inc.write_text(
+        '{"metadata": {"constants": {"threshold": 115792089237316195423570985008687907853269984665640564039457584007913129639935}}}'
+    )
+
+    an = ERC7730Analyzer(etherscan_api_key="test")
+    constants = an.parse_erc7730_file(main, include_root=tmp_path)["metadata"]["constants"]
+    assert constants["max"] == 10**21 and type(constants["max"]) is int
+    assert constants["threshold"] == 2**256 - 1
+
+
 def test_parse_rejects_traversal_outside_root(tmp_path: Path) -> None:
     root = tmp_path / "job"
     root.mkdir()
@@ -53,3 +67,72 @@ def test_nested_include_uses_including_files_directory(tmp_path: Path) -> None:
     an = ERC7730Analyzer(etherscan_api_key="test")
     data = an.parse_erc7730_file(entry, include_root=root)
     assert data.get("metadata", {}).get("leaf") == 1
+
+
+def test_shared_include_is_parsed_once_and_not_mutated(tmp_path: Path, monkeypatch) -> None:
+    from utils.core import descriptor
+
+    root = tmp_path / "r"
+    root.mkdir()
+    inc = root / "vault.json"
+    inc.write_text('{"metadata": {"constants": {"shared": 1}}, "display": {"formats": {"f()": {}}}}')
+    first = root / "first.json"
+    second = root / "second.json"
+    first.write_text('{"includes": "vault.json", "metadata": {"constants": {"own": 1}}}')
+    second.write_text('{"includes": "vault.json"}')
+
+    descriptor._load_include_cached.cache_clear()
+    loads = []
+    real_load = descriptor._load_json_file
+    monkeypatch.setattr(descriptor, "_load_json_file", lambda path: loads.append(str(path)) or real_load(path))
+
+    an = ERC7730Analyzer(etherscan_api_key="test")
+    first_data = an.parse_erc7730_file(first, include_root=root)
+    second_data = an.parse_erc7730_file(second, include_root=root)
+
+    assert loads.count(str(inc)) == 1
+    assert first_data["metadata"]["constants"] == {"shared": 1, "own": 1}
+    assert second_data["metadata"]["constants"] == {"shared": 1}
+
+
+def test_include_entries_come_first_and_main_file_overrides(tmp_path: Path) -> None:
+    root = tmp_path / "r"
+    root.mkdir()
+    (root / "inc.json").write_text(
+        '{"display": {"formats": {"a()": {"from": "inc"}, "b()": {"from": "inc"}}, "definitions": {"d": 1}}}'
+    )
+    main = root / "main.json"
+    main.write_text('{"includes": "inc.json", "display": {"formats": {"b()": {"from": "main"}, "c()": {}}}}')
+
+    data = ERC7730Analyzer(etherscan_api_key="test").parse_erc7730_file(main, include_root=root)
+
+    formats = data["display"]["formats"]
+    assert list(formats) == ["a()", "b()", "c()"]
+    assert formats["b()"] == {"from": "main"}
+    assert data["display"]["definitions"] == {"d": 1}
+
+
+def test_include_chain_folds_innermost_first(tmp_path: Path) -> None:
+    root = tmp_path / "r"
+    root.mkdir()
+    (root / "leaf.json").write_text('{"metadata": {"constants": {"x": "leaf", "y": "leaf"}}}')
+    (root / "mid.json").write_text('{"includes": "leaf.json", "metadata": {"constants": {"y": "mid", "z": "mid"}}}')
+    main = root / "main.json"
+    main.write_text('{"includes": "mid.json", "metadata": {"constants": {"z": "main"}}}')
+
+    data = ERC7730Analyzer(etherscan_api_key="test").parse_erc7730_file(main, include_root=root)
+
+    assert data["metadata"]["constants"] == {"x": "leaf", "y": "mid", "z": "main"}
+    assert "includes" not in data
+
+
+def test_parse_rejects_circular_includes(tmp_path: Path) -> None:
+    root = tmp_path / "r"
+    root.mkdir()
+    (root / "a.json").write_text('{"includes": "b.json"}')
+    (root / "b.json").write_text('{"includes": "a.json"}')
+    main = root / "main.json"
+    main.write_text('{"includes": "a.json"}')
+
+    with pytest.raises(ValueError, match="circular include"):
+        ERC7730Analyzer(etherscan_api_key="test").parse_erc7730_file(main, include_root=root)
@@ -0,0 +1,113 @@
+"""Tests for descriptor signature normalization and selector extraction."""
+
+import pytest
+
+from utils.core import ERC7730Analyzer
+from utils.core.descriptor import _canonicalize_signature, _is_canonical_signature
+
+
+@pytest.mark.parametrize(
+    ("signature", "expected"),
+    [
+        ("transfer(address,uint256)", "transfer(address,uint256)"),
+        ("transfer(address to, uint256 amount)", "transfer(address,uint256)"),
+        ("  approve(address spender,uint256 value)  ", "approve(address,uint256)"),
+        ("mint(bytes calldata data, string memory uri)", "mint(bytes,string)"),
+        ("noArgs()", "noArgs()"),
+        (
+            "swap((address src,address dst,uint256 amount) desc, bytes data)",
+            "swap((address,address,uint256),bytes)",
+        ),
+        (
+            "multi(tuple(address token,(uint256 a,uint256 b)[] legs)[2] orders)",
+            "multi((address,(uint256,uint256)[])[2])",
+        ),
+        ("notASignature", "notASignature"),
+    ],
+)
+def test_normalize_function_signature(signature: str, expected: str) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    assert analyzer._normalize_function_signature(signature) == expected
+
+
+def test_split_signature_params_respects_nesting() -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    assert analyzer._split_signature_params("address a,(uint256,bytes) b, uint8") == [
+        "address a",
+        "(uint256,bytes) b",
+        "uint8",
+    ]
+
+
+def test_extract_selectors_hashes_normalized_signatures() -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    selectors, selector_to_format_key = analyzer.extract_selectors(
+        {
+            "display": {
+                "formats": {
+                    "transfer(address to,uint256 amount)": {},
+                    "0x095EA7B3": {},
+                }
+            }
+        }
+    )
+    assert selectors == ["0xa9059cbb", "0x095ea7b3"]
+    assert selector_to_format_key == {
+        "0xa9059cbb": "transfer(address to,uint256 amount)",
+        "0x095ea7b3": "0x095EA7B3",
+    }
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [
+        "transfer(address,uint256)",
+        "noArgs()",
+        "swap((address,address,uint256)[],bytes)",
+        "multi((address,(uint256,uint256)[])[2])",
+    ],
+)
+def test_canonical_signatures_take_fast_path(signature: str) -> None:
+    assert _is_canonical_signature(signature)
+    assert _canonicalize_signature(signature) == signature
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [
+        "transfer(address to,uint256)",
+        "swap(tuple(address,uint256))",
+        "f(uint256,)",
+        "f(a)b",
+        "f(a),(b)",
+        ")f(a)",
+    ],
+)
+def test_non_canonical_signatures_use_full_normalizer(signature: str) -> None:
+    assert not _is_canonical_signature(signature)
+
+
+def test_extract_selectors_reuses_memoized_digests() -> None:
+    from utils.selectors import signature_selector
+
+    descriptor = {"display": {"formats": {"unusualName(address who,uint256 howMuch)": {}}}}
+    ERC7730Analyzer(etherscan_api_key="test").extract_selectors(descriptor)
+    hits = signature_selector.cache_info().hits
+
+    selectors, _ = ERC7730Analyzer(etherscan_api_key="test").extract_selectors(descriptor)
+    assert selectors == [signature_selector("unusualName(address,uint256)")]
+    assert signature_selector.cache_info().hits > hits
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        ("", []),
+        (" address a ,, uint8 ", ["address a", "uint8"]),
+        ("(uint256,(bytes,bool)[]) legs, address", ["(uint256,(bytes,bool)[]) legs", "address"]),
+        # Unbalanced closing parens never push the depth below zero
+        ("uint8), address", ["uint8)", "address"]),
+    ],
+)
+def test_split_signature_params_edge_cases(params: str, expected: list[str]) -> None:
+    assert ERC7730Analyzer(etherscan_api_key="test")._split_signature_params(params) == expected
@@ -0,0 +1,312 @@
+"""Tests for ERC4626/ERC20 detection from contract source code."""
+
+import pytest
+
+from utils.core import ERC7730Analyzer
+from utils.core.detection import (
+    _ERC20_PARENT_MARKERS,
+    _MULTICALL3_ADDRESS,
+    _asset_address_from_result,
+    _find_contract_header_end,
+    _find_matching_brace,
+    _inherits_any,
+    _strip_solidity_noise,
+)
+
+VAULT_SOURCE = """
+// contract Decoy is ERC4626 { }
+abstract contract ERC20 is IERC20 {
+    function transfer(address to, uint256 amount) public returns (bool) {}
+}
+
+abstract contract ERC4626 is ERC20, IERC4626 {
+    function asset() public view returns (address) {}
+}
+
+contract BaseVault is ERC4626 {
+    /* a stray brace in a comment: } */
+}
+
+contract MyVault is BaseVault {
+    function asset() public view override returns (address) { return address(0); }
+}
+"""
+
+TOKEN_SOURCE = """
+abstract contract Context {}
+abstract contract ERC20 is Context, IERC20 {}
+contract MyToken is ERC20 {
+    constructor() {}
+}
+"""
+
+
+def test_find_matching_brace_skips_nested_blocks() -> None:
+    source = "x { a { b } { } } y }"
+    assert _find_matching_brace(source, 2) == 16
+    assert _find_matching_brace("{ {", 0) == -1
+
+
+def test_strip_solidity_noise_drops_comments_and_string_contents() -> None:
+    source = 'string s = "a // not a comment {"; // trailing }\n/* contract X is ERC20 { */ uint x;'
+    assert _strip_solidity_noise(source) == 'string s = ""; \n uint x;'
+
+
+def test_detect_ignores_contracts_declared_in_comments_and_strings() -> None:
+    source = TOKEN_SOURCE + '\n/* contract Shadow is ERC4626 { } */\nstring constant NOTE = "contract Fake {";\n'
+    result = ERC7730Analyzer(etherscan_api_key="test")._detect_erc20_from_source(source)
+    assert result["main_contract"] == "MyToken"
+    assert result["is_erc20"] is True
+
+
+def test_inherits_any_walks_diamond_and_cyclic_graphs() -> None:
+    chain = {
+        "Token": ["Base", "Ownable"],
+        "Base": ["Shared"],
+        "Ownable": ["Shared"],
+        "Shared": ["Base", "IERC20"],
+    }
+    assert _inherits_any("Token", chain, _ERC20_PARENT_MARKERS) is True
+    assert _inherits_any("Token", {"Token": ["A"], "A": ["Token"]}, _ERC20_PARENT_MARKERS) is False
+
+
+def test_detect_erc4626_through_inherited_parent() -> None:
+    result = ERC7730Analyzer(etherscan_api_key="test")._detect_erc4626_from_source(VAULT_SOURCE)
+    assert result["main_contract"] == "MyVault"
+    assert result["is_erc4626"] is True
+    assert result["has_asset_function"] is True
+    assert result["detected_patterns"] == ["inheritance: contract MyVault is BaseVault", "asset() function"]
+
+
+def test_detect_erc4626_uses_explicit_contract_name() -> None:
+    result = ERC7730Analyzer(etherscan_api_key="test")._detect_erc4626_from_source(
+        TOKEN_SOURCE, contract_name="MyToken"
+    )
+    assert result["main_contract"] == "MyToken"
+    assert result["is_erc4626"] is False
+    assert result["has_asset_function"] is False
+
+
+def test_detect_erc20_from_source() -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    token = analyzer._detect_erc20_from_source(TOKEN_SOURCE)
+    assert token["is_erc20"] is True
+    assert token["main_contract"] == "MyToken"
+
+    vault = analyzer._detect_erc20_from_source(VAULT_SOURCE, contract_name="MyVault")
+    assert vault["is_erc20"] is True
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def test_query_erc4626_assets_batch_groups_by_chain(monkeypatch) -> None:
+    posted = []
+
+    def fake_post(url, json, timeout):
+        if isinstance(json, dict):
+            # No Multicall3 on this chain: the eth_call hits an empty account
+            return _FakeResponse({"jsonrpc": "2.0", "id": 1, "result": "0x"})
+        posted.append(json)
+        # Answer out of order to check responses are matched by id
+        return _FakeResponse(
+            [
+                {"jsonrpc": "2.0", "id": item["id"], "result": "0x" + "0" * 24 + item["params"][0]["to"][2:]}
+                for item in reversed(json)
+            ]
+        )
+
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(analyzer._session, "post", fake_post)
+    vaults = [f"0x{i:040x}" for i in range(1, 13)]
+    result = analyzer._query_erc4626_assets_batch([(vault, 1) for vault in vaults])
+
+    assert [len(batch) for batch in posted] == [10, 2]
+    assert result == {(vault, 1): vault for vault in vaults}
+
+
+def test_query_erc4626_assets_batch_uses_multicall3(monkeypatch) -> None:
+    from eth_abi import decode, encode
+
+    posted = []
+
+    def fake_post(url, json, timeout):
+        posted.append(json)
+        call = json["params"][0]
+        assert call["to"] == _MULTICALL3_ADDRESS
+        (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(call["data"][10:]))
+        # The second vault reverts; it must fall back to the per-contract query
+        entries = [
+            (index != 1, bytes(12) + bytes.fromhex(target[2:]) if index != 1 else b"")
+            for index, (target, _allow_failure, _data) in enumerate(calls)
+        ]
+        return _FakeResponse({"jsonrpc": "2.0", "id": 1, "result": "0x" + encode(["(bool,bytes)[]"], [entries]).hex()})
+
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(analyzer._session, "post", fake_post)
+    monkeypatch.setattr(analyzer, "_query_erc4626_asset", lambda address, chain_id: "0x" + "ab" * 20)
+    vaults = [f"0x{i:040x}" for i in range(1, 26)]
+    result = analyzer._query_erc4626_assets_batch([(vault, 1) for vault in vaults])
+
+    assert len(posted) == 2  # 25 vaults -> two aggregate3 calls of at most 20
+    assert result[(vaults[0], 1)] == vaults[0]
+    assert result[(vaults[1], 1)] == "0x" + "ab" * 20
+    assert result[(vaults[21], 1)] == "0x" + "ab" * 20
+    assert result[(vaults[24], 1)] == vaults[24]
+
+
+def test_query_erc4626_assets_batch_falls_back_when_batch_rejected(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(
+        analyzer._session,
+        "post",
+        lambda url, json, timeout: _FakeResponse({"jsonrpc": "2.0", "id": None, "error": {"message": "batch"}}),
+    )
+    fallback_calls = []
+
+    def fake_single(address, chain_id):
+        fallback_calls.append((address, chain_id))
+        return "0x" + "ab" * 20
+
+    monkeypatch.setattr(analyzer, "_query_erc4626_asset", fake_single)
+    result = analyzer._query_erc4626_assets_batch([("0x01", 1), ("0x02", 1)])
+
+    assert fallback_calls == [("0x01", 1), ("0x02", 1)]
+    assert result == {("0x01", 1): "0x" + "ab" * 20, ("0x02", 1): "0x" + "ab" * 20}
+
+
+def test_query_erc4626_assets_batch_first_only_stops_fallback_at_first_asset(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(
+        analyzer._session,
+        "post",
+        lambda url, json, timeout: _FakeResponse({"jsonrpc": "2.0", "id": None, "error": {"message": "batch"}}),
+    )
+    fallback_calls = []
+
+    def fake_single(address, chain_id):
+        fallback_calls.append((address, chain_id))
+        return "0x" + "ab" * 20 if address == "0x02" else None
+
+    monkeypatch.setattr(analyzer, "_query_erc4626_asset", fake_single)
+    targets = [("0x01", 1), ("0x02", 1), ("0x03", 10)]
+    result = analyzer._query_erc4626_assets_batch(targets, first_only=True)
+
+    assert fallback_calls == [("0x01", 1), ("0x02", 1)]
+    assert result == {("0x01", 1): None, ("0x02", 1): "0x" + "ab" * 20, ("0x03", 10): None}
+
+
+def test_query_erc4626_assets_batch_first_only_keeps_deployment_order(monkeypatch) -> None:
+    from utils.rpc_helpers import resolve_rpc_url
+
+    optimism_rpc = resolve_rpc_url(10)
+
+    def fake_post(url, json, timeout):
+        if url != optimism_rpc:
+            return _FakeResponse({"jsonrpc": "2.0", "id": None, "error": {"message": "unavailable"}})
+        if isinstance(json, dict):
+            return _FakeResponse({"jsonrpc": "2.0", "id": 1, "result": "0x"})
+        return _FakeResponse([{"jsonrpc": "2.0", "id": item["id"], "result": "0x" + "cd" * 32} for item in json])
+
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(analyzer._session, "post", fake_post)
+    fallback_calls = []
+
+    def fake_single(address, chain_id):
+        fallback_calls.append((address, chain_id))
+        return "0x" + "ab" * 20
+
+    monkeypatch.setattr(analyzer, "_query_erc4626_asset", fake_single)
+    # The mainnet deployment comes first but only the per-contract fallback can answer it
+    result = analyzer._query_erc4626_assets_batch([("0x01", 1), ("0x03", 10), ("0x02", 1)], first_only=True)
+
+    assert fallback_calls == [("0x01", 1)]
+    assert result[("0x01", 1)] == "0x" + "ab" * 20
+    assert result[("0x02", 1)] is None
+
+
+def test_detect_standards_parses_source_once(monkeypatch) -> None:
+    from utils.core import detection
+
+    parses = []
+    real_parser = detection.SolidityCodeParser
+
+    def counting_parser(code):
+        parses.append(code)
+        return real_parser(code)
+
+    monkeypatch.setattr(detection, "SolidityCodeParser", counting_parser)
+    standards = ERC7730Analyzer(etherscan_api_key="test")._detect_standards_from_source(VAULT_SOURCE)
+
+    assert len(parses) == 1
+    assert standards["erc4626"]["is_erc4626"] is True
+    assert standards["erc20"]["is_erc20"] is True
+    assert standards["erc20"]["main_contract"] == "MyVault"
+
+
+def test_asset_address_from_result() -> None:
+    word = "0x" + "0" * 24 + "00AbCdEf" + "12" * 16
+    assert _asset_address_from_result(word) == "0x00abcdef" + "12" * 16
+    assert _asset_address_from_result("0x" + "0" * 64) is None
+    assert _asset_address_from_result("0x") is None
+    assert _asset_address_from_result("0x" + "zz" * 32) is None
+
+
+def test_detection_cache_reuses_results_across_analyzers(tmp_path, monkeypatch) -> None:
+    from utils.core import detection_cache
+
+    monkeypatch.setenv(detection_cache.DETECTION_CACHE_ENV, str(tmp_path / "detection.sqlite"))
+    detection_cache.get_detection_cache.cache_clear()
+    try:
+        first = ERC7730Analyzer(etherscan_api_key="test")._detect_standards_from_source(VAULT_SOURCE)
+
+        analyzer = ERC7730Analyzer(etherscan_api_key="test")
+        monkeypatch.setattr(analyzer, "_scan_standards_from_source", lambda *args: pytest.fail("expected a cache hit"))
+        assert analyzer._detect_standards_from_source(VAULT_SOURCE) == first
+        assert (tmp_path / "detection.sqlite").exists()
+    finally:
+        cache = detection_cache.get_detection_cache()
+        if cache:
+            cache.close()
+        detection_cache.get_detection_cache.cache_clear()
+
+
+def test_detection_cache_ignores_results_from_other_detector_versions(tmp_path, monkeypatch) -> None:
+    from utils.core import detection_cache
+
+    path = tmp_path / "detection.sqlite"
+    digest = detection_cache.source_digest(VAULT_SOURCE)
+    cache = detection_cache.DetectionCache(path)
+    cache.put(digest, "Vault", {"is_erc4626": True})
+    cache.close()
+
+    monkeypatch.setattr(detection_cache, "DETECTION_VERSION", detection_cache.DETECTION_VERSION + 1)
+    cache = detection_cache.DetectionCache(path)
+    try:
+        assert cache.get(digest, "Vault") is None
+        cache.put(digest, "Vault", {"is_erc4626": False})
+        assert cache.get(digest, "Vault") == {"is_erc4626": False}
+    finally:
+        cache.close()
+
+
+def test_find_contract_header_end_skips_longer_names() -> None:
+    source = "contract VaultFactory {}\ncontract Vault is Base {\n}"
+    header_end = _find_contract_header_end(source, "Vault")
+    assert source[header_end - 1] == "{"
+    assert source[:header_end].endswith("contract Vault is Base {")
+    assert _find_contract_header_end(source, "Missing") == -1
+    # Any whitespace run may separate the keyword from the name
+    for separator in ("\n    ", "\t", "  "):
+        spaced = f"abstract contract{separator}Vault is Base {{\n}}"
+        assert spaced[: _find_contract_header_end(spaced, "Vault")].endswith("is Base {")
+    assert _find_contract_header_end("mycontract Vault {}", "Vault") == -1
+    assert _find_contract_header_end("contractVault {}", "Vault") == -1
@@ -0,0 +1,91 @@
+"""Tests for the on-disk explorer caches."""
+
+import os
+import time
+
+from utils.clients.transactions.fetcher import TransactionFetcher
+from utils.disk_cache import CACHE_DIR_ENV, JsonFileCache, cache_root
+
+
+def test_cache_root_can_be_disabled(monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, "off")
+    assert cache_root() is None
+    cache = JsonFileCache("abi")
+    cache.put("1_0xabc", [1])
+    assert cache.get("1_0xabc") is None
+
+
+def test_json_file_cache_round_trip_and_ttl(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    cache = JsonFileCache("abi", ttl_seconds=60)
+    cache.put("1_0xabc", {"abi": [{"type": "function", "name": "f"}]})
+    assert cache.get("1_0xabc") == {"abi": [{"type": "function", "name": "f"}]}
+
+    # Keys that are not plain identifiers are hashed into a safe file name
+    cache.put("1:0xabc/../x", [1])
+    assert cache.get("1:0xabc/../x") == [1]
+    assert all(path.parent == tmp_path / "abi" for path in tmp_path.rglob("*.json"))
+
+    stale = time.time() - 120
+    os.utime(tmp_path / "abi" / "1_0xabc.json", (stale, stale))
+    assert cache.get("1_0xabc") is None
+
+
+def test_transaction_receipts_are_cached_on_disk(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    tx_hash = "0x" + "ab" * 32
+    lookups = []
+
+    def fake_lookup(self, requested_hash, chain_id):
+        lookups.append(requested_hash)
+        return {"transactionHash": requested_hash, "logs": []}
+
+    monkeypatch.setattr(TransactionFetcher, "_fetch_transaction_receipt_uncached", fake_lookup)
+    first = TransactionFetcher("key").fetch_transaction_receipt(tx_hash, 1)
+    second = TransactionFetcher("key").fetch_transaction_receipt(tx_hash, 1)
+
+    assert first == second == {"transactionHash": tx_hash, "logs": []}
+    assert lookups == [tx_hash]
+
+
+def test_verified_source_is_cached_on_disk(tmp_path, monkeypatch) -> None:
+    from utils.extraction.source_code import SourceCodeExtractor
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    lookups = []
+
+    def fake_etherscan(self, address, chain_id):
+        lookups.append((address, chain_id))
+        return "contract Vault {}" if address == "0xAbC" else None
+
+    monkeypatch.setattr(SourceCodeExtractor, "fetch_source_from_sourcify", lambda self, address, chain_id: None)
+    monkeypatch.setattr(SourceCodeExtractor, "fetch_source_from_etherscan", fake_etherscan)
+    monkeypatch.setattr(SourceCodeExtractor, "fetch_source_from_blockscout", lambda self, address, chain_id: None)
+
+    assert SourceCodeExtractor("key").fetch_verified_source("0xAbC", 1) == "contract Vault {}"
+    assert SourceCodeExtractor("key").fetch_verified_source("0xabc", 1) == "contract Vault {}"
+    # Unverified contracts may be verified later, so misses are not cached
+    assert SourceCodeExtractor("key").fetch_verified_source("0xdef", 1) is None
+    assert SourceCodeExtractor("key").fetch_verified_source("0xdef", 1) is None
+    assert lookups == [("0xAbC", 1), ("0xdef", 1), ("0xdef", 1)]
+
+
+def test_proxy_implementations_are_cached_on_disk(tmp_path, monkeypatch) -> None:
+    from utils.extraction.source_code import SourceCodeExtractor
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    implementation = "0x" + "cd" * 20
+    lookups = []
+
+    def fake_detect(self, address, chain_id):
+        lookups.append(address)
+        return implementation if address == "0xProxy" else None
+
+    monkeypatch.setattr(SourceCodeExtractor, "_detect_proxy_implementation_uncached", fake_detect)
+    for _ in range(2):
+        extractor = SourceCodeExtractor("key")
+        assert extractor.detect_proxy_implementation("0xProxy", 1) == implementation
+        assert extractor.detect_proxy_implementation("0xplain", 1) is None
+
+    # Only detected implementations are stored; non-proxies are looked up again
+    assert lookups == ["0xProxy", "0xplain", "0xplain"]
@@ -0,0 +1,39 @@
+"""Tests for expanding a selector's ERC-7730 format with the metadata it references."""
+
+from utils.reporting.reporter.expansion import expand_erc7730_format_with_refs
+
+DESCRIPTOR = {
+    "metadata": {
+        "owner": "Example",
+        "constants": {"max": "0xff", "unused": 1},
+        "enums": {"mode": {"0": "Off"}, "other": {}},
+        "maps": {"tokens": {}},
+    },
+    "display": {
+        "definitions": {
+            "amount": {"$ref": "$.display.definitions.base", "params": {"threshold": "$.metadata.constants.max"}},
+            "base": {"label": "Amount", "map": "$.metadata.maps.tokens"},
+            "unused": {"label": "Unused"},
+        }
+    },
+}
+
+
+def test_expansion_keeps_only_transitively_referenced_metadata() -> None:
+    selector_format = {
+        "fields": [
+            {"path": "amount", "$ref": "$.display.definitions.amount"},
+            {"path": "mode", "label": "Mode ($.metadata.enums.mode)"},
+        ]
+    }
+
+    expanded = expand_erc7730_format_with_refs(selector_format, DESCRIPTOR, "f(uint256)")
+
+    assert expanded["metadata"] == {
+        "owner": "Example",
+        "constants": {"max": "0xff"},
+        "enums": {"mode": {"0": "Off"}},
+        "maps": {"tokens": {}},
+    }
+    assert set(expanded["display"]["definitions"]) == {"amount", "base"}
+    assert expanded["display"]["formats"] == {"f(uint256)": selector_format}
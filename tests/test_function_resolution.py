@@ -0,0 +1,57 @@
+"""Tests for resolving a selector's function and its dependencies in extracted source."""
+
+from utils.extraction.source_code import SourceCodeExtractor
+from utils.extraction.source_code.dependencies import target
+from utils.extraction.source_code.parser import SolidityCodeParser
+
+SOURCE = """
+struct Order { address maker; uint256 amount; }
+
+abstract contract Base {
+    function cancel(Order calldata order) external virtual {}
+}
+
+contract Exchange is Base {
+    function fill(Order calldata order, uint256 amount) external {}
+    function cancel(Order calldata order) external override {}
+}
+"""
+
+
+def _extracted_code() -> dict:
+    parser = SolidityCodeParser(SOURCE)
+    return {
+        "source_code": SOURCE,
+        "contract_name": "Exchange",
+        "custom_types": parser.extract_custom_types(),
+        "using_statements": parser.extract_using_statements(),
+        "libraries": parser.extract_libraries(),
+        "interfaces": parser.extract_interfaces(),
+        "structs": parser.extract_structs(),
+        "enums": parser.extract_enums(),
+        "constants": parser.extract_constants(),
+        "modifiers": parser.extract_modifiers(),
+        "functions": parser.extract_functions(),
+    }
+
+
+def test_source_wide_lookups_are_built_once_per_extracted_code(monkeypatch) -> None:
+    parsed_sources = []
+    real_parser = target.SolidityCodeParser
+
+    def counting_parser(source):
+        parsed_sources.append(source)
+        return real_parser(source)
+
+    monkeypatch.setattr(target, "SolidityCodeParser", counting_parser)
+    extractor = SourceCodeExtractor("test")
+    extracted_code = _extracted_code()
+
+    fill = extractor.get_function_with_dependencies("fill", extracted_code, "fill((address,uint256),uint256)")
+    cancel = extractor.get_function_with_dependencies("cancel", extracted_code, "cancel((address,uint256))")
+
+    assert "function fill(" in fill["function"]
+    assert "override" in cancel["function"]
+    assert parsed_sources == [SOURCE]
+    _custom_type_mapping, struct_type_mapping = extracted_code["_type_mappings"]
+    assert struct_type_mapping == {"Order": "(address,uint256)"}
@@ -28,6 +28,12 @@ def test_main_passes_descriptor_directory_as_include_root(monkeypatch: pytest.Mo
             captured["analyze_kwargs"] = kwargs
             return {"context": {"$id": "demo"}, "metadata": {}}
 
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            captured["closed"] = True
+
     def _write_summary(results, path, **kwargs):
         path.write_text("# Summary\n")
 
@@ -56,3 +62,4 @@ def test_main_passes_descriptor_directory_as_include_root(monkeypatch: pytest.Mo
 
     assert main_mod.main() == 0
     assert captured["analyze_kwargs"] == {"include_root": descriptor.parent.resolve()}
+    assert captured["closed"] is True
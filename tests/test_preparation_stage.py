@@ -0,0 +1,199 @@
+"""Tests for the audit preparation pipeline stage."""
+
+import time
+
+from utils.core import ERC7730Analyzer
+
+TRANSFER = "0xa9059cbb"
+BALANCE_OF = "0x70a08231"
+
+
+def _hash(index: int) -> str:
+    return f"0x{index:064x}"
+
+
+def test_receipts_are_prefetched_once_and_reused(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    fetched = []
+
+    def fake_receipt(tx_hash, chain_id):
+        fetched.append((chain_id, tx_hash))
+        return {"logs": [], "hash": tx_hash}
+
+    monkeypatch.setattr(analyzer.tx_fetcher, "fetch_transaction_receipt", fake_receipt)
+    deployment = {"chainId": 10, "address": "0x01"}
+    context = {
+        "all_selector_txs": {
+            TRANSFER: [{"hash": _hash(1)}, {"hash": _hash(2)}, {"hash": "manual"}],
+            # View functions cannot emit logs, so their receipts are never requested
+            BALANCE_OF: [{"hash": _hash(3)}],
+        },
+        "selector_function_data": {
+            TRANSFER: {"stateMutability": "nonpayable"},
+            BALANCE_OF: {"stateMutability": "view"},
+        },
+        "deployment_per_selector": {TRANSFER: deployment},
+        "default_deployment": deployment,
+    }
+
+    prefetched = analyzer._prefetch_transaction_receipts(context)
+    assert list(prefetched) == [(10, _hash(1)), (10, _hash(2))]
+
+    receipts = analyzer._fetch_transaction_receipts([_hash(2), "manual", _hash(4)], 10, prefetched)
+    assert [r and r["hash"] for r in receipts] == [_hash(2), None, _hash(4)]
+    assert sorted(fetched) == [(10, _hash(1)), (10, _hash(2)), (10, _hash(4))]
+
+
+def test_token_metadata_is_fetched_once_per_token(monkeypatch) -> None:
+    from utils.clients.transactions import APPROVAL_EVENT_TOPIC, TRANSFER_EVENT_TOPIC
+
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    calls = []
+    monkeypatch.setattr(analyzer.tx_fetcher, "get_token_symbol", lambda token, chain_id: calls.append(("sym", token)))
+    monkeypatch.setattr(analyzer.tx_fetcher, "get_token_decimals", lambda token, chain_id: calls.append(("dec", token)))
+    analyzer.tx_fetcher.token_symbol_cache["1:0xcached"] = "C"
+    analyzer.tx_fetcher.token_decimals_cache["1:0xcached"] = 6
+
+    topics = ["0x" + "00" * 32] * 2
+    receipts = [
+        {"logs": [{"address": "0xaa", "topics": [TRANSFER_EVENT_TOPIC, *topics]}]},
+        None,
+        {
+            "logs": [
+                {"address": "0xaa", "topics": [APPROVAL_EVENT_TOPIC, *topics]},
+                {"address": "0xcached", "topics": [TRANSFER_EVENT_TOPIC, *topics]},
+                {"address": "0xbb", "topics": ["0x" + "11" * 32, *topics]},
+            ]
+        },
+    ]
+    analyzer._prefetch_token_metadata(receipts, 1)
+
+    assert sorted(calls) == [("dec", "0xaa"), ("sym", "0xaa")]
+
+
+def test_token_metadata_does_not_wait_for_prefetched_receipts(monkeypatch) -> None:
+    import threading
+
+    from utils.clients.transactions import TRANSFER_EVENT_TOPIC
+
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    release = threading.Event()
+    monkeypatch.setattr(analyzer.tx_fetcher, "supports_receipt_batching", lambda chain_id: False)
+    monkeypatch.setattr(
+        analyzer.tx_fetcher, "fetch_transaction_receipt", lambda tx_hash, chain_id: release.wait(5) and None
+    )
+    monkeypatch.setattr(analyzer.tx_fetcher, "get_token_symbol", lambda token, chain_id: "TKN")
+    monkeypatch.setattr(analyzer.tx_fetcher, "get_token_decimals", lambda token, chain_id: 18)
+    # Late selectors' receipts occupy every I/O worker and stay unresolved
+    context = {
+        "all_selector_txs": {BALANCE_OF: [{"hash": _hash(index)} for index in range(1, 21)]},
+        "selector_function_data": {},
+        "deployment_per_selector": {},
+        "default_deployment": {"chainId": 1, "address": "0x01"},
+    }
+    prefetched = analyzer._prefetch_transaction_receipts(context)
+
+    early_receipt = {"logs": [{"address": "0xaa", "topics": [TRANSFER_EVENT_TOPIC, *["0x" + "00" * 32] * 2]}]}
+    try:
+        worker = threading.Thread(target=analyzer._prefetch_token_metadata, args=([early_receipt], 1), daemon=True)
+        worker.start()
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+        assert not any(future.done() for future in prefetched.values())
+    finally:
+        release.set()
+        analyzer.close()
+
+
+def test_fetch_transaction_receipts_preserves_order_and_skips_invalid_hashes(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    fetched = []
+
+    def fake_receipt(tx_hash, chain_id):
+        fetched.append(tx_hash)
+        time.sleep(0.02 if tx_hash.endswith("1") else 0)
+        return {"logs": [], "transactionHash": tx_hash}
+
+    monkeypatch.setattr(analyzer.tx_fetcher, "fetch_transaction_receipt", fake_receipt)
+    hashes = ["0x" + "0" * 63 + "1", "manual_tx_1", "0x" + "0" * 63 + "2"]
+    receipts = analyzer._fetch_transaction_receipts(hashes, 1)
+
+    assert sorted(fetched) == [hashes[0], hashes[2]]
+    assert [receipt and receipt["transactionHash"] for receipt in receipts] == [hashes[0], None, hashes[2]]
+
+
+def test_receipts_are_batched_on_chains_with_a_configured_node(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    fetcher = analyzer.tx_fetcher
+    batches = []
+    single = []
+
+    def fake_batch(tx_hashes, chain_id):
+        batches.append(list(tx_hashes))
+        # The node does not know the second transaction; it must fall back to a single lookup
+        return {tx_hash: {"hash": tx_hash} for tx_hash in tx_hashes if tx_hash != _hash(2)}
+
+    def fake_receipt(tx_hash, chain_id):
+        single.append(tx_hash)
+        return {"hash": tx_hash, "fallback": True}
+
+    monkeypatch.setattr(fetcher, "supports_receipt_batching", lambda chain_id: chain_id == 1)
+    monkeypatch.setattr(fetcher, "fetch_transaction_receipts_batch", fake_batch)
+    monkeypatch.setattr(fetcher, "fetch_transaction_receipt", fake_receipt)
+    mainnet = {"chainId": 1, "address": "0x01"}
+    context = {
+        "all_selector_txs": {
+            TRANSFER: [{"hash": _hash(1)}, {"hash": _hash(2)}, {"hash": _hash(3)}],
+            BALANCE_OF: [{"hash": _hash(4)}],
+        },
+        "selector_function_data": {},
+        "deployment_per_selector": {BALANCE_OF: {"chainId": 10, "address": "0x02"}},
+        "default_deployment": mainnet,
+    }
+
+    prefetched = analyzer._prefetch_transaction_receipts(context)
+    receipts = analyzer._fetch_transaction_receipts([_hash(1), _hash(2), _hash(3)], 1, prefetched)
+    other_chain = analyzer._fetch_transaction_receipts([_hash(4)], 10, prefetched)
+
+    assert batches == [[_hash(1), _hash(2), _hash(3)]]
+    assert [r.get("fallback", False) for r in receipts] == [False, True, False]
+    assert other_chain[0]["fallback"] is True
+    assert sorted(single) == [_hash(2), _hash(4)]
+
+
+def test_identical_calldata_is_decoded_once(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    decoded = []
+
+    def fake_decode(tx_input, function_data, abi_helper):
+        decoded.append(tx_input)
+        return None if tx_input.endswith("ff") else {"amount": tx_input[-2:], "_raw_fallback": "raw"}
+
+    monkeypatch.setattr(analyzer.tx_fetcher, "decode_transaction_input", fake_decode)
+    deployment = {"chainId": 1, "address": "0x01"}
+    calldata = [TRANSFER + "01", TRANSFER + "02", TRANSFER + "01", TRANSFER + "ff", TRANSFER + "ff"]
+    context = {
+        "selectors": [TRANSFER],
+        "all_selector_txs": {
+            TRANSFER: [
+                {"hash": _hash(i), "input": data, "blockNumber": "1", "timeStamp": "0", "from": "0x02", "value": "0"}
+                for i, data in enumerate(calldata)
+            ]
+        },
+        "selector_function_data": {
+            TRANSFER: {"name": "transfer", "signature": "transfer(address,uint256)", "stateMutability": "view"}
+        },
+        "selector_abi_resolution": {TRANSFER: {"status": "merged_abi"}},
+        "deployment_per_selector": {},
+        "default_deployment": deployment,
+        "deployments": [deployment],
+        "erc7730_data": {},
+        "abi": [],
+    }
+
+    analyzer._prepare_selector_audit_tasks(context)
+
+    assert decoded == [TRANSFER + "01", TRANSFER + "02", TRANSFER + "ff"]
+    decoded_txs = context["prepared_selectors"][0]["decoded_txs"]
+    assert [tx["hash"] for tx in decoded_txs] == [_hash(0), _hash(1), _hash(2)]
+    assert decoded_txs[2]["decoded_input"] == {"amount": "01", "_raw_fallback": "raw"}
@@ -0,0 +1,58 @@
+"""Tests for the shared HTTP session and explorer rate limiting."""
+
+import time
+
+import pytest
+import requests
+
+from utils.core import ERC7730Analyzer
+from utils.rpc_helpers import ETHERSCAN_API_HOST, RateLimiter, build_explorer_session
+
+
+def test_rate_limiter_spaces_calls() -> None:
+    limiter = RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_explorer_session_paces_each_blockscout_host(monkeypatch) -> None:
+    session = build_explorer_session(
+        ["https://base.blockscout.com", "https://explorer.celo.org/api", "https://explorer.celo.org/alfajores/api"]
+    )
+    assert set(session.host_limiters) == {ETHERSCAN_API_HOST, "base.blockscout.com", "explorer.celo.org"}
+
+    monkeypatch.setattr(requests.Session, "request", lambda self, method, url, *args, **kwargs: url)
+    acquired = []
+    monkeypatch.setattr(session.host_limiters["base.blockscout.com"], "acquire", lambda: acquired.append(True))
+    session.get("https://base.blockscout.com/api?module=account&action=txlist")
+    session.get("https://explorer.celo.org/api?module=account&action=txlist")
+
+    assert acquired == [True]
+
+
+def test_analyzer_shares_http_session_with_clients() -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    assert analyzer.tx_fetcher.session is analyzer._session
+    assert analyzer.source_extractor.session is analyzer._session
+
+
+def test_raw_tx_lookup_goes_through_the_shared_session(monkeypatch) -> None:
+    from utils.screenshots import raw_tx
+
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: pytest.fail("bypassed the shared session"))
+    session = build_explorer_session()
+    acquired = []
+    monkeypatch.setattr(session.host_limiters[ETHERSCAN_API_HOST], "acquire", lambda: acquired.append(True))
+
+    class FakeResponse:
+        def raise_for_status(self) -> None:
+            pass
+
+        def json(self):
+            return {"result": {"hash": "0x01"}}
+
+    monkeypatch.setattr(requests.Session, "request", lambda self, method, url, *args, **kwargs: FakeResponse())
+    assert raw_tx._fetch_tx_fields("0x01", 1, "key", session) == {"hash": "0x01"}
+    assert acquired == [True]
@@ -0,0 +1,58 @@
+"""Tests for the selector-level agent tools."""
+
+from utils.auditing import AuditTask, agentic
+from utils.auditing.agentic import SelectorToolRunner
+
+DESCRIPTOR = {
+    "display": {
+        "formats": {
+            "transfer(address to,uint256 amount)": {"intent": "Send", "fields": []},
+        }
+    }
+}
+
+
+def _runner(tool_context: dict) -> SelectorToolRunner:
+    task = AuditTask(
+        selector="0xa9059cbb",
+        function_signature="transfer(address,uint256)",
+        decoded_transactions=[],
+        erc7730_format={},
+        source_code=None,
+        use_smart_referencing=True,
+        erc4626_context=None,
+        erc20_context=None,
+        descriptor_context=None,
+        abi_resolution=None,
+        source_resolution=None,
+        analysis_mode="single",
+        tool_context=tool_context,
+    )
+    return SelectorToolRunner(task)
+
+
+def test_other_selector_descriptor_reuses_expanded_formats(monkeypatch) -> None:
+    expansions = []
+    real_expand = agentic.expand_erc7730_format_with_refs
+
+    def counting_expand(selector_format, erc7730_data, format_key):
+        expansions.append(format_key)
+        return real_expand(selector_format, erc7730_data, format_key)
+
+    monkeypatch.setattr(agentic, "expand_erc7730_format_with_refs", counting_expand)
+    expanded_formats: dict = {}
+    runner = _runner(
+        {
+            "erc7730_data": DESCRIPTOR,
+            "selector_to_format_key": {"0xa9059cbb": "transfer(address to,uint256 amount)"},
+            "expanded_formats": expanded_formats,
+        }
+    )
+
+    first = runner._get_other_selector_descriptor({"selector": "0xA9059CBB"})
+    second = runner._get_other_selector_descriptor({"selector": "0xa9059cbb"})
+
+    assert expansions == ["transfer(address to,uint256 amount)"]
+    assert first["expanded_descriptor"] is second["expanded_descriptor"]
+    assert expanded_formats == {"transfer(address to,uint256 amount)": first["expanded_descriptor"]}
+    assert "error" in runner._get_other_selector_descriptor({"selector": "0xdeadbeef"})
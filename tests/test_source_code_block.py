@@ -0,0 +1,95 @@
+"""Tests for the source snippet log block emitted during audit preparation."""
+
+import logging
+
+import pytest
+
+from utils.core.pipeline import preparation
+from utils.core.pipeline.preparation import AnalyzerPipelinePreparationMixin, _build_source_code_block
+
+SEPARATOR = "=" * 60
+
+FUNCTION_SOURCE = {
+    "function": "function deposit(uint256 amount) external {}",
+    "function_docstring": "/// @notice Deposit funds",
+    "custom_types": ["type Price is uint256;"],
+    "using_statements": ["using SafeERC20 for IERC20;"],
+    "constants": ["uint256 constant MAX = 1;"],
+    "modifiers": ["modifier onlyOwner() { _; }"],
+    "structs": ["struct Order { uint256 id; }"],
+    "enums": ["enum Side { Buy, Sell }"],
+    "internal_functions": [
+        {"docstring": "/// @dev helper", "body": "function _pull() internal {}"},
+        {"body": "function _push() internal {}"},
+    ],
+    "parent_functions": [{"parent_contract": "Base", "function_name": "deposit", "body": "function deposit() {}"}],
+    "libraries": ["library Math {}"],
+}
+
+
+def test_build_source_code_block_renders_all_sections() -> None:
+    assert _build_source_code_block(FUNCTION_SOURCE) == (
+        f"\n{SEPARATOR}\nSOURCE CODE (being sent to AI):\n{SEPARATOR}\n\n"
+        "// Docstring:\n/// @notice Deposit funds\n\n"
+        "// Custom types:\ntype Price is uint256;\n\n"
+        "// Using statements:\nusing SafeERC20 for IERC20;\n\n"
+        "// Constants:\nuint256 constant MAX = 1;\n\n"
+        "// Modifiers used by main function:\nmodifier onlyOwner() { _; }\n\n"
+        "// Structs:\nstruct Order { uint256 id; }\n\n"
+        "// Enums:\nenum Side { Buy, Sell }\n\n"
+        "// Main function:\nfunction deposit(uint256 amount) external {}"
+        "\n\n// Internal functions called:\n"
+        "/// @dev helper\nfunction _pull() internal {}\n\n"
+        "function _push() internal {}\n\n"
+        "\n\n// Parent contract implementations (from super. calls):\n"
+        "// From Base.deposit():\nfunction deposit() {}\n\n"
+        "\n// Libraries:\nlibrary Math {}\n\n"
+        f"\n{SEPARATOR}\n"
+    )
+
+
+def test_build_source_code_block_skips_empty_sections() -> None:
+    block = _build_source_code_block({"function": "function f() {}", "structs": [], "enums": []})
+    assert block == (
+        f"\n{SEPARATOR}\nSOURCE CODE (being sent to AI):\n{SEPARATOR}\n\n"
+        f"// Main function:\nfunction f() {{}}\n{SEPARATOR}\n"
+    )
+
+
+def test_source_block_is_not_rendered_when_record_is_dropped(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls = []
+    monkeypatch.setattr(preparation, "_build_source_code_block", lambda fs: calls.append(fs) or "block")
+
+    with caplog.at_level(logging.INFO, logger=preparation.logger.name):
+        AnalyzerPipelinePreparationMixin()._log_function_source_block(FUNCTION_SOURCE)
+    assert calls == []
+
+    with caplog.at_level(logging.DEBUG, logger=preparation.logger.name):
+        AnalyzerPipelinePreparationMixin()._log_function_source_block(FUNCTION_SOURCE)
+    assert calls
+    assert all(fs is FUNCTION_SOURCE for fs in calls)
+    assert "block" in caplog.text
+
+
+def test_report_source_section_renders_all_sections() -> None:
+    from utils.reporting.reporter.formatting import format_source_code_section
+
+    section = format_source_code_section({**FUNCTION_SOURCE, "truncated": True})
+    assert section == (
+        "// Custom types:\ntype Price is uint256;\n\n"
+        "// Using statements:\nusing SafeERC20 for IERC20;\n\n"
+        "// Docstring:\n/// @notice Deposit funds\n\n"
+        "// Constants:\nuint256 constant MAX = 1;\n\n"
+        "// Modifiers:\nmodifier onlyOwner() { _; }\n\n"
+        "// Structs:\nstruct Order { uint256 id; }\n\n"
+        "// Enums:\nenum Side { Buy, Sell }\n\n"
+        "// Main function:\nfunction deposit(uint256 amount) external {}"
+        "\n\n// Internal functions called:\n/// @dev helper\nfunction _pull() internal {}\n\n"
+        "function _push() internal {}\n\n"
+        "\n\n// Parent contract implementations (from super. calls):\n// From Base.deposit():\nfunction deposit() {}\n\n"
+        "\n// Libraries:\nlibrary Math {}\n\n"
+        "\n// ⚠️ Note: Code was truncated to fit within line limit\n"
+    )
+    assert format_source_code_section({"function": ""}) == ""
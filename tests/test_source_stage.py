@@ -0,0 +1,103 @@
+"""Tests for the source extraction and sample preparation pipeline stages."""
+
+import time
+
+from utils.core import ERC7730Analyzer
+
+
+def _extracted(address: str, chain_id: int) -> dict:
+    return {
+        "source_code": "contract Plain {}",
+        "address": address,
+        "chain_id": chain_id,
+        "contract_name": "Plain",
+        "functions": [],
+        "structs": [],
+        "enums": [],
+        "is_proxy": False,
+        "implementation": None,
+        "is_diamond": False,
+        "facets": {},
+    }
+
+
+def test_extract_source_runs_chains_concurrently_and_keeps_order(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    calls = []
+
+    def fake_extract(address, chain_id, selectors=None, selector_sources=None):
+        calls.append((chain_id, address))
+        if chain_id == 10:
+            raise RuntimeError("explorer down")
+        # The first chain answers last; stored order must follow the deployments
+        time.sleep(0.05 if chain_id == 1 else 0)
+        return _extracted(address, chain_id)
+
+    monkeypatch.setattr(analyzer.source_extractor, "extract_contract_code", fake_extract)
+    deployments = [
+        {"chainId": 1, "address": "0xAA"},
+        {"chainId": 10, "address": "0xbb"},
+        {"chainId": 137, "address": "0xcc"},
+        {"chainId": 1, "address": "0xaa"},
+    ]
+    analyzer._extract_source_and_context(
+        {
+            "deployments": deployments,
+            "selectors": ["0xa9059cbb"],
+            "erc7730_data": {},
+            "deployment_targets": [(d["address"], d["chainId"]) for d in deployments],
+        }
+    )
+
+    assert sorted(calls) == [(1, "0xaa"), (10, "0xbb"), (137, "0xcc")]
+    assert list(analyzer.extracted_codes) == ["1_0xaa", "137_0xcc"]
+
+
+def test_source_extraction_started_early_is_reused(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    calls = []
+
+    def fake_extract(address, chain_id, selectors=None, selector_sources=None):
+        calls.append((chain_id, address))
+        return _extracted(address, chain_id)
+
+    monkeypatch.setattr(analyzer.source_extractor, "extract_contract_code", fake_extract)
+    deployments = [{"chainId": 1, "address": "0xAA"}, {"chainId": 10, "address": "0xbb"}]
+    context = {
+        "deployments": deployments,
+        "selectors": ["0xa9059cbb"],
+        "erc7730_data": {},
+        "deployment_targets": [(d["address"], d["chainId"]) for d in deployments],
+    }
+
+    analyzer._start_source_extraction(context)
+    assert [target for target, _future in context["source_extraction"]] == [(1, "0xaa"), (10, "0xbb")]
+    analyzer._extract_source_and_context(context)
+
+    assert sorted(calls) == [(1, "0xaa"), (10, "0xbb")]
+    assert list(analyzer.extracted_codes) == ["1_0xaa", "10_0xbb"]
+    assert "source_extraction" not in context
+
+
+def test_identical_sources_across_chains_are_scanned_once(monkeypatch) -> None:
+    analyzer = ERC7730Analyzer(etherscan_api_key="test")
+    monkeypatch.setattr(
+        analyzer.source_extractor,
+        "extract_contract_code",
+        lambda address, chain_id, selectors=None, selector_sources=None: _extracted(address, chain_id),
+    )
+    scans = []
+    real_detect = analyzer._detect_standards_from_source
+
+    def counting_detect(source_code, contract_name=None):
+        scans.append(contract_name)
+        return real_detect(source_code, contract_name=contract_name)
+
+    monkeypatch.setattr(analyzer, "_detect_standards_from_source", counting_detect)
+    deployments = [{"chainId": 1, "address": "0xaa"}, {"chainId": 10, "address": "0xaa"}]
+    analyzer._extract_source_and_context(
+        {"deployments": deployments, "selectors": ["0xa9059cbb"], "erc7730_data": {}, "deployment_targets": []}
+    )
+
+    assert list(analyzer.extracted_codes) == ["1_0xaa", "10_0xaa"]
+    assert scans == ["Plain"]
@@ -0,0 +1,169 @@
+"""Tests for the transaction collection pipeline stage."""
+
+import threading
+
+from utils.core import ERC7730Analyzer
+from utils.core.pipeline import transactions as transactions_stage
+
+SELECTOR = "0xa9059cbb"
+
+
+def _tx(chain_id: int, index: int) -> dict:
+    return {"hash": f"0x{chain_id:032x}{index:032x}", "input": SELECTOR + "00" * 64}
+
+
+def test_explorer_fallback_merges_in_priority_order_and_stops_when_satisfied(monkeypatch) -> None:
+    release_first = threading.Event()
+    fetched = []
+
+    class FakeFetcher:
+        def __init__(self, *args, **kwargs) -> None:
+            self._snowflake_transaction_row_cache = {}
+            self.api_type_per_chain = {}
+
+        def fetch_all_transactions_for_selectors(self, address, selectors, chain_id, **kwargs):
+            fetched.append(chain_id)
+            if chain_id == 1:
+                # Lower-priority chain 10 finishes first; its samples must still come second
+                release_first.wait(timeout=2)
+            else:
+                release_first.set()
+            # Records without a usable hash are dropped before they count towards the sample budget
+            return {SELECTOR: [{"hash": "", "input": SELECTOR}] + [_tx(chain_id, i) for i in range(3)]}
+
+    monkeypatch.setattr(transactions_stage, "TransactionFetcher", FakeFetcher)
+    analyzer = ERC7730Analyzer(etherscan_api_key="test", max_concurrent_api_calls=2)
+    monkeypatch.setattr(analyzer.tx_fetcher, "_snowflake_tx_history_enabled", lambda: False)
+
+    deployments = [{"chainId": 1, "address": "0x01"}, {"chainId": 10, "address": "0x0a"}]
+    context = {
+        "selectors": [SELECTOR],
+        "deployments": deployments,
+        "abi": [],
+        "selector_function_data": {SELECTOR: {"name": "transfer", "stateMutability": "nonpayable"}},
+    }
+    analyzer._collect_selector_transactions(context)
+
+    assert context["all_selector_txs"][SELECTOR] == [_tx(1, 0), _tx(1, 1), _tx(1, 2), _tx(10, 0), _tx(10, 1)]
+    assert context["deployment_per_selector"][SELECTOR] is deployments[0]
+    assert sorted(fetched) == [1, 10]
+
+
+def test_explorer_fallback_signals_in_flight_scans_once_satisfied(monkeypatch) -> None:
+    stopped = []
+    slow_scan_started = threading.Event()
+
+    class FakeFetcher:
+        def __init__(self, *args, stop_event=None, **kwargs) -> None:
+            self._snowflake_transaction_row_cache = {}
+            self.api_type_per_chain = {}
+            self.stop_event = stop_event
+
+        def fetch_all_transactions_for_selectors(self, address, selectors, chain_id, **kwargs):
+            if chain_id == 10:
+                # A slow, lower-priority scan that only ends when told its results are not needed
+                slow_scan_started.set()
+                stopped.append(self.stop_event.wait(timeout=2))
+                return {SELECTOR: []}
+            slow_scan_started.wait(timeout=2)
+            return {SELECTOR: [_tx(chain_id, i) for i in range(5)]}
+
+    monkeypatch.setattr(transactions_stage, "TransactionFetcher", FakeFetcher)
+    analyzer = ERC7730Analyzer(etherscan_api_key="test", max_concurrent_api_calls=2)
+    monkeypatch.setattr(analyzer.tx_fetcher, "_snowflake_tx_history_enabled", lambda: False)
+
+    context = {
+        "selectors": [SELECTOR],
+        "deployments": [{"chainId": 1, "address": "0x01"}, {"chainId": 10, "address": "0x0a"}],
+        "abi": [],
+        "selector_function_data": {SELECTOR: {"name": "transfer", "stateMutability": "nonpayable"}},
+    }
+    analyzer._collect_selector_transactions(context)
+
+    assert stopped == [True]
+    assert context["all_selector_txs"][SELECTOR] == [_tx(1, i) for i in range(5)]
+
+
+def test_decode_log_event_handles_token_and_other_events(monkeypatch) -> None:
+    from utils.clients.transactions import APPROVAL_EVENT_TOPIC, TRANSFER_EVENT_TOPIC
+    from utils.clients.transactions.fetcher import TransactionFetcher
+
+    fetcher = TransactionFetcher("test")
+    monkeypatch.setattr(fetcher, "format_token_amount", lambda value, token, chain_id: f"{value} @ {token}")
+    parties = ["0x" + "00" * 12 + "11" * 20, "0x" + "00" * 12 + "22" * 20]
+    log = {"address": "0xtoken", "data": "0x0a", "topics": [TRANSFER_EVENT_TOPIC, *parties]}
+
+    assert fetcher.decode_log_event(log) == {
+        "event": "Transfer",
+        "token": "0xtoken",
+        "from": "0x" + "11" * 20,
+        "to": "0x" + "22" * 20,
+        "value": "10",
+        "value_formatted": "10 @ 0xtoken",
+    }
+    approval = fetcher.decode_log_event({**log, "data": "0x", "topics": [APPROVAL_EVENT_TOPIC, *parties]})
+    assert (approval["owner"], approval["spender"], approval["value"]) == ("0x" + "11" * 20, "0x" + "22" * 20, "0")
+    # A Transfer without indexed parties (e.g. ERC-721 style variants) is reported as-is
+    assert fetcher.decode_log_event({**log, "topics": [TRANSFER_EVENT_TOPIC]})["event"] == "Unknown"
+    assert fetcher.decode_log_event({"topics": []}) is None
+
+
+def test_receipts_batch_posts_chunks_and_leaves_gaps_for_fallback(monkeypatch) -> None:
+    from utils.clients.transactions import TransactionFetcher
+
+    monkeypatch.setenv("RPC_URL_1", "http://node.local")
+    posted = []
+
+    class FakeResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def json(self):
+            return self._payload
+
+    def fake_post(url, json, timeout):
+        posted.append(len(json))
+        # The node does not know the first transaction of each chunk
+        return FakeResponse(
+            [{"jsonrpc": "2.0", "id": item["id"], "result": None} for item in json[:1]]
+            + [{"jsonrpc": "2.0", "id": item["id"], "result": {"hash": item["params"][0]}} for item in json[1:]]
+        )
+
+    fetcher = TransactionFetcher(etherscan_api_key="test")
+    monkeypatch.setattr(fetcher.session, "post", fake_post)
+    tx_hashes = [f"0x{index:064x}" for index in range(12)]
+    receipts = fetcher.fetch_transaction_receipts_batch(tx_hashes, 1)
+
+    assert fetcher.supports_receipt_batching(1) is True
+    assert posted == [10, 2]
+    assert sorted(receipts) == sorted(set(tx_hashes) - {tx_hashes[0], tx_hashes[10]})
+
+
+def test_decode_transaction_input_picks_overload_by_selector() -> None:
+    from eth_abi import encode
+
+    from utils.abi import ABI
+    from utils.clients.transactions import TransactionFetcher
+
+    abi = ABI(
+        [
+            {"type": "function", "name": "deposit", "inputs": [{"name": "amount", "type": "uint256"}]},
+            {
+                "type": "function",
+                "name": "deposit",
+                "inputs": [{"name": "amount", "type": "uint256"}, {"name": "to", "type": "address"}],
+            },
+        ]
+    )
+    function_data = abi.find_function_by_signature("deposit(uint256,address)")
+    to = "0x" + "11" * 20
+    calldata = function_data["selector"] + encode(["uint256", "address"], [5, to]).hex()
+
+    decoded = TransactionFetcher(etherscan_api_key="test").decode_transaction_input(calldata, function_data, abi)
+
+    assert decoded["amount"] == 5
+    assert decoded["to"].lower() == to
+    assert abi.find_function_abi_entry({**function_data, "signature": "deposit(uint256)"}) is None